@@ -0,0 +1,74 @@
+import io
+import sys
+import time
+import argparse
+import tracemalloc
+import contextlib
+from generator.parser import Parser
+from visitor.interpreter_visitor import InterpreterVisitor
+from visitor.resolver_visitor import ResolverVisitor
+
+# usage: python -m benchmark.back [--lines N] [--back N] [--intervals 0,100,1000,10000]
+# `back` after running a loop, latency by checkpoint interval against running again from the start,
+# memory is all that was allocated while running, the histories of the loop included
+
+SOURCE = '''int main(void)
+{
+  int i, total;
+  int record[64];
+  total = 0;
+  for (i = 0; i < 1000000; i++)
+  {
+    record[i % 64] = i;
+    total = total + record[i % 64] % 7;
+  }
+  printf("%d\\n", total);
+}
+'''
+
+def interpreter(ast, interval):
+  flowVisitor = InterpreterVisitor(checkpoint_interval=interval)
+  flowVisitor.start(ast)
+  flowVisitor.run()
+  return flowVisitor
+
+def timed(func):
+  start = time.perf_counter()
+  func()
+  return time.perf_counter() - start
+
+def state(flowVisitor):
+  scope = flowVisitor.get_scope()
+  return list(flowVisitor.linenos), [history and history.get() for history in scope.histories], [history and len(history.history) for history in scope.histories]
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Checkpoint benchmark')
+  parser.add_argument('--lines', type=int, default=100000, help='Lines run before going back')
+  parser.add_argument('--back', type=int, default=500)
+  parser.add_argument('--intervals', type=str, default='0,100,1000,10000')
+  args = parser.parse_args()
+
+  ast = Parser().parse(SOURCE)
+  ast.accept(ResolverVisitor())
+  target = args.lines - args.back
+  with contextlib.redirect_stdout(io.StringIO()):
+    expected = interpreter(ast, None)
+    expected.add_linenum(target)
+    restart = timed(expected.run)
+  print('{:>10}{:>14}{:>16}{:>12}'.format('interval', 'checkpoints', 'memory (KiB)', 'back (ms)'))
+  print('{:>10}{:>14}{:>16}{:>12.1f}'.format('restart', '-', '-', restart * 1000))
+  failed = False
+  for interval in map(int, args.intervals.split(',')):
+    with contextlib.redirect_stdout(io.StringIO()):
+      flowVisitor = interpreter(ast, interval)
+      tracemalloc.start()
+      flowVisitor.add_linenum(args.lines)
+      flowVisitor.run()
+      memory = tracemalloc.get_traced_memory()[0]
+      tracemalloc.stop()
+      back = timed(lambda: flowVisitor.back(args.back))
+    print('{:>10}{:>14}{:>16.1f}{:>12.1f}'.format(interval, len(flowVisitor.checkpoints), memory / 1024, back * 1000))
+    if state(flowVisitor) != state(expected):
+      print('state after back differs from running to the same line')
+      failed = True
+  sys.exit(1 if failed else 0)
@@ -0,0 +1,94 @@
+import io
+import sys
+import time
+import argparse
+import contextlib
+from generator.parser import Parser
+from visitor.interpreter_visitor import InterpreterVisitor
+from visitor.resolver_visitor import ResolverVisitor
+from model.breakpoint import LineIndex, parse_condition
+from model.symbol_table import watches
+
+# usage: python -m benchmark.breakpoint [--iterations N]
+# `continue` through a loop to a breakpoint on its last pass, against `next` over the same lines
+# and against a run with no breakpoint at all, then with a breakpoint on a line never reached,
+# then watching the loop counter up to its last value and a variable never written
+
+SOURCE = '''int never(void)
+{
+  return 0;
+}
+
+int main(void)
+{
+  int i, total, spare;
+  total = 0;
+  for (i = 0; i < %d; i++)
+  {
+    total = total + i %% 7;
+  }
+  printf("%%d\\n", total);
+}
+'''
+
+def interpreter(ast):
+  flowVisitor = InterpreterVisitor(checkpoint_interval=None)
+  flowVisitor.start(ast)
+  flowVisitor.run()
+  return flowVisitor
+
+def timed(func):
+  start = time.perf_counter()
+  func()
+  return time.perf_counter() - start
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Breakpoint benchmark')
+  parser.add_argument('--iterations', type=int, default=100000)
+  args = parser.parse_args()
+
+  conditionParser = Parser()
+  ast = conditionParser.parse(SOURCE % args.iterations)
+  ast.accept(ResolverVisitor())
+  lineIndex = LineIndex(ast)
+  condition = parse_condition(conditionParser, 'i == {}'.format(args.iterations - 1))
+  results = []
+  with contextlib.redirect_stdout(io.StringIO()):
+    flowVisitor = interpreter(ast)
+    flowVisitor.set_breakpoint(lineIndex.resolve(12), condition)
+    results.append(('continue to line 12 if i == last', timed(flowVisitor.resume)))
+    lines = flowVisitor.line_count
+    expected = list(flowVisitor.linenos), flowVisitor.get_scope().lookup('i').get()
+
+    flowVisitor = interpreter(ast)
+    flowVisitor.add_linenum(lines)
+    results.append(('next {}'.format(lines), timed(flowVisitor.run)))
+    reached = list(flowVisitor.linenos), flowVisitor.get_scope().lookup('i').get()
+
+    flowVisitor = interpreter(ast)
+    results.append(('continue to the end', timed(flowVisitor.resume)))
+
+    flowVisitor = interpreter(ast)
+    flowVisitor.set_breakpoint(lineIndex.function_lineno('never'))
+    results.append(('continue, breakpoint never hit', timed(flowVisitor.resume)))
+
+    flowVisitor = interpreter(ast)
+    flowVisitor.set_watchpoint('i', parse_condition(conditionParser, 'i == {}'.format(args.iterations - 1)))
+    results.append(('continue, watch i if i == last', timed(flowVisitor.resume)))
+    watched = flowVisitor.get_scope().lookup('i').get()
+    watches.clear()
+
+    flowVisitor = interpreter(ast)
+    flowVisitor.set_watchpoint('spare')
+    results.append(('continue, watch never hit', timed(flowVisitor.resume)))
+    watches.clear()
+  print('{:>34}{:>12}'.format('', 'time (ms)'))
+  for name, seconds in results:
+    print('{:>34}{:>12.1f}'.format(name, seconds * 1000))
+  if reached != expected:
+    print('next stopped elsewhere than the breakpoint')
+    sys.exit(1)
+  if watched != args.iterations - 1:
+    print('the watchpoint stopped on i = {}'.format(watched))
+    sys.exit(1)
+  sys.exit(0)
@@ -0,0 +1,49 @@
+import sys
+import timeit
+import argparse
+from generator.parser import Parser
+from util.helper import getVisitorFunc, dispatchTables
+from visitor.interpreter_visitor import InterpreterVisitor
+from visitor.constant_folding_visitor import ConstantFoldingVisitor
+from visitor.write_visitor import WriteVisitor
+from visitor.print_visitor import PrintVisitor
+
+# usage: python -m benchmark.dispatch [--number N] Input_File
+
+def collect(node, nodes):
+  nodes.append(node)
+  for prop in ('childs', 'type', 'declarator', 'parameterGroup', 'body', 'init_stmt', 'expr', 'term_stmt',
+      'section', 'then_section', 'else_section', 'left', 'right', 'arguments', 'index'):
+    child = getattr(node, prop, None)
+    if isinstance(child, list):
+      for item in child:
+        collect(item, nodes)
+    elif child is not None and not isinstance(child, type):
+      collect(child, nodes)
+  return nodes
+
+def lookup_walk(visitor, nodes):
+  for node in nodes:
+    getVisitorFunc(visitor, node.__class__)
+
+def lookup_table(visitor, nodes):
+  table = dispatchTables[visitor.__class__]
+  for node in nodes:
+    table[node.__class__]
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Visitor dispatch benchmark')
+  parser.add_argument('input', type=str, metavar='Input_File', help='Input .c file path')
+  parser.add_argument('--number', type=int, default=2000)
+  args = parser.parse_args()
+
+  nodes = collect(Parser().run(args.input), [])
+  visitors = [InterpreterVisitor(), ConstantFoldingVisitor(), WriteVisitor(), PrintVisitor()]
+  print('{} nodes x {} rounds'.format(len(nodes), args.number))
+  print('{:<24}{:>14}{:>14}{:>10}'.format('visitor', 'walk (ns)', 'table (ns)', 'speedup'))
+  for visitor in visitors:
+    walk = timeit.timeit(lambda: lookup_walk(visitor, nodes), number=args.number)
+    table = timeit.timeit(lambda: lookup_table(visitor, nodes), number=args.number)
+    per_lookup = 1e9 / (len(nodes) * args.number)
+    print('{:<24}{:>14.1f}{:>14.1f}{:>9.1f}x'.format(visitor.__class__.__name__, walk * per_lookup, table * per_lookup, walk / table))
+  sys.exit(0)
@@ -0,0 +1,60 @@
+import gc
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+from generator.parser import Parser
+from model.flat_ast import FlatAst
+from visitor.write_visitor import WriteVisitor
+from visitor.flat_write_visitor import FlatWriteVisitor
+from benchmark.memory import synthesize
+
+# usage: python -m benchmark.flat [--lines N]
+# object AST vs FlatAst on a synthetic program: retained memory, conversion and WriteVisitor emission
+
+def measure(parser, path, flat):
+  gc.collect()
+  tracemalloc.start()
+  ast = parser.run(path, flat=flat)
+  # nodes point back at their parent, the tree only goes away on a collection
+  gc.collect()
+  retained = tracemalloc.get_traced_memory()[0]
+  tracemalloc.stop()
+  return ast, retained
+
+def timed(func):
+  start = time.perf_counter()
+  result = func()
+  return result, time.perf_counter() - start
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Flat AST benchmark')
+  parser.add_argument('--lines', type=int, default=50000)
+  args = parser.parse_args()
+
+  source = synthesize(args.lines)
+  fd, path = tempfile.mkstemp(suffix='.c')
+  with os.fdopen(fd, 'w') as f:
+    f.write(source)
+  try:
+    parser = Parser()
+    tree, tree_retained = measure(parser, path, False)
+    flat, flat_retained = measure(parser, path, True)
+  finally:
+    os.remove(path)
+
+  print('{} lines, {} rows'.format(source.count('\n'), len(flat)))
+  print('{:<24}{:>14}{:>16}'.format('', 'object AST', 'FlatAst'))
+  print('{:<24}{:>14.1f}{:>16.1f}'.format('retained (KiB)', tree_retained / 1024, flat_retained / 1024))
+  _, from_tree = timed(lambda: FlatAst.from_tree(tree))
+  _, to_tree = timed(flat.to_tree)
+  print('{:<24}{:>14.3f}{:>16.3f}'.format('convert (s)', to_tree, from_tree))
+  tree_s, tree_write = timed(lambda: tree.accept(WriteVisitor()))
+  flat_s, flat_write = timed(lambda: FlatWriteVisitor().write(flat))
+  print('{:<24}{:>14.3f}{:>16.3f}'.format('write (s)', tree_write, flat_write))
+  if tree_s != flat_s:
+    print('WriteVisitor and FlatWriteVisitor outputs differ')
+    sys.exit(1)
+  sys.exit(0)
@@ -0,0 +1,53 @@
+import sys
+import time
+import argparse
+from generator.parser import Parser
+from generator.incremental import IncrementalParser, Edit
+from model.flat_ast import FlatAst
+from benchmark.memory import synthesize
+
+# usage: python -m benchmark.incremental [--lines N] [--parser {lalr,rd}]
+# edits one statement in the middle of a synthetic program, full parse vs IncrementalParser.reparse
+
+COLUMNS = ('kind', 'op', 'first_child', 'next_sibling', 'line_start', 'line_end', 'const_value_index', 'flags', 'strings', 'values')
+
+def edits(text):
+  lines = text.split('\n')
+  middle = len(lines) // 2
+  line = next(i for i in range(middle, len(lines)) if lines[i].strip() == 'c = c - 1;') + 1
+  column = lines[line - 1].index('1')
+  # same line count, one more line, then a new function at the top level
+  yield 'replace a constant', Edit((line, column), (line, column + 1), '2')
+  yield 'insert a statement', Edit((line, 0), (line, 0), '    c = c + 2;\n')
+  yield 'insert a function', Edit((line + 4, 0), (line + 4, 0), 'int g(int a) {\n  return a;\n}\n')
+
+def same(a, b):
+  a, b = FlatAst.from_tree(a), FlatAst.from_tree(b)
+  return all(getattr(a, column) == getattr(b, column) for column in COLUMNS)
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Incremental reparse benchmark')
+  parser.add_argument('--lines', type=int, default=10000)
+  parser.add_argument('--parser', choices=['lalr', 'rd'], default='lalr')
+  args = parser.parse_args()
+
+  parser = Parser(engine=args.parser)
+  incrementalParser = IncrementalParser(parser)
+  text = synthesize(args.lines)
+  root = parser.parse(text)
+  print('{} lines'.format(text.count('\n')))
+  print('{:<24}{:>12}{:>16}{:>10}'.format('edit', 'full (ms)', 'reparse (ms)', 'speedup'))
+  failed = False
+  for name, edit in list(edits(text)):
+    start = time.perf_counter()
+    root, new_text = incrementalParser.reparse(root, text, edit)
+    reparse = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = parser.parse(new_text)
+    full = time.perf_counter() - start
+    print('{:<24}{:>12.1f}{:>16.1f}{:>9.1f}x'.format(name, full * 1000, reparse * 1000, full / reparse))
+    if not same(root, expected):
+      print('reparsed tree differs from the full parse')
+      failed = True
+    text = new_text
+  sys.exit(1 if failed else 0)
@@ -0,0 +1,41 @@
+import sys
+import timeit
+import argparse
+from generator.lexer import Lexer
+from generator.scanner import Scanner
+
+# usage: python -m benchmark.lexer [--repeat N] [--rounds N] Input_File
+# the input is repeated N times so lexing dominates, both token streams must be identical
+
+def tokens(lexer, data):
+  lexer.input(data)
+  lexer.lineno = 1
+  result = []
+  token = lexer.token()
+  while token is not None:
+    result.append((token.type, token.value, token.lineno, token.lexpos))
+    token = lexer.token()
+  return result
+
+def measure(lexer, data, repeat):
+  return min(timeit.repeat(lambda: tokens(lexer, data), number=1, repeat=repeat)), tokens(lexer, data)
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Lexer benchmark')
+  parser.add_argument('input', type=str, metavar='Input_File', help='Input .c file path')
+  parser.add_argument('--repeat', type=int, default=1000)
+  parser.add_argument('--rounds', type=int, default=5)
+  args = parser.parse_args()
+
+  with open(args.input, 'r') as f:
+    data = f.read() * args.repeat
+  ply_time, ply_tokens = measure(Lexer().lexer, data, args.rounds)
+  scanner_time, scanner_tokens = measure(Scanner(), data, args.rounds)
+  if ply_tokens != scanner_tokens:
+    print('token streams differ')
+    sys.exit(1)
+  print('{} lines, {} tokens'.format(data.count('\n'), len(ply_tokens)))
+  print('{:<12}{:>12}'.format('lexer', 'time (ms)'))
+  print('{:<12}{:>12.1f}'.format('ply', ply_time * 1e3))
+  print('{:<12}{:>12.1f}'.format('scanner', scanner_time * 1e3))
+  sys.exit(0)
@@ -0,0 +1,79 @@
+import io
+import sys
+import time
+import argparse
+import contextlib
+from generator.parser import Parser
+from visitor.interpreter_visitor import InterpreterVisitor, MEMO_SIZE
+from visitor.resolver_visitor import ResolverVisitor
+
+# usage: python -m benchmark.memo [--fibo N] [--binomial N] [--sizes 0,16,65536]
+# batch run of recursive programs by the results kept per pure function, 0 turns memoization off,
+# fails if the output differs from the run without it
+
+FIBO = '''int fibo(int n)
+{
+  if (n <= 2)
+  {
+    return 1;
+  }
+  return fibo(n - 1) + fibo(n - 2);
+}
+
+int main(void)
+{
+  printf("%%d\\n", fibo(%d));
+}
+'''
+
+BINOMIAL = '''int binomial(int n, int k)
+{
+  if (k == 0)
+  {
+    return 1;
+  }
+  if (k == n)
+  {
+    return 1;
+  }
+  return binomial(n - 1, k - 1) + binomial(n - 1, k);
+}
+
+int main(void)
+{
+  printf("%%d\\n", binomial(%d, %d));
+}
+'''
+
+def run(ast, size):
+  flowVisitor = InterpreterVisitor(batch=True, memo_size=size)
+  flowVisitor.start(ast)
+  output = io.StringIO()
+  start = time.perf_counter()
+  with contextlib.redirect_stdout(output):
+    flowVisitor.run()
+  return time.perf_counter() - start, flowVisitor, output.getvalue()
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Memoization benchmark')
+  parser.add_argument('--fibo', type=int, default=22)
+  parser.add_argument('--binomial', type=int, default=18)
+  parser.add_argument('--sizes', type=str, default='0,16,{}'.format(MEMO_SIZE))
+  args = parser.parse_args()
+
+  programs = [('fibo({})'.format(args.fibo), FIBO % args.fibo), ('binomial({0}, {1})'.format(args.binomial, args.binomial // 2), BINOMIAL % (args.binomial, args.binomial // 2))]
+  print('{:>20}{:>10}{:>12}{:>12}{:>12}'.format('program', 'size', 'time (ms)', 'hits', 'misses'))
+  failed = False
+  for name, source in programs:
+    ast = Parser().parse(source)
+    ast.accept(ResolverVisitor())
+    expected = None
+    for size in map(int, args.sizes.split(',')):
+      seconds, flowVisitor, output = run(ast, size)
+      print('{:>20}{:>10}{:>12.1f}{:>12}{:>12}'.format(name, size, seconds * 1000, flowVisitor.memo_hits, flowVisitor.memo_misses))
+      if expected is None:
+        expected = output
+      elif output != expected:
+        print('output differs from the first run')
+        failed = True
+  sys.exit(1 if failed else 0)
@@ -0,0 +1,59 @@
+import os
+import sys
+import argparse
+import tempfile
+import tracemalloc
+from generator.parser import Parser
+from benchmark.dispatch import collect
+
+# usage: python -m benchmark.memory [--lines N] [--parser {lalr,rd}]
+# parses a synthetic program of about N lines and reports what the resulting AST keeps alive
+
+FUNCTION = '''int f{0}(int a, float b) {{
+  int c, d[4];
+  c = a * {0} + b / 2;
+  if (c > 3 && c != {0}) {{
+    c = c - 1;
+  }}
+  for (d[0] = 0; d[0] < c; d[0]++) {{
+    c = f{0}(c - 1, b) % 7;
+  }}
+  return c;
+}}
+'''
+MAIN = '''int main() {
+  printf("%d\\n", f0(3, 1.5));
+  return 0;
+}
+'''
+
+def synthesize(lines):
+  count = max(1, lines // FUNCTION.count('\n'))
+  return ''.join(FUNCTION.format(i) for i in range(count)) + MAIN
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='AST memory benchmark')
+  parser.add_argument('--lines', type=int, default=50000)
+  parser.add_argument('--parser', choices=['lalr', 'rd'], default='lalr')
+  args = parser.parse_args()
+
+  source = synthesize(args.lines)
+  fd, path = tempfile.mkstemp(suffix='.c')
+  with os.fdopen(fd, 'w') as f:
+    f.write(source)
+  try:
+    parser = Parser(engine=args.parser)
+    tracemalloc.start()
+    ast = parser.run(path)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+  finally:
+    os.remove(path)
+
+  # declarators share their TypeNode, so count each object once
+  nodes = len({id(node) for node in collect(ast, [])})
+  print('{} lines, {} bytes of source, {} nodes'.format(source.count('\n'), len(source), nodes))
+  print('{:<16}{:>14}{:>16}'.format('', 'total (KiB)', 'bytes / node'))
+  print('{:<16}{:>14.1f}{:>16.1f}'.format('retained', retained / 1024, retained / nodes))
+  print('{:<16}{:>14.1f}{:>16.1f}'.format('peak', peak / 1024, peak / nodes))
+  sys.exit(0)
@@ -0,0 +1,30 @@
+import sys
+import timeit
+import argparse
+from generator.parser import Parser
+
+# usage: python -m benchmark.parser [--rounds N] Input_File [Input_File ...]
+# parse time of both engines, that they build the same trees is checked by python -m generator.differential
+
+ENGINES = ('lalr', 'rd')
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Parser engine benchmark')
+  parser.add_argument('input', type=str, nargs='+', metavar='Input_File', help='Input .c file path')
+  parser.add_argument('--rounds', type=int, default=5)
+  args = parser.parse_args()
+
+  parsers = {engine: Parser(engine=engine) for engine in ENGINES}
+  print('{:<40}{:>12}{:>12}'.format('input', 'lalr (ms)', 'rd (ms)'))
+  for source in args.input:
+    times = []
+    for engine in ENGINES:
+      try:
+        times.append(min(timeit.repeat(lambda: parsers[engine].run(source), number=1, repeat=args.rounds)))
+      except Exception:
+        times.append(None)
+    if None in times:
+      print('{:<40}{:>24}'.format(source, 'fails to parse'))
+      continue
+    print('{:<40}{:>12.2f}{:>12.2f}'.format(source, times[0] * 1e3, times[1] * 1e3))
+  sys.exit(0)
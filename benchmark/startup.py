@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from generator.tables import TABLE_MODULES
+
+# usage: python -m benchmark.startup [--number N] Input_File
+# `packaged` loads the shipped PLY tables, `rebuilt` removes them before every run so lex/yacc build them at startup
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCES = ('interpreter.py', 'engine', 'generator', 'model', 'util', 'visitor')
+
+def command(root, source):
+  return [sys.executable, os.path.join(root, 'interpreter.py'), '--run', '--no-cache', source]
+
+def measure(root, source, number, rebuild):
+  times = []
+  for _ in range(number):
+    if rebuild:
+      for name in TABLE_MODULES:
+        path = os.path.join(root, 'generator', name + '.py')
+        if os.path.exists(path):
+          os.remove(path)
+    start = time.perf_counter()
+    subprocess.run(command(root, source), stdout=subprocess.DEVNULL, check=True)
+    times.append(time.perf_counter() - start)
+  return times
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Interpreter startup benchmark')
+  parser.add_argument('input', type=str, metavar='Input_File', help='Input .c file path')
+  parser.add_argument('--number', type=int, default=10)
+  args = parser.parse_args()
+
+  source = os.path.abspath(args.input)
+  with tempfile.TemporaryDirectory() as root:
+    for name in SOURCES:
+      path = os.path.join(ROOT_DIR, name)
+      if os.path.isdir(path):
+        shutil.copytree(path, os.path.join(root, name), ignore=shutil.ignore_patterns('__pycache__'))
+      else:
+        shutil.copy(path, root)
+    results = [
+      ('rebuilt', measure(root, source, args.number, True)),
+      ('packaged', measure(root, source, args.number, False)),
+    ]
+
+  print('python interpreter.py --run {} x {}'.format(args.input, args.number))
+  print('{:<12}{:>12}{:>12}'.format('tables', 'mean (ms)', 'min (ms)'))
+  for name, times in results:
+    print('{:<12}{:>12.1f}{:>12.1f}'.format(name, sum(times) / len(times) * 1e3, min(times) * 1e3))
+  sys.exit(0)
@@ -0,0 +1,79 @@
+import io
+import sys
+import time
+import argparse
+import contextlib
+from generator.parser import Parser
+from visitor.interpreter_visitor import InterpreterVisitor
+from visitor.resolver_visitor import ResolverVisitor
+from visitor.bytecode_visitor import BytecodeVisitor
+from visitor.closure_visitor import ClosureVisitor
+from engine.vm import VirtualMachine
+from engine.closure import ClosureEngine
+
+# usage: python -m benchmark.step [--depth N] [--buckets N] [--engine {tree,vm,closure}]
+# `next` one line at a time through a recursion, mean time of a step by how many scopes are open
+
+SOURCE = '''int r(int n)
+{
+  int a;
+  a = n;
+  if (n > 0)
+  {
+    a = a + r(n - 1);
+  }
+  return a;
+}
+
+int main(void)
+{
+  int result;
+  result = r(%d);
+  printf("%%d\\n", result);
+}
+'''
+
+def engine(name, ast):
+  if name == 'vm':
+    return VirtualMachine(ast.accept(BytecodeVisitor()))
+  if name == 'closure':
+    flowVisitor = ClosureEngine()
+    flowVisitor.load(ast.accept(ClosureVisitor(flowVisitor)))
+    return flowVisitor
+  ast.accept(ResolverVisitor())
+  flowVisitor = InterpreterVisitor()
+  flowVisitor.start(ast)
+  return flowVisitor
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Step benchmark')
+  parser.add_argument('--depth', type=int, default=1000)
+  parser.add_argument('--buckets', type=int, default=10)
+  parser.add_argument('--engine', choices=['tree', 'vm', 'closure'], default='tree')
+  args = parser.parse_args()
+
+  sys.setrecursionlimit(2**16)
+  data = SOURCE % args.depth
+  flowVisitor = engine(args.engine, Parser().parse(data))
+  steps = []
+  output = io.StringIO()
+  with contextlib.redirect_stdout(output):
+    flowVisitor.run()
+    while 'End of program' not in output.getvalue():
+      depth = len(flowVisitor.linenos)
+      flowVisitor.add_linenum(1)
+      start = time.perf_counter()
+      flowVisitor.run()
+      steps.append((depth, time.perf_counter() - start))
+  if str(sum(range(args.depth + 1))) not in output.getvalue():
+    print('wrong result')
+    sys.exit(1)
+
+  size = max(depth for depth, step in steps) // args.buckets + 1
+  print('{} steps'.format(len(steps)))
+  print('{:>16}{:>10}{:>14}'.format('scope depth', 'steps', 'us / step'))
+  for bucket in range(args.buckets):
+    times = [step for depth, step in steps if depth // size == bucket]
+    if times:
+      print('{:>16}{:>10}{:>14.1f}'.format('{}-{}'.format(bucket * size, (bucket + 1) * size - 1), len(times), sum(times) * 1e6 / len(times)))
+  sys.exit(0)
@@ -0,0 +1,55 @@
+import io
+import os
+import sys
+import time
+import argparse
+import tempfile
+from generator.parser import Parser
+from visitor.write_visitor import WriteVisitor
+
+# usage: python -m benchmark.write [--depths 10,20,40,80,160] [--width N]
+# WriteVisitor on programs nesting if, for and while sections to each depth, into a string and streamed
+
+def nest(depth, width):
+  lines = ['int main(void) {', '  int a, b;', '  a = 0;']
+  for level in range(depth):
+    indent = '  ' * (level + 1)
+    lines += ['{}a = a + {};'.format(indent, level)] * width
+    lines.append(indent + ('if (a < {}) {{', 'for (b = 0; b < {}; b++) {{', 'while (a > {}) {{')[level % 3].format(level))
+  # the parser fails on an empty section, so the innermost one gets statements too
+  lines += ['{}a = a + {};'.format('  ' * (depth + 1), depth)] * width
+  for level in reversed(range(depth)):
+    lines.append('  ' * (level + 1) + '}')
+  lines += ['  return 0;', '}', '']
+  return '\n'.join(lines)
+
+def timed(func):
+  start = time.perf_counter()
+  result = func()
+  return result, time.perf_counter() - start
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='WriteVisitor benchmark')
+  parser.add_argument('--depths', type=str, default='10,20,40,80,160')
+  parser.add_argument('--width', type=int, default=3, help='Statements per nesting level')
+  args = parser.parse_args()
+
+  sys.setrecursionlimit(2**16)
+  parser = Parser()
+  print('{:>8}{:>12}{:>14}{:>16}{:>14}'.format('depth', 'chars', 'string (ms)', 'streamed (ms)', 'ns / char'))
+  for depth in map(int, args.depths.split(',')):
+    fd, path = tempfile.mkstemp(suffix='.c')
+    with os.fdopen(fd, 'w') as f:
+      f.write(nest(depth, args.width))
+    try:
+      ast = parser.run(path)
+    finally:
+      os.remove(path)
+    s, string_time = timed(lambda: ast.accept(WriteVisitor()))
+    stream = io.StringIO()
+    _, stream_time = timed(lambda: ast.accept(WriteVisitor(stream=stream)))
+    if stream.getvalue() != s:
+      print('string and streamed outputs differ')
+      sys.exit(1)
+    print('{:>8}{:>12}{:>14.2f}{:>16.2f}{:>14.1f}'.format(depth, len(s), string_time * 1000, stream_time * 1000, string_time * 1e9 / len(s)))
+  sys.exit(0)
@@ -0,0 +1,141 @@
+import sys
+import threading
+import traceback
+from model.symbol_table import History
+from util.function import globalFunctionTable
+from visitor.closure_visitor import ClosureError
+
+# closures recurse on the python stack, so they run on a worker thread
+# with a large stack that blocks whenever the line budget runs out
+THREAD_STACK_SIZE = 2**26
+
+class ClosureEngine:
+  def __init__(self, debug=False):
+    self.debug = debug
+    self.main = None
+    self.global_frame = []
+    self.frames = []
+    self.linenos = [1]
+    self.line_num = 0
+    self.thread = None
+    self.paused = threading.Event()
+    self.resumed = threading.Event()
+    self.finished = False
+    self.runtime_error = False
+
+  def load(self, main):
+    self.main = main
+    self.frames = [(main, self.global_frame)]
+
+  def lookup(self, symbol):
+    for closure, frame in (self.frames[-1], self.frames[0]):
+      names = closure.names
+      for slot in range(len(names) - 1, -1, -1):
+        if names[slot] == symbol and frame[-1 - slot] is not None:
+          return frame[-1 - slot]
+    return None
+
+  def print(self, symbol):
+    history = self.lookup(symbol)
+    if history is not None:
+      target = history.get()
+    elif globalFunctionTable.has(symbol):
+      target = globalFunctionTable.get(symbol)
+    else:
+      print('Invisible variable')
+      return
+    print('N/A' if target is None else target)
+
+  def trace(self, symbol):
+    history = self.lookup(symbol)
+    if history is not None:
+      history.trace()
+    elif globalFunctionTable.has(symbol):
+      globalFunctionTable.trace(symbol)
+    else:
+      print('Invisible variable')
+
+  def add_linenum(self, line_num):
+    self.line_num += line_num
+
+  def new_history(self, symbol):
+    return History(symbol)
+
+  def run(self):
+    if self.finished:
+      if not self.runtime_error:
+        print('End of program')
+      return
+    if self.thread is None:
+      threading.stack_size(THREAD_STACK_SIZE)
+      self.thread = threading.Thread(target=self.execute, daemon=True)
+      self.thread.start()
+    else:
+      self.resumed.set()
+    self.paused.wait()
+    self.paused.clear()
+
+  def execute(self):
+    try:
+      self.main.body(self.global_frame)
+      print('End of program')
+    except ClosureError as e:
+      if self.debug:
+        exc_info = sys.exc_info()
+        traceback.print_exception(*exc_info)
+        del exc_info
+      print('Run-time error : line %d' % e.lineno)
+      self.runtime_error = True
+    self.finished = True
+    self.paused.set()
+
+  def pause(self):
+    self.paused.set()
+    self.resumed.wait()
+    self.resumed.clear()
+
+  def line(self, lineno):
+    linenos = self.linenos
+    while lineno > linenos[-1] + self.line_num - 1:
+      linenos[-1] += self.line_num
+      self.line_num = 0
+      self.pause()
+    self.line_num -= lineno - linenos[-1] + 1
+    linenos[-1] = lineno + 1
+
+  def line_compound(self, lineno):
+    linenos = self.linenos
+    while lineno > linenos[-1] + self.line_num - 1:
+      linenos[-1] += self.line_num
+      self.line_num = 0
+      self.pause()
+    self.line_num -= lineno - linenos[-1] + 1
+    linenos[-1] = lineno
+
+  def line_to(self, lineno):
+    linenos = self.linenos
+    while lineno > linenos[-1] + self.line_num - 1:
+      linenos[-1] += self.line_num
+      self.line_num = 0
+      self.pause()
+    self.line_num -= lineno - linenos[-1]
+    linenos[-1] = lineno
+
+  def call(self, closure, arguments):
+    parameters = closure.parameters
+    if len(arguments) < len(parameters):
+      raise IndexError
+    frame = [None] * (2 * closure.get_nlocals())
+    for i, (slot, lineno) in enumerate(parameters):
+      history = self.new_history(closure.names[slot])
+      history.add(lineno, arguments[i], None)
+      frame[slot] = arguments[i]
+      frame[-1 - slot] = history
+    linenos = self.linenos
+    depth = len(linenos)
+    linenos.append(closure.lineno)
+    self.frames.append((closure, frame))
+    signal = closure.body(frame)
+    self.frames.pop()
+    del linenos[depth:]
+    return None if signal is None else signal[1]
@@ -0,0 +1,132 @@
+import os
+import re
+import sys
+import hashlib
+import traceback
+from generator.cache import parse
+from util.stats import globalStats
+from visitor.python_visitor import PythonVisitor
+from util.function import globalFunctionTable
+
+# bump whenever PythonVisitor output changes, so stale cache entries miss
+TRANSPILER_VERSION = 2
+CACHE_DIR = '__pycache__'
+LINENO_REGEX = re.compile('#\s(\d+)$')
+
+class RootReturn(Exception):
+  pass
+
+def fail():
+  raise ValueError
+
+def undefined(name):
+  raise NameError(name)
+
+def invalid_cast(value):
+  raise ValueError
+
+def store(value, array, index):
+  array[index] = value
+  return array
+
+def runtime():
+  namespace = {
+    '__builtins__': __builtins__,
+    '_RootReturn': RootReturn,
+    '_and': lambda left, right: left and right,
+    '_or': lambda left, right: left or right,
+    '_store': store,
+    '_fail': fail,
+    '_undefined': undefined,
+    '_invalid_cast': invalid_cast,
+  }
+  for name in globalFunctionTable.table:
+    namespace['_builtin_' + name] = globalFunctionTable.get(name).run
+  return namespace
+
+class PythonEngine:
+  def __init__(self, source, debug=False, cache=True, lexer='scanner', engine='lalr'):
+    self.source = source
+    self.debug = debug
+    # without cache the input is parsed and transpiled again, neither cache is read or written
+    self.cache = cache
+    self.lexer = lexer
+    self.engine = engine
+    self.code = None
+    self.filename = None
+    self.lines = []
+    self.runtime_error = False
+
+  def cache_path(self, digest):
+    directory, name = os.path.split(os.path.abspath(self.source))
+    return os.path.join(directory, CACHE_DIR, '{}.{}.py'.format(name, digest[:16]))
+
+  def transpile(self):
+    globalStats.start_memory()
+    ast = parse(self.source, debug=self.debug, cache=self.cache, lexer=self.lexer, engine=self.engine)
+    globalStats.stop_memory('Parse peak memory')
+    return ast.accept(PythonVisitor())
+
+  def load(self):
+    with open(self.source, 'rb') as f:
+      data = f.read()
+    digest = hashlib.sha1(data + str(TRANSPILER_VERSION).encode()).hexdigest()
+    path = self.cache_path(digest)
+    if self.cache and os.path.exists(path):
+      with open(path, 'r') as f:
+        python_source = f.read()
+    else:
+      python_source = self.transpile()
+      if self.cache:
+        self.save(path, python_source)
+    if self.debug:
+      print(python_source)
+    self.filename = path
+    self.lines = python_source.splitlines()
+    self.code = compile(python_source, path, 'exec')
+
+  def save(self, path, python_source):
+    directory, name = os.path.split(path)
+    prefix = name[:name.rindex('.', 0, -3) + 1]
+    try:
+      os.makedirs(directory, exist_ok=True)
+      for entry in os.listdir(directory):
+        if entry.startswith(prefix) and entry.endswith('.py'):
+          os.remove(os.path.join(directory, entry))
+      with open(path, 'w') as f:
+        f.write(python_source)
+    except OSError:
+      pass
+
+  def error_lineno(self, tb):
+    lineno = 0
+    for frame, python_lineno in traceback.walk_tb(tb):
+      if frame.f_code.co_filename != self.filename:
+        continue
+      m = LINENO_REGEX.search(self.lines[python_lineno - 1])
+      if m is not None:
+        lineno = int(m.groups()[0])
+    return lineno
+
+  # a syntax error is reported by the parser and a missing input is not, both exit like the other engines
+  def run(self):
+    if self.code is None:
+      try:
+        self.load()
+      except:
+        if self.debug:
+          exc_info = sys.exc_info()
+          traceback.print_exception(*exc_info)
+          del exc_info
+        self.runtime_error = True
+        return
+    try:
+      exec(self.code, runtime())
+      print('End of program')
+    except:
+      exc_info = sys.exc_info()
+      if self.debug:
+        traceback.print_exception(*exc_info)
+      print('Run-time error : line %d' % self.error_lineno(exc_info[2]))
+      del exc_info
+      self.runtime_error = True
@@ -0,0 +1,220 @@
+import sys
+import traceback
+from model import bytecode as bc
+from model.symbol_table import History
+from util.function import globalFunctionTable, Function
+
+class Frame:
+  def __init__(self, code, values, logs, lineno_depth):
+    self.code = code
+    self.pc = 0
+    self.values = values
+    self.logs = logs
+    self.lineno_depth = lineno_depth
+
+  def lookup(self, symbol):
+    names = self.code.names
+    for slot in range(len(names) - 1, -1, -1):
+      if names[slot] == symbol and self.logs[slot] is not None:
+        return self.logs[slot]
+    return None
+
+class VirtualMachine:
+  def __init__(self, program, debug=False):
+    self.program = program
+    self.debug = debug
+    nlocals = program.main.get_nlocals()
+    self.global_frame = Frame(program.main, [None] * nlocals, [None] * nlocals, 1)
+    self.frames = [self.global_frame]
+    self.stack = []
+    self.linenos = [1]
+    self.line_num = 0
+    self.halted = False
+    self.runtime_error = False
+
+  def lookup(self, symbol):
+    history = self.frames[-1].lookup(symbol)
+    if history is None:
+      history = self.global_frame.lookup(symbol)
+    return history
+
+  def print(self, symbol):
+    history = self.lookup(symbol)
+    if history is not None:
+      target = history.get()
+    elif globalFunctionTable.has(symbol):
+      target = globalFunctionTable.get(symbol)
+    else:
+      print('Invisible variable')
+      return
+    print('N/A' if target is None else target)
+
+  def trace(self, symbol):
+    history = self.lookup(symbol)
+    if history is not None:
+      history.trace()
+    elif globalFunctionTable.has(symbol):
+      globalFunctionTable.trace(symbol)
+    else:
+      print('Invisible variable')
+
+  def add_linenum(self, line_num):
+    self.line_num += line_num
+
+  def run(self):
+    if self.halted:
+      return
+    frames = self.frames
+    stack = self.stack
+    linenos = self.linenos
+    global_values = self.global_frame.values
+    global_logs = self.global_frame.logs
+    frame = frames[-1]
+    instructions = frame.code.instructions
+    values = frame.values
+    logs = frame.logs
+    pc = frame.pc
+    line_num = self.line_num
+    try:
+      while True:
+        op, arg = instructions[pc]
+        pc += 1
+        if op == bc.LOAD_LOCAL:
+          stack.append(values[arg])
+        elif op == bc.CONST:
+          stack.append(arg)
+        elif op == bc.BINARY:
+          right = stack.pop()
+          stack[-1] = arg(stack[-1], right)
+        elif op == bc.COMPARE:
+          right = stack.pop()
+          stack[-1] = 1 if arg(stack[-1], right) else 0
+        elif op == bc.LOAD_GLOBAL:
+          stack.append(global_values[arg])
+        elif op == bc.JUMP_IF_FALSE:
+          if not stack.pop():
+            pc = arg
+        elif op == bc.LINE:
+          lineno = linenos[-1]
+          if arg > lineno + line_num - 1:
+            linenos[-1] = lineno + line_num
+            line_num = 0
+            pc -= 1
+            break
+          line_num -= arg - lineno + 1
+          linenos[-1] = arg + 1
+        elif op == bc.POP:
+          stack.pop()
+        elif op == bc.STORE_LOCAL:
+          slot, cast, lineno = arg
+          value = stack[-1] if cast is None else cast(stack[-1])
+          stack[-1] = value
+          values[slot] = value
+          logs[slot].add(lineno, value, None)
+        elif op == bc.CALL:
+          if arg:
+            arguments = stack[-arg:]
+            del stack[-arg:]
+          else:
+            arguments = []
+          function = stack.pop()
+          if function.__class__ is Function:
+            stack.append(function.run(*arguments))
+            continue
+          code = self.program.get_code(function)
+          parameters = code.parameters
+          if len(arguments) < len(parameters):
+            raise IndexError
+          frame.pc = pc
+          nlocals = code.get_nlocals()
+          values = [None] * nlocals
+          logs = [None] * nlocals
+          for i, (slot, lineno) in enumerate(parameters):
+            values[slot] = arguments[i]
+            logs[slot] = History(code.names[slot])
+            logs[slot].add(lineno, arguments[i], None)
+          frame = Frame(code, values, logs, len(linenos))
+          frames.append(frame)
+          linenos.append(code.lineno)
+          instructions = code.instructions
+          pc = 0
+        elif op == bc.RETURN:
+          del linenos[frame.lineno_depth:]
+          frames.pop()
+          frame = frames[-1]
+          instructions = frame.code.instructions
+          values = frame.values
+          logs = frame.logs
+          pc = frame.pc
+        elif op == bc.JUMP:
+          pc = arg
+        elif op == bc.STORE_GLOBAL:
+          slot, cast, lineno = arg
+          value = stack[-1] if cast is None else cast(stack[-1])
+          stack[-1] = value
+          global_values[slot] = value
+          global_logs[slot].add(lineno, value, None)
+        elif op == bc.LOAD_INDEX:
+          index = stack.pop()
+          stack[-1] = stack[-1][index]
+        elif op == bc.STORE_INDEX:
+          index = stack.pop()
+          array = stack.pop()
+          array[index] = stack[-1]
+          stack[-1] = array
+        elif op == bc.NEGATE:
+          stack[-1] = -stack[-1]
+        elif op == bc.LINE_TO:
+          lineno = linenos[-1]
+          if arg > lineno + line_num - 1:
+            linenos[-1] = lineno + line_num
+            line_num = 0
+            pc -= 1
+            break
+          line_num -= arg - lineno
+          linenos[-1] = arg
+        elif op == bc.LINE_COMPOUND:
+          lineno = linenos[-1]
+          if arg > lineno + line_num - 1:
+            linenos[-1] = lineno + line_num
+            line_num = 0
+            pc -= 1
+            break
+          line_num -= arg - lineno + 1
+          linenos[-1] = arg
+        elif op == bc.LINE_SET:
+          linenos[-1] = arg[0]
+          line_num -= arg[1]
+        elif op == bc.LINE_PUSH:
+          linenos.append(arg)
+        elif op == bc.LINE_POP:
+          linenos.pop()
+          if arg is not None:
+            linenos[-1] = arg[0]
+            line_num -= arg[1]
+        elif op == bc.DEFINE_LOCAL:
+          slot, lineno = arg
+          value = stack.pop()
+          values[slot] = value
+          logs[slot] = History(frame.code.names[slot])
+          logs[slot].add(lineno, value, None)
+        elif op == bc.NEW_ARRAY:
+          stack.append([None] * arg)
+        elif op == bc.HALT:
+          print('End of program')
+          pc -= 1
+          break
+        elif op == bc.FAIL:
+          raise ValueError
+        else:
+          raise ValueError
+    except:
+      if self.debug:
+        exc_info = sys.exc_info()
+        traceback.print_exception(*exc_info)
+        del exc_info
+      print('Run-time error : line %d' % frame.code.linenos[pc - 1])
+      self.runtime_error = True
+      self.halted = True
+    frame.pc = pc
+    self.line_num = line_num
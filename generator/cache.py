@@ -0,0 +1,111 @@
+import os
+import time
+import zlib
+import pickle
+import hashlib
+import tempfile
+from generator.parser import Parser
+from model.flat_ast import FlatAst
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'c-compiler', 'ast')
+CACHE_MAX_SIZE = 2**26
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+CACHE_SUFFIX = '.pickle'
+CHUNK_SIZE = 2**16
+
+# the cached trees are only valid for the grammar and the AST classes that built them
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GRAMMAR_FILES = (
+  os.path.join(ROOT_DIR, 'generator', 'lexer.py'),
+  os.path.join(ROOT_DIR, 'generator', 'scanner.py'),
+  os.path.join(ROOT_DIR, 'generator', 'parser.py'),
+  os.path.join(ROOT_DIR, 'generator', 'rd_parser.py'),
+  os.path.join(ROOT_DIR, 'model', 'ast.py'),
+  os.path.join(ROOT_DIR, 'model', 'flat_ast.py'),
+)
+
+def grammar_version():
+  digest = hashlib.sha1()
+  for path in GRAMMAR_FILES:
+    with open(path, 'rb') as f:
+      digest.update(f.read())
+  return digest.hexdigest()
+
+class ParseCache:
+  def __init__(self, directory=CACHE_DIR, max_size=CACHE_MAX_SIZE, max_age=CACHE_MAX_AGE):
+    self.directory = directory
+    self.max_size = max_size
+    self.max_age = max_age
+
+  def key(self, f):
+    digest = hashlib.sha1(grammar_version().encode())
+    for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+      digest.update(chunk)
+    return digest.hexdigest()
+
+  def path(self, key):
+    return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+  def get(self, key):
+    path = self.path(key)
+    try:
+      with open(path, 'rb') as f:
+        flat_ast = pickle.loads(zlib.decompress(f.read()))
+      os.utime(path)
+      return flat_ast
+    except Exception:
+      return None
+
+  # entries are compressed FlatAst columns, about the size of the source instead of 13 times for pickled nodes
+  def put(self, key, flat_ast):
+    tmp_path = None
+    try:
+      os.makedirs(self.directory, exist_ok=True)
+      fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+      with os.fdopen(fd, 'wb') as f:
+        f.write(zlib.compress(pickle.dumps(flat_ast, pickle.HIGHEST_PROTOCOL)))
+      os.replace(tmp_path, self.path(key))
+      tmp_path = None
+      self.evict()
+    except Exception:
+      if tmp_path is not None and os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+  # drop entries past max_age, then the least recently used until under max_size
+  def evict(self):
+    now = time.time()
+    entries = []
+    for name in os.listdir(self.directory):
+      if not name.endswith(CACHE_SUFFIX):
+        continue
+      path = os.path.join(self.directory, name)
+      stat = os.stat(path)
+      if now - stat.st_mtime > self.max_age:
+        os.remove(path)
+      else:
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total_size = sum(size for mtime, size, path in entries)
+    for mtime, size, path in sorted(entries):
+      if total_size <= self.max_size:
+        break
+      os.remove(path)
+      total_size -= size
+
+# parser is a warm Parser to reuse, otherwise one is only built on a cache miss
+def parse(source, debug=False, cache=True, lexer='scanner', engine='lalr', flat=False, parser=None):
+  if not cache:
+    parser = parser if parser is not None else Parser(debug=debug, lexer=lexer, engine=engine)
+    return parser.run(source, flat=flat)
+  parseCache = ParseCache()
+  with open(source, 'rb') as f:
+    key = parseCache.key(f)
+  flat_ast = parseCache.get(key)
+  if flat_ast is not None:
+    return flat_ast if flat else flat_ast.to_tree()
+  parser = parser if parser is not None else Parser(debug=debug, lexer=lexer, engine=engine)
+  ast = parser.run(source)
+  if ast is None:
+    return None
+  flat_ast = FlatAst.from_tree(ast)
+  parseCache.put(key, flat_ast)
+  return flat_ast if flat else ast
@@ -0,0 +1,60 @@
+import io
+import os
+import sys
+import argparse
+import contextlib
+from generator.parser import Parser
+from visitor.print_visitor import PrintVisitor
+
+# usage: python -m generator.differential [Path ...]
+# both parser engines must print the same tree, or fail the same way, for every .c file under the paths,
+# sample/ by default. run this after editing parser.py or rd_parser.py
+
+ENGINES = ('lalr', 'rd')
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sample')
+SOURCE_SUFFIX = '.c'
+
+# the printed tree, or what was reported before failing
+def dump(parser, source):
+  output = io.StringIO()
+  printVisitor = PrintVisitor()
+  try:
+    with contextlib.redirect_stdout(output):
+      parser.run(source).accept(printVisitor)
+  except Exception as e:
+    return output.getvalue() + e.__class__.__name__
+  return output.getvalue() + str(printVisitor)
+
+def sources(paths):
+  for path in paths:
+    if not os.path.isdir(path):
+      yield path
+      continue
+    for directory, dirnames, filenames in os.walk(path):
+      dirnames.sort()
+      for name in sorted(filenames):
+        if name.endswith(SOURCE_SUFFIX):
+          yield os.path.join(directory, name)
+
+# the inputs whose dumps differ
+def check(paths):
+  parsers = {engine: Parser(engine=engine) for engine in ENGINES}
+  differ = []
+  count = 0
+  for source in sources(paths):
+    count += 1
+    dumps = [dump(parsers[engine], source) for engine in ENGINES]
+    if dumps[0] != dumps[1]:
+      differ.append(source)
+  return count, differ
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Parser engine differential check')
+  parser.add_argument('paths', type=str, nargs='*', default=[SAMPLE_DIR], metavar='Path', help='.c files and directories, sample/ by default')
+  args = parser.parse_args()
+
+  count, differ = check(args.paths)
+  for source in differ:
+    print('{} : trees differ'.format(source))
+  print('{} files, {} differ'.format(count, len(differ)))
+  sys.exit(1 if differ or not count else 0)
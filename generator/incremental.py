@@ -0,0 +1,154 @@
+import io
+import contextlib
+from collections import namedtuple
+from generator.parser import Parser
+from generator.scanner import Scanner
+from model import ast
+from model.ast import LINE_BITS, LINE_MASK
+from model.flat_ast import FIELDS
+from util.helper import props
+
+# start and end are (line, column) in the old text, lines from 1 and columns from 0
+Edit = namedtuple('Edit', ('start', 'end', 'text'))
+
+# the statements of a Section are parsed as the body of this function, header on the line before them
+SECTION_HEADER = 'void f(){\n'
+SECTION_FOOTER = '\n}'
+# keeps `//.*$` from matching at the end of a fragment that is not the end of the file
+NOT_EOF = '\n\n'
+
+def apply_edit(text, edit):
+  lines = text.split('\n')
+  def offset(position):
+    line, column = position
+    return sum(len(l) + 1 for l in lines[:line - 1]) + column
+  return text[:offset(edit.start)] + edit.text + text[offset(edit.end):]
+
+# move every line past `line` by delta, nodes that end before it keep their subtree as it is
+def shift(root, line, delta):
+  # declarators of one declaration share their TypeNode
+  seen = set()
+  stack = [root]
+  while stack:
+    node = stack.pop()
+    packed_linespan = node.packed_linespan
+    if packed_linespan is not None:
+      start, end = packed_linespan >> LINE_BITS, packed_linespan & LINE_MASK
+      if end <= line or id(node) in seen:
+        continue
+      seen.add(id(node))
+      node.packed_linespan = (start + delta if start > line else start) << LINE_BITS | end + delta
+    if isinstance(node, ast.ArrayNode):
+      stack.extend(node.childs)
+      continue
+    for field in FIELDS.get(node.__class__, ()):
+      child = getattr(node, field)
+      if isinstance(child, ast.Node):
+        stack.append(child)
+
+# reparses the fewest whole lines of the innermost Section, or of the root, around an edit
+# lines outside of them are not scanned again, so their illegal characters are not reported twice
+class IncrementalParser:
+  def __init__(self, parser=None, **kw):
+    self.parser = parser if parser is not None else Parser(**kw)
+
+  def reparse(self, root, old_text, edit):
+    text = apply_edit(old_text, edit)
+    if not isinstance(root, ast.RootSection):
+      return self.parser.parse(text), text
+    first, last = edit.start[0], edit.end[0]
+    delta = edit.text.count('\n') - (last - first)
+    lines = text.split('\n')
+    for section in reversed(self.enclosing_sections(root, first, last)):
+      unit = self.unit(section, first, last)
+      if unit is None:
+        continue
+      start, end, lo, hi = unit
+      childs = self.parse_unit(section is root, lines, lo, hi + delta)
+      # an empty section is left to the parser, which fails on `{}`
+      if childs is None or not childs and start == 0 and end == len(section.childs):
+        break
+      if delta:
+        shift(root, hi, delta)
+      for child in childs:
+        child.parent = section
+      section.childs[start:end] = childs
+      if section is root:
+        root.linespan = (root.childs[0].linespan[0], root.childs[-1].linespan[1])
+      return root, text
+    return self.parser.parse(text), text
+
+  def enclosing_sections(self, root, first, last):
+    sections = [root]
+    section = root
+    while section is not None:
+      node = None
+      for child in section.childs:
+        linespan = child.linespan
+        if linespan[0] <= first and last <= linespan[1]:
+          node = child
+          break
+      section = None
+      if node is None:
+        break
+      for prop in props(node):
+        child = getattr(node, prop)
+        if prop != 'parent' and isinstance(child, ast.Section) and child.linespan[0] < first and last < child.linespan[1]:
+          section = child
+          sections.append(section)
+          break
+    return sections
+
+  # childs[start:end] and the lines lo..hi they cover, no other node of the section on those lines
+  def unit(self, section, first, last):
+    childs = section.childs
+    lo, hi = first, last
+    while True:
+      start = 0
+      while start < len(childs) and childs[start].linespan[1] < lo:
+        start += 1
+      end = start
+      while end < len(childs) and childs[end].linespan[0] <= hi:
+        end += 1
+      if start == end:
+        break
+      new_lo = min(lo, childs[start].linespan[0])
+      new_hi = max(hi, childs[end - 1].linespan[1])
+      if (new_lo, new_hi) == (lo, hi):
+        break
+      lo, hi = new_lo, new_hi
+    # the braces of a Section belong to the statement around it
+    if not isinstance(section, ast.RootSection) and not (section.linespan[0] < lo and hi < section.linespan[1]):
+      return None
+    return start, end, lo, hi
+
+  # padded with newlines so the parsed lines match the file, None when the parser has to see the whole file
+  def parse_unit(self, is_root, lines, lo, hi):
+    fragment = '\n'.join(lines[lo - 1:hi])
+    if is_root:
+      tail = '\n' + '\n'.join(lines[hi:]) if hi < len(lines) else ''
+      tail = tail if len(tail) <= 1 else NOT_EOF
+      data = '\n' * (lo - 1) + fragment + tail
+    else:
+      tail = NOT_EOF
+      data = '\n' * (lo - 2) + SECTION_HEADER + fragment + SECTION_FOOTER
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+      try:
+        if Scanner(fragment + tail).token() is None:
+          childs = []
+        else:
+          childs = self.childs(is_root, self.parser.parse(data))
+      except Exception:
+        childs = None
+    # syntax errors and illegal characters are reported by the full parse
+    if output.getvalue():
+      return None
+    return childs
+
+  def childs(self, is_root, result):
+    if is_root:
+      return result.childs
+    if len(result.childs) != 1:
+      return None
+    return result.childs[0].body.childs
@@ -1,16 +1,24 @@
+import os
 import sys
 import ply.lex as lex
 
+# generated tables are shipped next to the grammar, rebuild them with `python -m generator.tables`
+GENERATOR_DIR = os.path.dirname(os.path.abspath(__file__))
+
 class Lexer:
   def __init__(self, **kw):
     self.debug = kw.get('debug', 0)
-    self.lexer = lex.lex(module=self, debug=self.debug)
+    self.lexer = lex.lex(
+      module=self,
+      debug=self.debug,
+      optimize=1,
+      lextab='generator.lextab',
+      outputdir=GENERATOR_DIR
+    )
 
   def run(self, source):
-    f = open(source, 'r')
-    lines = f.readlines()
-    data = ''.join(lines)
-    self.lexer.input(data)
+    with open(source, 'r') as f:
+      self.lexer.input(f.read())
 
   tokens = (
     # Reserved
@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AMPERSAND', 'ASSIGN', 'ASSIGN_DIVIDE', 'ASSIGN_MINUS', 'ASSIGN_MODULO', 'ASSIGN_PLUS', 'ASSIGN_TIME', 'ASTERISK', 'BRACE_L', 'BRACE_R', 'BRACKET_L', 'BRACKET_R', 'BREAK', 'CHAR', 'CHARACTER', 'COMMA', 'CONTINUE', 'DIVIDE', 'DOUBLE_AMPERSAND', 'DOUBLE_MINUS', 'DOUBLE_PIPE', 'DOUBLE_PLUS', 'ELSE', 'EQ', 'FLOAT', 'FOR', 'GREATER', 'GREATER_EQ', 'ID', 'IF', 'INT', 'LESS', 'LESS_EQ', 'MINUS', 'MODULO', 'NOT_EQ', 'NUMBER_FLOAT', 'NUMBER_INT', 'PAREN_L', 'PAREN_R', 'PLUS', 'RETURN', 'SEMICOLON', 'STRING', 'VOID', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_ID>[a-zA-Z_]\\w*)|(?P<t_NUMBER_FLOAT>(([1-9]\\d*)|0(?!\\d))(\\.\\d*[1-9]))|(?P<t_NUMBER_INT>(([1-9]\\d*)|0(?!\\d)))|(?P<t_CHARACTER>\'\\w\')|(?P<t_STRING>".*(?<!\\\\)")|(?P<t_whitespace>[ \\t]+)|(?P<t_newline>\\n+)|(?P<t_remark>/\\*.*\\*/|(//.*$))|(?P<t_DIVIDE>/(?!\\*))|(?P<t_DOUBLE_PIPE>\\|\\|)|(?P<t_DOUBLE_PLUS>\\+\\+)|(?P<t_ASSIGN_PLUS>\\+=)|(?P<t_ASSIGN_TIME>\\*=)|(?P<t_ASSIGN_DIVIDE>/=)|(?P<t_ASSIGN_MINUS>-=)|(?P<t_ASSIGN_MODULO>%=)|(?P<t_ASTERISK>\\*)|(?P<t_BRACKET_L>\\[)|(?P<t_BRACKET_R>\\])|(?P<t_DOUBLE_AMPERSAND>&&)|(?P<t_DOUBLE_MINUS>--)|(?P<t_EQ>==)|(?P<t_GREATER_EQ>>=)|(?P<t_LESS_EQ><=)|(?P<t_NOT_EQ>!=)|(?P<t_PAREN_L>\\()|(?P<t_PAREN_R>\\))|(?P<t_PLUS>\\+)|(?P<t_AMPERSAND>&)|(?P<t_ASSIGN>=)|(?P<t_BRACE_L>{)|(?P<t_BRACE_R>})|(?P<t_COMMA>,)|(?P<t_GREATER>>)|(?P<t_LESS><)|(?P<t_MINUS>-)|(?P<t_MODULO>%)|(?P<t_SEMICOLON>;)', [None, ('t_ID', 'ID'), ('t_NUMBER_FLOAT', 'NUMBER_FLOAT'), None, None, None, ('t_NUMBER_INT', 'NUMBER_INT'), None, None, ('t_CHARACTER', 'CHARACTER'), ('t_STRING', 'STRING'), ('t_whitespace', 'whitespace'), ('t_newline', 'newline'), ('t_remark', 'remark'), None, (None, 'DIVIDE'), (None, 'DOUBLE_PIPE'), (None, 'DOUBLE_PLUS'), (None, 'ASSIGN_PLUS'), (None, 'ASSIGN_TIME'), (None, 'ASSIGN_DIVIDE'), (None, 'ASSIGN_MINUS'), (None, 'ASSIGN_MODULO'), (None, 'ASTERISK'), (None, 'BRACKET_L'), (None, 'BRACKET_R'), (None, 'DOUBLE_AMPERSAND'), (None, 'DOUBLE_MINUS'), (None, 'EQ'), (None, 'GREATER_EQ'), (None, 'LESS_EQ'), (None, 'NOT_EQ'), (None, 'PAREN_L'), (None, 'PAREN_R'), (None, 'PLUS'), (None, 'AMPERSAND'), (None, 'ASSIGN'), (None, 'BRACE_L'), (None, 'BRACE_R'), (None, 'COMMA'), (None, 'GREATER'), (None, 'LESS'), (None, 'MINUS'), (None, 'MODULO'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -1,32 +1,58 @@
 import os
 import ply.yacc as yacc
-from generator.lexer import Lexer
+from generator.lexer import Lexer, GENERATOR_DIR
+from generator.scanner import Scanner
+from generator.source import Source
+from generator.rd_parser import RecursiveDescentParser
 from model import ast
+from model.flat_ast import FlatAst
 
 
 class Parser(Lexer):
   def __init__(self, **kw):
     super().__init__(**kw)
     self.names = {}
+    self.scanner = kw.get('lexer', 'scanner') == 'scanner'
+    self.engine = kw.get('engine', 'lalr')
     try:
       modname = os.path.split(os.path.splitext(__file__)[0])[1] + "_" + self.__class__.__name__
     except:
       modname = "parser" + "_" + self.__class__.__name__
     self.debugfile = modname + ".dbg"
-    self.tabmodule = modname + "_" + "parsetab"
+    self.tabmodule = "generator.parsetab"
+    if self.engine == 'rd':
+      return
 
-    yacc.yacc(
+    self.lrparser = yacc.yacc(
       module=self,
       debug=self.debug,
       debugfile=self.debugfile,
-      tabmodule=self.tabmodule
+      tabmodule=self.tabmodule,
+      outputdir=GENERATOR_DIR,
+      optimize=1
     )
 
-  def run(self, source):
-    f = open(source, 'r')
-    lines = f.readlines()
-    data = ''.join(lines)
-    return yacc.parse(data)
+  def run(self, source, flat=False):
+    with Source(source, text=not self.scanner) as data:
+      root = self.parse(data)
+    if flat and root is not None:
+      return FlatAst.from_tree(root)
+    return root
+
+  # parse source text or a buffer, line numbers start from 1 on every call
+  def parse(self, data):
+    if self.scanner:
+      lexer = Scanner()
+    else:
+      lexer = self.lexer
+      lexer.lineno = 1
+    if self.engine == 'rd':
+      return RecursiveDescentParser(self).parse(data, lexer)
+    root = self.lrparser.parse(data, lexer=lexer)
+    # the LR stacks still hold the tree, which would outlive a flattened result
+    self.lrparser.statestack = []
+    self.lrparser.symstack = []
+    return root
 
   precedence = (
     ('left', 'EQ', 'NOT_EQ'),
@@ -329,9 +355,9 @@ class Parser(Lexer):
     '''variable_expression : ASTERISK variable_simpe_expression
                            | AMPERSAND variable_simpe_expression'''
     linespan = (p.linespan(1)[0], p[2].linespan[1])
-    p[1].set_pointer(p[1])
-    p[1].update_linespan(linespan)
-    p[0] = p[1]
+    p[2].set_pointer(p[1])
+    p[2].update_linespan(linespan)
+    p[0] = p[2]
 
   def p_variable_simpe_expression_1(self, p):
     '''variable_simpe_expression : ID'''
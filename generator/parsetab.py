@@ -0,0 +1,125 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftEQNOT_EQleftLESSGREATERLESS_EQGREATER_EQleftPLUSMINUSDOUBLE_AMPERSANDDOUBLE_PIPEleftASTERISKDIVIDEMODULOrightIFSrightELSEAMPERSAND ASSIGN ASSIGN_DIVIDE ASSIGN_MINUS ASSIGN_MODULO ASSIGN_PLUS ASSIGN_TIME ASTERISK BRACE_L BRACE_R BRACKET_L BRACKET_R BREAK CHAR CHARACTER COMMA CONTINUE DIVIDE DOUBLE_AMPERSAND DOUBLE_MINUS DOUBLE_PIPE DOUBLE_PLUS ELSE EQ FLOAT FOR GREATER GREATER_EQ ID IF INT LESS LESS_EQ MINUS MODULO NOT_EQ NUMBER_FLOAT NUMBER_INT PAREN_L PAREN_R PLUS RETURN SEMICOLON STRING VOID WHILEroot_section_opt : emptyroot_section_opt : root_sectionroot_section : root_sectorroot_section : root_section root_sectorroot_sector : declaration\n                   | expression_statement\n                   | conditional_statement\n                   | loop_statementsection_wrapper : BRACE_L section_opt BRACE_Rsection_opt : emptysection_opt : sectionsection : sectorsection : section sectorsector : declaration\n              | statementdeclaration : variable_declaration\n                   | function_declarationfunction_declaration : type function_declarator section_wrapperfunction_declarator : function_simple_declaratorfunction_declarator : ASTERISK function_declaratorfunction_simple_declarator : ID PAREN_L parameter_group PAREN_Rfunction_simple_declarator : ID PAREN_L PAREN_R\n                                  | ID PAREN_L VOID PAREN_Rvariable_declaration : type variable_declarator_group SEMICOLONvariable_declarator_group : variable_declaratorvariable_declarator_group : variable_declarator_group COMMA variable_declaratorvariable_declarator : variable_simple_declaratorvariable_declarator : ASTERISK variable_declaratorvariable_simple_declarator : IDvariable_simple_declarator : ID BRACKET_L NUMBER_INT BRACKET_Rparameter_group : type variable_declaratorparameter_group : parameter_group COMMA type variable_declaratorstatement : expression_statement\n                 | conditional_statement\n                 | loop_statement\n                 | jump_statementexpression_statement : expression SEMICOLONconditional_statement : IF PAREN_L expression PAREN_R section_wrapper %prec IFSconditional_statement : IF PAREN_L expression PAREN_R section_wrapper ELSE section_wrapperloop_statement : WHILE PAREN_L expression PAREN_R section_wrapperloop_statement : FOR PAREN_L expression_statement expression_statement expression PAREN_R section_wrapperjump_statement : RETURN SEMICOLONjump_statement : RETURN expression SEMICOLONjump_statement : BREAK SEMICOLONjump_statement : CONTINUE SEMICOLONargument_expression_list : expressionargument_expression_list : argument_expression_list COMMA expressionexpression : additive_expression\n                  | assign_expressionassign_expression : variable_expression ASSIGN expression\n                         | variable_expression ASSIGN_PLUS expression\n                         | variable_expression ASSIGN_MINUS expression\n                         | variable_expression ASSIGN_TIME expression\n                         | variable_expression ASSIGN_DIVIDE expression\n                         | variable_expression ASSIGN_MODULO expressionadditive_expression : unary_expressionadditive_expression : additive_expression EQ unary_expression\n                           | additive_expression NOT_EQ unary_expression\n                           | additive_expression LESS unary_expression\n                           | additive_expression GREATER unary_expression\n                           | additive_expression LESS_EQ unary_expression\n                           | additive_expression GREATER_EQ unary_expression\n                           | additive_expression PLUS unary_expression\n                           | additive_expression MINUS unary_expression\n                           | additive_expression DOUBLE_AMPERSAND unary_expression\n                           | additive_expression DOUBLE_PIPE unary_expression\n                           | additive_expression ASTERISK unary_expression\n                           | additive_expression DIVIDE unary_expression\n                           | additive_expression MODULO unary_expressionunary_expression : function_expression\n                        | const_expressionunary_expression : MINUS unary_expression\n                        | PLUS unary_expressionunary_expression : function_expression DOUBLE_PLUS\n                        | function_expression DOUBLE_MINUSunary_expression : DOUBLE_PLUS function_expression\n                        | DOUBLE_MINUS function_expressionfunction_expression : variable_expressionfunction_expression : function_expression PAREN_L argument_expression_list PAREN_Rfunction_expression : function_expression PAREN_L PAREN_Rvariable_expression : variable_simpe_expressionvariable_expression : ASTERISK variable_simpe_expression\n                           | AMPERSAND variable_simpe_expressionvariable_simpe_expression : IDvariable_simpe_expression : variable_simpe_expression BRACKET_L expression BRACKET_Rvariable_simpe_expression : PAREN_L expression PAREN_Rconst_expression : NUMBER_FLOATconst_expression : NUMBER_INTconst_expression : CHARACTERconst_expression : STRINGtype : INT\n            | FLOAT\n            | VOID\n            | CHARempty :'
+    
+_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,9,10,39,40,86,88,144,145,147,163,164,],[-95,0,-1,-2,-3,-5,-6,-7,-8,-16,-17,-4,-37,-24,-18,-38,-40,-9,-39,-41,]),'IF':([0,3,4,5,6,7,8,9,10,39,40,86,88,89,125,126,127,128,129,130,131,132,144,145,147,148,149,151,152,161,163,164,],[12,12,-3,-5,-6,-7,-8,-16,-17,-4,-37,-24,-18,12,12,-12,-14,-15,-33,-34,-35,-36,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'WHILE':([0,3,4,5,6,7,8,9,10,39,40,86,88,89,125,126,127,128,129,130,131,132,144,145,147,148,149,151,152,161,163,164,],[14,14,-3,-5,-6,-7,-8,-16,-17,-4,-37,-24,-18,14,14,-12,-14,-15,-33,-34,-35,-36,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'FOR':([0,3,4,5,6,7,8,9,10,39,40,86,88,89,125,126,127,128,129,130,131,132,144,145,147,148,149,151,152,161,163,164,],[15,15,-3,-5,-6,-7,-8,-16,-17,-4,-37,-24,-18,15,15,-12,-14,-15,-33,-34,-35,-36,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'INT':([0,3,4,5,6,7,8,9,10,39,40,86,88,89,92,125,126,127,128,129,130,131,132,144,145,147,148,149,151,152,154,161,163,164,],[19,19,-3,-5,-6,-7,-8,-16,-17,-4,-37,-24,-18,19,19,19,-12,-14,-15,-33,-34,-35,-36,-38,-40,-9,-13,-42,-44,-45,19,-43,-39,-41,]),'FLOAT':([0,3,4,5,6,7,8,9,10,39,40,86,88,89,92,125,126,127,128,129,130,131,132,144,145,147,148,149,151,152,154,161,163,164,],[20,20,-3,-5,-6,-7,-8,-16,-17,-4,-37,-24,-18,20,20,20,-12,-14,-15,-33,-34,-35,-36,-38,-40,-9,-13,-42,-44,-45,20,-43,-39,-41,]),'VOID':([0,3,4,5,6,7,8,9,10,39,40,86,88,89,92,125,126,127,128,129,130,131,132,144,145,147,148,149,151,152,154,161,163,164,],[21,21,-3,-5,-6,-7,-8,-16,-17,-4,-37,-24,-18,21,138,21,-12,-14,-15,-33,-34,-35,-36,-38,-40,-9,-13,-42,-44,-45,21,-43,-39,-41,]),'CHAR':([0,3,4,5,6,7,8,9,10,39,40,86,88,89,92,125,126,127,128,129,130,131,132,144,145,147,148,149,151,152,154,161,163,164,],[22,22,-3,-5,-6,-7,-8,-16,-17,-4,-37,-24,-18,22,22,22,-12,-14,-15,-33,-34,-35,-36,-38,-40,-9,-13,-42,-44,-45,22,-43,-39,-41,]),'MINUS':([0,3,4,5,6,7,8,9,10,13,17,23,24,25,27,28,29,32,34,35,36,37,38,39,40,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,83,85,86,88,89,94,95,96,97,98,99,100,101,102,103,104,105,106,114,119,125,126,127,128,129,130,131,132,133,141,142,143,144,145,147,148,149,151,152,161,163,164,],[25,25,-3,-5,-6,-7,-8,-16,-17,25,59,-56,25,25,-78,-70,-71,-81,-87,-88,-89,-90,-84,-4,-37,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-73,-78,-72,-82,25,25,25,25,25,25,-74,-75,25,-76,-77,25,-83,-86,25,-24,-18,25,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-80,25,25,-12,-14,-15,-33,-34,-35,-36,25,-79,25,-85,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'PLUS':([0,3,4,5,6,7,8,9,10,13,17,23,24,25,27,28,29,32,34,35,36,37,38,39,40,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,83,85,86,88,89,94,95,96,97,98,99,100,101,102,103,104,105,106,114,119,125,126,127,128,129,130,131,132,133,141,142,143,144,145,147,148,149,151,152,161,163,164,],[24,24,-3,-5,-6,-7,-8,-16,-17,24,58,-56,24,24,-78,-70,-71,-81,-87,-88,-89,-90,-84,-4,-37,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,-73,-78,-72,-82,24,24,24,24,24,24,-74,-75,24,-76,-77,24,-83,-86,24,-24,-18,24,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-80,24,24,-12,-14,-15,-33,-34,-35,-36,24,-79,24,-85,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'DOUBLE_PLUS':([0,3,4,5,6,7,8,9,10,13,24,25,27,28,32,38,39,40,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,66,68,69,70,71,72,73,74,77,80,81,83,85,86,88,89,114,119,125,126,127,128,129,130,131,132,133,141,142,143,144,145,147,148,149,151,152,161,163,164,],[30,30,-3,-5,-6,-7,-8,-16,-17,30,30,30,-78,75,-81,-84,-4,-37,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,-78,-82,30,30,30,30,30,30,30,30,-83,-86,30,-24,-18,30,-80,30,30,-12,-14,-15,-33,-34,-35,-36,30,-79,30,-85,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'DOUBLE_MINUS':([0,3,4,5,6,7,8,9,10,13,24,25,27,28,32,38,39,40,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,66,68,69,70,71,72,73,74,77,80,81,83,85,86,88,89,114,119,125,126,127,128,129,130,131,132,133,141,142,143,144,145,147,148,149,151,152,161,163,164,],[31,31,-3,-5,-6,-7,-8,-16,-17,31,31,31,-78,76,-81,-84,-4,-37,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,-78,-82,31,31,31,31,31,31,31,31,-83,-86,31,-24,-18,31,-80,31,31,-12,-14,-15,-33,-34,-35,-36,31,-79,31,-85,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'ASTERISK':([0,3,4,5,6,7,8,9,10,13,16,17,19,20,21,22,23,24,25,27,28,29,30,31,32,34,35,36,37,38,39,40,41,43,44,49,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,83,85,86,87,88,89,94,95,96,97,98,99,100,101,102,103,104,105,106,114,119,121,125,126,127,128,129,130,131,132,133,138,139,141,142,143,144,145,147,148,149,151,152,161,162,163,164,],[26,26,-3,-5,-6,-7,-8,-16,-17,26,49,62,-91,-92,-93,-94,-56,26,26,-78,-70,-71,26,26,-81,-87,-88,-89,-90,-84,-4,-37,26,26,26,49,26,26,26,26,26,26,26,26,26,26,26,26,26,-73,-78,-72,-82,26,26,26,26,26,26,-74,-75,26,-76,-77,26,-83,-86,26,-24,121,-18,26,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-80,26,121,26,-12,-14,-15,-33,-34,-35,-36,26,-93,121,-79,26,-85,-38,-40,-9,-13,-42,-44,-45,-43,121,-39,-41,]),'AMPERSAND':([0,3,4,5,6,7,8,9,10,13,24,25,30,31,39,40,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,69,70,71,72,73,74,77,80,85,86,88,89,119,125,126,127,128,129,130,131,132,133,142,144,145,147,148,149,151,152,161,163,164,],[33,33,-3,-5,-6,-7,-8,-16,-17,33,33,33,33,33,-4,-37,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-24,-18,33,33,33,-12,-14,-15,-33,-34,-35,-36,33,33,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'NUMBER_FLOAT':([0,3,4,5,6,7,8,9,10,13,24,25,39,40,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,69,70,71,72,73,74,77,80,85,86,88,89,119,125,126,127,128,129,130,131,132,133,142,144,145,147,148,149,151,152,161,163,164,],[34,34,-3,-5,-6,-7,-8,-16,-17,34,34,34,-4,-37,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-24,-18,34,34,34,-12,-14,-15,-33,-34,-35,-36,34,34,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'NUMBER_INT':([0,3,4,5,6,7,8,9,10,13,24,25,39,40,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,69,70,71,72,73,74,77,80,85,86,88,89,93,119,125,126,127,128,129,130,131,132,133,142,144,145,147,148,149,151,152,161,163,164,],[35,35,-3,-5,-6,-7,-8,-16,-17,35,35,35,-4,-37,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-24,-18,35,140,35,35,-12,-14,-15,-33,-34,-35,-36,35,35,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'CHARACTER':([0,3,4,5,6,7,8,9,10,13,24,25,39,40,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,69,70,71,72,73,74,77,80,85,86,88,89,119,125,126,127,128,129,130,131,132,133,142,144,145,147,148,149,151,152,161,163,164,],[36,36,-3,-5,-6,-7,-8,-16,-17,36,36,36,-4,-37,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-24,-18,36,36,36,-12,-14,-15,-33,-34,-35,-36,36,36,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'STRING':([0,3,4,5,6,7,8,9,10,13,24,25,39,40,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,69,70,71,72,73,74,77,80,85,86,88,89,119,125,126,127,128,129,130,131,132,133,142,144,145,147,148,149,151,152,161,163,164,],[37,37,-3,-5,-6,-7,-8,-16,-17,37,37,37,-4,-37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-24,-18,37,37,37,-12,-14,-15,-33,-34,-35,-36,37,37,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'ID':([0,3,4,5,6,7,8,9,10,13,16,19,20,21,22,24,25,26,30,31,33,39,40,41,43,44,49,52,53,54,55,56,57,58,59,60,61,62,63,64,69,70,71,72,73,74,77,80,85,86,87,88,89,119,121,125,126,127,128,129,130,131,132,133,138,139,142,144,145,147,148,149,151,152,161,162,163,164,],[38,38,-3,-5,-6,-7,-8,-16,-17,38,51,-91,-92,-93,-94,38,38,38,38,38,38,-4,-37,38,38,38,51,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-24,122,-18,38,38,122,38,-12,-14,-15,-33,-34,-35,-36,38,-93,122,38,-38,-40,-9,-13,-42,-44,-45,-43,122,-39,-41,]),'PAREN_L':([0,3,4,5,6,7,8,9,10,12,13,14,15,24,25,26,27,28,30,31,32,33,38,39,40,41,43,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,66,68,69,70,71,72,73,74,77,78,79,80,81,83,85,86,88,89,114,119,125,126,127,128,129,130,131,132,133,141,142,143,144,145,147,148,149,151,152,161,163,164,],[13,13,-3,-5,-6,-7,-8,-16,-17,41,13,43,44,13,13,13,-78,77,13,13,-81,13,-84,-4,-37,13,13,13,92,13,13,13,13,13,13,13,13,13,13,13,13,13,-78,-82,13,13,13,13,13,13,13,77,77,13,-83,-86,13,-24,-18,13,-80,13,13,-12,-14,-15,-33,-34,-35,-36,13,-79,13,-85,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'RETURN':([9,10,40,86,88,89,125,126,127,128,129,130,131,132,144,145,147,148,149,151,152,161,163,164,],[-16,-17,-37,-24,-18,133,133,-12,-14,-15,-33,-34,-35,-36,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'BREAK':([9,10,40,86,88,89,125,126,127,128,129,130,131,132,144,145,147,148,149,151,152,161,163,164,],[-16,-17,-37,-24,-18,134,134,-12,-14,-15,-33,-34,-35,-36,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'CONTINUE':([9,10,40,86,88,89,125,126,127,128,129,130,131,132,144,145,147,148,149,151,152,161,163,164,],[-16,-17,-37,-24,-18,135,135,-12,-14,-15,-33,-34,-35,-36,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'BRACE_R':([9,10,40,86,88,89,123,124,125,126,127,128,129,130,131,132,144,145,147,148,149,151,152,161,163,164,],[-16,-17,-37,-24,-18,-95,147,-10,-11,-12,-14,-15,-33,-34,-35,-36,-38,-40,-9,-13,-42,-44,-45,-43,-39,-41,]),'SEMICOLON':([11,17,18,23,27,28,29,32,34,35,36,37,38,45,47,50,51,65,66,67,68,75,76,78,79,81,83,91,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,114,120,122,133,134,135,141,143,150,157,],[40,-48,-49,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,86,-25,-27,-29,-73,-78,-72,-82,-74,-75,-76,-77,-83,-86,-28,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-50,-51,-52,-53,-54,-55,-80,-26,-29,149,151,152,-79,-85,161,-30,]),'PAREN_R':([17,18,23,27,28,29,32,34,35,36,37,38,42,50,65,66,67,68,75,76,77,78,79,81,82,83,84,91,92,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,122,136,138,141,143,146,156,157,158,165,],[-48,-49,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,83,-27,-73,-78,-72,-82,-74,-75,114,-76,-77,-83,117,-86,118,-28,137,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-50,-51,-52,-53,-54,-55,141,-80,-46,-29,153,155,-79,-85,160,-31,-30,-47,-32,]),'COMMA':([17,18,23,27,28,29,32,34,35,36,37,38,45,47,50,51,65,66,67,68,75,76,78,79,81,83,91,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,120,122,136,141,143,156,157,158,165,],[-48,-49,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,87,-25,-27,-29,-73,-78,-72,-82,-74,-75,-76,-77,-83,-86,-28,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-50,-51,-52,-53,-54,-55,142,-80,-46,-26,-29,154,-79,-85,-31,-30,-47,-32,]),'BRACKET_R':([17,18,23,27,28,29,32,34,35,36,37,38,65,66,67,68,75,76,78,79,81,83,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,114,116,140,141,143,],[-48,-49,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,-73,-78,-72,-82,-74,-75,-76,-77,-83,-86,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-50,-51,-52,-53,-54,-55,-80,143,157,-79,-85,]),'EQ':([17,23,27,28,29,32,34,35,36,37,38,65,66,67,68,75,76,78,79,81,83,94,95,96,97,98,99,100,101,102,103,104,105,106,114,141,143,],[52,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,-73,-78,-72,-82,-74,-75,-76,-77,-83,-86,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-80,-79,-85,]),'NOT_EQ':([17,23,27,28,29,32,34,35,36,37,38,65,66,67,68,75,76,78,79,81,83,94,95,96,97,98,99,100,101,102,103,104,105,106,114,141,143,],[53,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,-73,-78,-72,-82,-74,-75,-76,-77,-83,-86,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-80,-79,-85,]),'LESS':([17,23,27,28,29,32,34,35,36,37,38,65,66,67,68,75,76,78,79,81,83,94,95,96,97,98,99,100,101,102,103,104,105,106,114,141,143,],[54,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,-73,-78,-72,-82,-74,-75,-76,-77,-83,-86,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-80,-79,-85,]),'GREATER':([17,23,27,28,29,32,34,35,36,37,38,65,66,67,68,75,76,78,79,81,83,94,95,96,97,98,99,100,101,102,103,104,105,106,114,141,143,],[55,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,-73,-78,-72,-82,-74,-75,-76,-77,-83,-86,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-80,-79,-85,]),'LESS_EQ':([17,23,27,28,29,32,34,35,36,37,38,65,66,67,68,75,76,78,79,81,83,94,95,96,97,98,99,100,101,102,103,104,105,106,114,141,143,],[56,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,-73,-78,-72,-82,-74,-75,-76,-77,-83,-86,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-80,-79,-85,]),'GREATER_EQ':([17,23,27,28,29,32,34,35,36,37,38,65,66,67,68,75,76,78,79,81,83,94,95,96,97,98,99,100,101,102,103,104,105,106,114,141,143,],[57,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,-73,-78,-72,-82,-74,-75,-76,-77,-83,-86,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-80,-79,-85,]),'DOUBLE_AMPERSAND':([17,23,27,28,29,32,34,35,36,37,38,65,66,67,68,75,76,78,79,81,83,94,95,96,97,98,99,100,101,102,103,104,105,106,114,141,143,],[60,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,-73,-78,-72,-82,-74,-75,-76,-77,-83,-86,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-80,-79,-85,]),'DOUBLE_PIPE':([17,23,27,28,29,32,34,35,36,37,38,65,66,67,68,75,76,78,79,81,83,94,95,96,97,98,99,100,101,102,103,104,105,106,114,141,143,],[61,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,-73,-78,-72,-82,-74,-75,-76,-77,-83,-86,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-80,-79,-85,]),'DIVIDE':([17,23,27,28,29,32,34,35,36,37,38,65,66,67,68,75,76,78,79,81,83,94,95,96,97,98,99,100,101,102,103,104,105,106,114,141,143,],[63,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,-73,-78,-72,-82,-74,-75,-76,-77,-83,-86,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-80,-79,-85,]),'MODULO':([17,23,27,28,29,32,34,35,36,37,38,65,66,67,68,75,76,78,79,81,83,94,95,96,97,98,99,100,101,102,103,104,105,106,114,141,143,],[64,-56,-78,-70,-71,-81,-87,-88,-89,-90,-84,-73,-78,-72,-82,-74,-75,-76,-77,-83,-86,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-80,-79,-85,]),'ASSIGN':([27,32,38,68,81,83,143,],[69,-81,-84,-82,-83,-86,-85,]),'ASSIGN_PLUS':([27,32,38,68,81,83,143,],[70,-81,-84,-82,-83,-86,-85,]),'ASSIGN_MINUS':([27,32,38,68,81,83,143,],[71,-81,-84,-82,-83,-86,-85,]),'ASSIGN_TIME':([27,32,38,68,81,83,143,],[72,-81,-84,-82,-83,-86,-85,]),'ASSIGN_DIVIDE':([27,32,38,68,81,83,143,],[73,-81,-84,-82,-83,-86,-85,]),'ASSIGN_MODULO':([27,32,38,68,81,83,143,],[74,-81,-84,-82,-83,-86,-85,]),'BRACKET_L':([32,38,51,68,81,83,122,143,],[80,-84,93,80,80,-86,93,-85,]),'BRACE_L':([46,48,90,117,118,137,153,155,159,160,],[89,-19,-20,89,89,-22,-21,-23,89,89,]),'ELSE':([144,147,],[159,-9,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'root_section_opt':([0,],[1,]),'empty':([0,89,],[2,124,]),'root_section':([0,],[3,]),'root_sector':([0,3,],[4,39,]),'declaration':([0,3,89,125,],[5,5,127,127,]),'expression_statement':([0,3,44,85,89,125,],[6,6,85,119,129,129,]),'conditional_statement':([0,3,89,125,],[7,7,130,130,]),'loop_statement':([0,3,89,125,],[8,8,131,131,]),'variable_declaration':([0,3,89,125,],[9,9,9,9,]),'function_declaration':([0,3,89,125,],[10,10,10,10,]),'expression':([0,3,13,41,43,44,69,70,71,72,73,74,77,80,85,89,119,125,133,142,],[11,11,42,82,84,11,107,108,109,110,111,112,115,116,11,11,146,11,150,158,]),'type':([0,3,89,92,125,154,],[16,16,16,139,16,162,]),'additive_expression':([0,3,13,41,43,44,69,70,71,72,73,74,77,80,85,89,119,125,133,142,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'assign_expression':([0,3,13,41,43,44,69,70,71,72,73,74,77,80,85,89,119,125,133,142,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'unary_expression':([0,3,13,24,25,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,69,70,71,72,73,74,77,80,85,89,119,125,133,142,],[23,23,23,65,67,23,23,23,94,95,96,97,98,99,100,101,102,103,104,105,106,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'variable_expression':([0,3,13,24,25,30,31,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,69,70,71,72,73,74,77,80,85,89,119,125,133,142,],[27,27,27,66,66,66,66,27,27,27,66,66,66,66,66,66,66,66,66,66,66,66,66,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'function_expression':([0,3,13,24,25,30,31,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,69,70,71,72,73,74,77,80,85,89,119,125,133,142,],[28,28,28,28,28,78,79,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'const_expression':([0,3,13,24,25,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,69,70,71,72,73,74,77,80,85,89,119,125,133,142,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'variable_simpe_expression':([0,3,13,24,25,26,30,31,33,41,43,44,52,53,54,55,56,57,58,59,60,61,62,63,64,69,70,71,72,73,74,77,80,85,89,119,125,133,142,],[32,32,32,32,32,68,32,32,81,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'variable_declarator_group':([16,],[45,]),'function_declarator':([16,49,],[46,90,]),'variable_declarator':([16,49,87,121,139,162,],[47,91,120,91,156,165,]),'function_simple_declarator':([16,49,],[48,48,]),'variable_simple_declarator':([16,49,87,121,139,162,],[50,50,50,50,50,50,]),'section_wrapper':([46,117,118,159,160,],[88,144,145,163,164,]),'argument_expression_list':([77,],[113,]),'section_opt':([89,],[123,]),'section':([89,],[125,]),'sector':([89,125,],[126,148,]),'statement':([89,125,],[128,128,]),'jump_statement':([89,125,],[132,132,]),'parameter_group':([92,],[136,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> root_section_opt","S'",1,None,None,None),
+  ('root_section_opt -> empty','root_section_opt',1,'p_root_section_opt_1','parser.py',45),
+  ('root_section_opt -> root_section','root_section_opt',1,'p_root_section_opt_2','parser.py',49),
+  ('root_section -> root_sector','root_section',1,'p_root_section_1','parser.py',53),
+  ('root_section -> root_section root_sector','root_section',2,'p_root_section_2','parser.py',57),
+  ('root_sector -> declaration','root_sector',1,'p_root_sector','parser.py',64),
+  ('root_sector -> expression_statement','root_sector',1,'p_root_sector','parser.py',65),
+  ('root_sector -> conditional_statement','root_sector',1,'p_root_sector','parser.py',66),
+  ('root_sector -> loop_statement','root_sector',1,'p_root_sector','parser.py',67),
+  ('section_wrapper -> BRACE_L section_opt BRACE_R','section_wrapper',3,'p_section_wrapper','parser.py',71),
+  ('section_opt -> empty','section_opt',1,'p_section_opt_1','parser.py',77),
+  ('section_opt -> section','section_opt',1,'p_section_opt_2','parser.py',81),
+  ('section -> sector','section',1,'p_section_1','parser.py',85),
+  ('section -> section sector','section',2,'p_section_2','parser.py',89),
+  ('sector -> declaration','sector',1,'p_sector','parser.py',96),
+  ('sector -> statement','sector',1,'p_sector','parser.py',97),
+  ('declaration -> variable_declaration','declaration',1,'p_declaration','parser.py',103),
+  ('declaration -> function_declaration','declaration',1,'p_declaration','parser.py',104),
+  ('function_declaration -> type function_declarator section_wrapper','function_declaration',3,'p_function_declaration','parser.py',108),
+  ('function_declarator -> function_simple_declarator','function_declarator',1,'p_function_declarator_1','parser.py',114),
+  ('function_declarator -> ASTERISK function_declarator','function_declarator',2,'p_function_declarator_2','parser.py',118),
+  ('function_simple_declarator -> ID PAREN_L parameter_group PAREN_R','function_simple_declarator',4,'p_function_simple_declarator_1','parser.py',124),
+  ('function_simple_declarator -> ID PAREN_L PAREN_R','function_simple_declarator',3,'p_function_simple_declarator_2','parser.py',129),
+  ('function_simple_declarator -> ID PAREN_L VOID PAREN_R','function_simple_declarator',4,'p_function_simple_declarator_2','parser.py',130),
+  ('variable_declaration -> type variable_declarator_group SEMICOLON','variable_declaration',3,'p_variable_declaration','parser.py',135),
+  ('variable_declarator_group -> variable_declarator','variable_declarator_group',1,'p_variable_declarator_group_1','parser.py',144),
+  ('variable_declarator_group -> variable_declarator_group COMMA variable_declarator','variable_declarator_group',3,'p_variable_declarator_group_2','parser.py',148),
+  ('variable_declarator -> variable_simple_declarator','variable_declarator',1,'p_variable_declarator_1','parser.py',153),
+  ('variable_declarator -> ASTERISK variable_declarator','variable_declarator',2,'p_variable_declarator_2','parser.py',157),
+  ('variable_simple_declarator -> ID','variable_simple_declarator',1,'p_variable_simple_declarator_1','parser.py',163),
+  ('variable_simple_declarator -> ID BRACKET_L NUMBER_INT BRACKET_R','variable_simple_declarator',4,'p_variable_simple_declarator_2','parser.py',167),
+  ('parameter_group -> type variable_declarator','parameter_group',2,'p_parameter_group_1','parser.py',172),
+  ('parameter_group -> parameter_group COMMA type variable_declarator','parameter_group',4,'p_parameter_group_2','parser.py',178),
+  ('statement -> expression_statement','statement',1,'p_statement','parser.py',188),
+  ('statement -> conditional_statement','statement',1,'p_statement','parser.py',189),
+  ('statement -> loop_statement','statement',1,'p_statement','parser.py',190),
+  ('statement -> jump_statement','statement',1,'p_statement','parser.py',191),
+  ('expression_statement -> expression SEMICOLON','expression_statement',2,'p_expression_statement','parser.py',195),
+  ('conditional_statement -> IF PAREN_L expression PAREN_R section_wrapper','conditional_statement',5,'p_conditional_statement_1','parser.py',201),
+  ('conditional_statement -> IF PAREN_L expression PAREN_R section_wrapper ELSE section_wrapper','conditional_statement',7,'p_conditional_statement_2','parser.py',206),
+  ('loop_statement -> WHILE PAREN_L expression PAREN_R section_wrapper','loop_statement',5,'p_loop_statement_1','parser.py',211),
+  ('loop_statement -> FOR PAREN_L expression_statement expression_statement expression PAREN_R section_wrapper','loop_statement',7,'p_loop_statement_2','parser.py',216),
+  ('jump_statement -> RETURN SEMICOLON','jump_statement',2,'p_jump_statement_1','parser.py',221),
+  ('jump_statement -> RETURN expression SEMICOLON','jump_statement',3,'p_jump_statement_2','parser.py',226),
+  ('jump_statement -> BREAK SEMICOLON','jump_statement',2,'p_jump_statement_3','parser.py',231),
+  ('jump_statement -> CONTINUE SEMICOLON','jump_statement',2,'p_jump_statement_4','parser.py',236),
+  ('argument_expression_list -> expression','argument_expression_list',1,'p_argument_expression_list_1','parser.py',243),
+  ('argument_expression_list -> argument_expression_list COMMA expression','argument_expression_list',3,'p_argument_expression_list_2','parser.py',247),
+  ('expression -> additive_expression','expression',1,'p_expression','parser.py',254),
+  ('expression -> assign_expression','expression',1,'p_expression','parser.py',255),
+  ('assign_expression -> variable_expression ASSIGN expression','assign_expression',3,'p_assign_expression','parser.py',259),
+  ('assign_expression -> variable_expression ASSIGN_PLUS expression','assign_expression',3,'p_assign_expression','parser.py',260),
+  ('assign_expression -> variable_expression ASSIGN_MINUS expression','assign_expression',3,'p_assign_expression','parser.py',261),
+  ('assign_expression -> variable_expression ASSIGN_TIME expression','assign_expression',3,'p_assign_expression','parser.py',262),
+  ('assign_expression -> variable_expression ASSIGN_DIVIDE expression','assign_expression',3,'p_assign_expression','parser.py',263),
+  ('assign_expression -> variable_expression ASSIGN_MODULO expression','assign_expression',3,'p_assign_expression','parser.py',264),
+  ('additive_expression -> unary_expression','additive_expression',1,'p_additive_expression_1','parser.py',269),
+  ('additive_expression -> additive_expression EQ unary_expression','additive_expression',3,'p_additive_expression_2','parser.py',273),
+  ('additive_expression -> additive_expression NOT_EQ unary_expression','additive_expression',3,'p_additive_expression_2','parser.py',274),
+  ('additive_expression -> additive_expression LESS unary_expression','additive_expression',3,'p_additive_expression_2','parser.py',275),
+  ('additive_expression -> additive_expression GREATER unary_expression','additive_expression',3,'p_additive_expression_2','parser.py',276),
+  ('additive_expression -> additive_expression LESS_EQ unary_expression','additive_expression',3,'p_additive_expression_2','parser.py',277),
+  ('additive_expression -> additive_expression GREATER_EQ unary_expression','additive_expression',3,'p_additive_expression_2','parser.py',278),
+  ('additive_expression -> additive_expression PLUS unary_expression','additive_expression',3,'p_additive_expression_2','parser.py',279),
+  ('additive_expression -> additive_expression MINUS unary_expression','additive_expression',3,'p_additive_expression_2','parser.py',280),
+  ('additive_expression -> additive_expression DOUBLE_AMPERSAND unary_expression','additive_expression',3,'p_additive_expression_2','parser.py',281),
+  ('additive_expression -> additive_expression DOUBLE_PIPE unary_expression','additive_expression',3,'p_additive_expression_2','parser.py',282),
+  ('additive_expression -> additive_expression ASTERISK unary_expression','additive_expression',3,'p_additive_expression_2','parser.py',283),
+  ('additive_expression -> additive_expression DIVIDE unary_expression','additive_expression',3,'p_additive_expression_2','parser.py',284),
+  ('additive_expression -> additive_expression MODULO unary_expression','additive_expression',3,'p_additive_expression_2','parser.py',285),
+  ('unary_expression -> function_expression','unary_expression',1,'p_unary_expression_1','parser.py',290),
+  ('unary_expression -> const_expression','unary_expression',1,'p_unary_expression_1','parser.py',291),
+  ('unary_expression -> MINUS unary_expression','unary_expression',2,'p_unary_expression_2','parser.py',295),
+  ('unary_expression -> PLUS unary_expression','unary_expression',2,'p_unary_expression_2','parser.py',296),
+  ('unary_expression -> function_expression DOUBLE_PLUS','unary_expression',2,'p_unary_expression_3','parser.py',301),
+  ('unary_expression -> function_expression DOUBLE_MINUS','unary_expression',2,'p_unary_expression_3','parser.py',302),
+  ('unary_expression -> DOUBLE_PLUS function_expression','unary_expression',2,'p_unary_expression_4','parser.py',307),
+  ('unary_expression -> DOUBLE_MINUS function_expression','unary_expression',2,'p_unary_expression_4','parser.py',308),
+  ('function_expression -> variable_expression','function_expression',1,'p_function_expression_1','parser.py',313),
+  ('function_expression -> function_expression PAREN_L argument_expression_list PAREN_R','function_expression',4,'p_function_expression_2','parser.py',317),
+  ('function_expression -> function_expression PAREN_L PAREN_R','function_expression',3,'p_function_expression_3','parser.py',322),
+  ('variable_expression -> variable_simpe_expression','variable_expression',1,'p_variable_expression_1','parser.py',327),
+  ('variable_expression -> ASTERISK variable_simpe_expression','variable_expression',2,'p_variable_expression_2','parser.py',331),
+  ('variable_expression -> AMPERSAND variable_simpe_expression','variable_expression',2,'p_variable_expression_2','parser.py',332),
+  ('variable_simpe_expression -> ID','variable_simpe_expression',1,'p_variable_simpe_expression_1','parser.py',339),
+  ('variable_simpe_expression -> variable_simpe_expression BRACKET_L expression BRACKET_R','variable_simpe_expression',4,'p_variable_simpe_expression_2','parser.py',343),
+  ('variable_simpe_expression -> PAREN_L expression PAREN_R','variable_simpe_expression',3,'p_variable_simpe_expression_3','parser.py',348),
+  ('const_expression -> NUMBER_FLOAT','const_expression',1,'p_const_expression_1','parser.py',355),
+  ('const_expression -> NUMBER_INT','const_expression',1,'p_const_expression_2','parser.py',359),
+  ('const_expression -> CHARACTER','const_expression',1,'p_const_expression_3','parser.py',363),
+  ('const_expression -> STRING','const_expression',1,'p_const_expression_4','parser.py',367),
+  ('type -> INT','type',1,'p_type','parser.py',373),
+  ('type -> FLOAT','type',1,'p_type','parser.py',374),
+  ('type -> VOID','type',1,'p_type','parser.py',375),
+  ('type -> CHAR','type',1,'p_type','parser.py',376),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',380),
+]
@@ -0,0 +1,358 @@
+from model import ast
+
+TYPES = ('INT', 'FLOAT', 'VOID', 'CHAR')
+ASSIGN_OPS = ('ASSIGN', 'ASSIGN_PLUS', 'ASSIGN_MINUS', 'ASSIGN_TIME', 'ASSIGN_DIVIDE', 'ASSIGN_MODULO')
+VARIABLE_FIRST = ('ID', 'PAREN_L', 'ASTERISK', 'AMPERSAND')
+CONST_TOKENS = ('NUMBER_FLOAT', 'NUMBER_INT', 'CHARACTER', 'STRING')
+EXPRESSION_FIRST = VARIABLE_FIRST + CONST_TOKENS + ('MINUS', 'PLUS', 'DOUBLE_PLUS', 'DOUBLE_MINUS')
+END = '$end'
+
+# builds the same nodes, in the same order, as the actions of the PLY grammar in generator/parser.py
+class RecursiveDescentParser:
+  def __init__(self, parser):
+    self.error_handler = parser.p_error
+    # additive_expression chains every binary operator on one left recursive rule, so the precedence
+    # table never resolves a conflict there: all of them bind the same and associate to the left
+    self.binary_ops = set()
+    for precedence in parser.precedence:
+      if precedence[0] == 'left':
+        self.binary_ops.update(precedence[1:])
+    self.next_token = None
+    self.lookahead = []
+    self.token = None
+    self.kind = END
+
+  # tokens are pulled as needed, like yacc does, so the lexer reports nothing past a syntax error
+  def parse(self, data, lexer):
+    lexer.input(data)
+    self.next_token = lexer.token
+    self.lookahead = []
+    self.advance()
+    return self.root_section_opt()
+
+  def peek(self, offset=0):
+    if offset == 0:
+      return self.kind
+    while len(self.lookahead) < offset:
+      self.lookahead.append(self.next_token())
+    token = self.lookahead[offset - 1]
+    return END if token is None else token.type
+
+  def advance(self):
+    token = self.token
+    self.token = self.lookahead.pop(0) if self.lookahead else self.next_token()
+    self.kind = END if self.token is None else self.token.type
+    return token
+
+  def expect(self, type):
+    if self.kind != type:
+      self.error()
+    return self.advance()
+
+  def error(self):
+    self.error_handler(self.token)
+    raise SyntaxError
+
+  # Section
+
+  def root_section_opt(self):
+    if self.kind == END:
+      return ast.EmptyNode()
+    sector = self.root_sector()
+    root = ast.RootSection(sector, linespan=sector.linespan)
+    while self.kind != END:
+      sector = self.root_sector()
+      linespan = (root.linespan[0], sector.linespan[1])
+      root.add(sector)
+      root.update_linespan(linespan)
+    return root
+
+  def root_sector(self):
+    type = self.kind
+    if type in TYPES:
+      return self.declaration()
+    elif type == 'IF':
+      return self.conditional_statement()
+    elif type in ('WHILE', 'FOR'):
+      return self.loop_statement()
+    elif type in EXPRESSION_FIRST:
+      return self.expression_statement()
+    self.error()
+
+  def section_wrapper(self):
+    brace_l = self.expect('BRACE_L')
+    section = None if self.kind == 'BRACE_R' else self.section()
+    brace_r = self.expect('BRACE_R')
+    section.update_linespan((brace_l.lineno, brace_r.lineno))
+    return section
+
+  def section(self):
+    sector = self.sector()
+    section = ast.Section(sector, linespan=sector.linespan)
+    while self.kind != 'BRACE_R':
+      section.add(self.sector())
+    return section
+
+  def sector(self):
+    if self.kind in TYPES:
+      return self.declaration()
+    return self.statement()
+
+  # Declaration
+
+  def declaration(self):
+    type = self.type()
+    offset = 0
+    while self.peek(offset) == 'ASTERISK':
+      offset += 1
+    if self.peek(offset) == 'ID' and self.peek(offset + 1) == 'PAREN_L':
+      return self.function_declaration(type)
+    return self.variable_declaration(type)
+
+  def function_declaration(self, type):
+    declarator = self.function_declarator()
+    body = self.section_wrapper()
+    declarator.add_type(type)
+    linespan = (type.linespan[0], body.linespan[1])
+    return ast.FnDeclaration(declarator, body, linespan=linespan)
+
+  def function_declarator(self):
+    if self.kind == 'ASTERISK':
+      asterisk = self.advance()
+      declarator = self.function_declarator()
+      linespan = (asterisk.lineno, declarator.linespan[1])
+      declarator.add_type(ast.TypeNode(asterisk.value, linespan=linespan))
+      return declarator
+    return self.function_simple_declarator()
+
+  def function_simple_declarator(self):
+    id = self.expect('ID')
+    self.expect('PAREN_L')
+    if self.kind == 'PAREN_R' or (self.kind == 'VOID' and self.peek(1) == 'PAREN_R'):
+      if self.kind == 'VOID':
+        self.advance()
+      paren_r = self.advance()
+      return ast.FnDeclarator(id.value, ast.EmptyNode(), linespan=(id.lineno, paren_r.lineno))
+    parameter_group = self.parameter_group()
+    paren_r = self.expect('PAREN_R')
+    return ast.FnDeclarator(id.value, parameter_group, linespan=(id.lineno, paren_r.lineno))
+
+  def variable_declaration(self, type):
+    declarators = [self.variable_declarator()]
+    while self.kind == 'COMMA':
+      self.advance()
+      declarators.append(self.variable_declarator())
+    semicolon = self.expect('SEMICOLON')
+    vdl = ast.VaDeclarationList(linespan=(type.linespan[0], semicolon.lineno))
+    for variable_declarator in declarators:
+      variable_declarator.add_type(type)
+      vdl.add(variable_declarator)
+    return vdl
+
+  def variable_declarator(self):
+    if self.kind == 'ASTERISK':
+      asterisk = self.advance()
+      declarator = self.variable_declarator()
+      linespan = (asterisk.lineno, declarator.linespan[1])
+      declarator.add_type(ast.TypeNode(asterisk.value, linespan=linespan))
+      return declarator
+    return self.variable_simple_declarator()
+
+  def variable_simple_declarator(self):
+    id = self.expect('ID')
+    if self.kind != 'BRACKET_L':
+      return ast.VaDeclarator(id.value, linespan=(id.lineno, id.lineno))
+    self.advance()
+    size = self.expect('NUMBER_INT')
+    bracket_r = self.expect('BRACKET_R')
+    return ast.ArrayDeclarator(id.value, size.value, linespan=(id.lineno, bracket_r.lineno))
+
+  def parameter_group(self):
+    type = self.type()
+    declarator = self.variable_declarator()
+    declarator.add_type(type)
+    parameter_group = ast.ParameterGroup(declarator, linespan=(type.linespan[0], declarator.linespan[1]))
+    while self.kind == 'COMMA':
+      self.advance()
+      type = self.type()
+      declarator = self.variable_declarator()
+      linespan = (parameter_group.linespan[0], declarator.linespan[1])
+      declarator.add_type(type)
+      parameter_group.add(declarator)
+      parameter_group.update_linespan(linespan)
+    return parameter_group
+
+  # Statement
+
+  def statement(self):
+    type = self.kind
+    if type == 'IF':
+      return self.conditional_statement()
+    elif type in ('WHILE', 'FOR'):
+      return self.loop_statement()
+    elif type in ('RETURN', 'BREAK', 'CONTINUE'):
+      return self.jump_statement()
+    elif type in EXPRESSION_FIRST:
+      return self.expression_statement()
+    self.error()
+
+  def expression_statement(self):
+    expression = self.expression()
+    semicolon = self.expect('SEMICOLON')
+    expression.update_linespan((expression.linespan[0], semicolon.lineno))
+    return expression
+
+  def conditional_statement(self):
+    token = self.advance()
+    self.expect('PAREN_L')
+    expression = self.expression()
+    self.expect('PAREN_R')
+    then_section = self.section_wrapper()
+    if self.kind != 'ELSE':
+      linespan = (token.lineno, then_section.linespan[1])
+      return ast.ConditionalStatement(expression, then_section, ast.EmptyNode(), linespan=linespan)
+    self.advance()
+    else_section = self.section_wrapper()
+    linespan = (token.lineno, else_section.linespan[1])
+    return ast.ConditionalStatement(expression, then_section, else_section, linespan=linespan)
+
+  def loop_statement(self):
+    token = self.advance()
+    self.expect('PAREN_L')
+    if token.type == 'WHILE':
+      expression = self.expression()
+      self.expect('PAREN_R')
+      section = self.section_wrapper()
+      return ast.While(expression, section, linespan=(token.lineno, section.linespan[1]))
+    init_stmt = self.expression_statement()
+    expression = self.expression_statement()
+    term_stmt = self.expression()
+    self.expect('PAREN_R')
+    section = self.section_wrapper()
+    return ast.For(init_stmt, expression, term_stmt, section, linespan=(token.lineno, section.linespan[1]))
+
+  def jump_statement(self):
+    token = self.advance()
+    if token.type == 'RETURN' and self.kind != 'SEMICOLON':
+      expression = self.expression()
+      semicolon = self.expect('SEMICOLON')
+      return ast.Return(expression, linespan=(token.lineno, semicolon.lineno))
+    semicolon = self.expect('SEMICOLON')
+    linespan = (token.lineno, semicolon.lineno)
+    if token.type == 'RETURN':
+      return ast.Return(ast.EmptyNode(), linespan=linespan)
+    elif token.type == 'BREAK':
+      return ast.Break(linespan=linespan)
+    return ast.Continue(linespan=linespan)
+
+  # Expression
+
+  def argument_expression_list(self):
+    expression = self.expression()
+    argument_list = ast.ArgumentList(expression, linespan=expression.linespan)
+    while self.kind == 'COMMA':
+      self.advance()
+      expression = self.expression()
+      linespan = (argument_list.linespan[0], expression.linespan[1])
+      argument_list.add(expression)
+      argument_list.update_linespan(linespan)
+    return argument_list
+
+  # only an expression starting with a bare variable_expression can be an assignment
+  def expression(self):
+    if self.kind not in VARIABLE_FIRST:
+      return self.binary_expression(self.unary_expression())
+    variable = self.variable_expression()
+    if self.kind in ASSIGN_OPS:
+      op = self.advance()
+      expression = self.expression()
+      linespan = (variable.linespan[0], expression.linespan[1])
+      return ast.AssignOp(op.value, variable, expression, linespan=linespan)
+    return self.binary_expression(self.postfix_expression(self.function_expression(variable)))
+
+  def binary_expression(self, left):
+    while self.kind in self.binary_ops:
+      op = self.advance()
+      right = self.unary_expression()
+      left = ast.BinaryOp(op.value, left, right, linespan=(left.linespan[0], right.linespan[1]))
+    return left
+
+  def unary_expression(self):
+    type = self.kind
+    if type in ('MINUS', 'PLUS'):
+      op = self.advance()
+      expression = self.unary_expression()
+      return ast.UnaryOp(op.value, expression, linespan=(op.lineno, expression.linespan[1]))
+    elif type in ('DOUBLE_PLUS', 'DOUBLE_MINUS'):
+      op = self.advance()
+      expression = self.function_expression(self.variable_expression())
+      return ast.BinaryOp(op.value, expression, ast.Const(1), linespan=(op.lineno, expression.linespan[1]))
+    elif type in CONST_TOKENS:
+      return self.const_expression()
+    elif type in VARIABLE_FIRST:
+      return self.postfix_expression(self.function_expression(self.variable_expression()))
+    self.error()
+
+  def postfix_expression(self, expression):
+    if self.kind not in ('DOUBLE_PLUS', 'DOUBLE_MINUS'):
+      return expression
+    op = self.advance()
+    return ast.BinaryOp(op.value, expression, ast.Const(1), linespan=(expression.linespan[0], op.lineno))
+
+  def function_expression(self, expression):
+    while self.kind == 'PAREN_L':
+      self.advance()
+      if self.kind == 'PAREN_R':
+        paren_r = self.advance()
+        expression = ast.FnExpression(expression, ast.EmptyNode, linespan=(expression.linespan[0], paren_r.lineno))
+      else:
+        arguments = self.argument_expression_list()
+        paren_r = self.expect('PAREN_R')
+        expression = ast.FnExpression(expression, arguments, linespan=(expression.linespan[0], paren_r.lineno))
+    return expression
+
+  def variable_expression(self):
+    if self.kind not in ('ASTERISK', 'AMPERSAND'):
+      return self.variable_simple_expression()
+    op = self.advance()
+    expression = self.variable_simple_expression()
+    expression.set_pointer(op.value)
+    expression.update_linespan((op.lineno, expression.linespan[1]))
+    return expression
+
+  def variable_simple_expression(self):
+    type = self.kind
+    if type == 'ID':
+      id = self.advance()
+      expression = ast.VaExpression(id.value, linespan=(id.lineno, id.lineno))
+    elif type == 'PAREN_L':
+      paren_l = self.advance()
+      expression = self.expression()
+      paren_r = self.expect('PAREN_R')
+      expression.update_linespan((paren_l.lineno, paren_r.lineno))
+      expression.use_paren = True
+    else:
+      self.error()
+    while self.kind == 'BRACKET_L':
+      self.advance()
+      index = self.expression()
+      bracket_r = self.expect('BRACKET_R')
+      expression = ast.ArrayExpression(expression, index, linespan=(expression.linespan[0], bracket_r.lineno))
+    return expression
+
+  def const_expression(self):
+    token = self.advance()
+    linespan = (token.lineno, token.lineno)
+    if token.type == 'NUMBER_FLOAT':
+      return ast.Const(float(token.value), linespan=linespan)
+    elif token.type == 'NUMBER_INT':
+      return ast.Const(int(token.value), linespan=linespan)
+    return ast.Const(token.value[1:-1], linespan=linespan)
+
+  # ETC
+
+  def type(self):
+    if self.kind not in TYPES:
+      self.error()
+    token = self.advance()
+    return ast.TypeNode(token.value, linespan=(token.lineno, token.lineno))
@@ -0,0 +1,56 @@
+import re
+import itertools
+from collections import namedtuple
+from generator.lexer import Lexer
+
+# what yacc reads from a token, without building a LexToken per match
+class Token(namedtuple('Token', ('type', 'value', 'lineno', 'lexpos'))):
+  # no __slots__, yacc sets token.lexer on the token it hands to p_error
+  pass
+
+IGNORED = ('whitespace', 'remark')
+
+# same alternation order as ply.lex: function rules as defined, then string rules from the longest regex
+def rules(lexer):
+  functions = []
+  strings = []
+  for name, value in sorted(vars(lexer).items()):
+    if not name.startswith('t_') or name == 't_error':
+      continue
+    if isinstance(value, str):
+      strings.append((name[2:], value))
+    else:
+      functions.append((value.__code__.co_firstlineno, name[2:], value.__doc__))
+  functions.sort()
+  strings.sort(key=lambda rule: len(rule[1]), reverse=True)
+  return [(name, regex) for lineno, name, regex in functions] + strings + [('error', '.')]
+
+MASTER_REGEX = re.compile('|'.join('(?P<%s>%s)' % rule for rule in rules(Lexer)), re.VERBOSE)
+# for mapped sources, which generator.source only hands out when they are plain ascii
+BUFFER_MASTER_REGEX = re.compile(MASTER_REGEX.pattern.encode(), re.VERBOSE)
+
+class Scanner:
+  def __init__(self, data=''):
+    self.input(data)
+
+  def input(self, data):
+    self.lineno = 1
+    # scanned lazily like ply.lex, so nothing past a syntax error is reported, ending in None forever
+    self.token = itertools.chain(self.scan(data), itertools.repeat(None)).__next__
+
+  def scan(self, data):
+    reserved = Lexer.reserved
+    text = isinstance(data, str)
+    for m in (MASTER_REGEX if text else BUFFER_MASTER_REGEX).finditer(data):
+      kind = m.lastgroup
+      if kind in IGNORED:
+        continue
+      value = m.group() if text else m.group().decode('ascii')
+      if kind == 'newline':
+        self.lineno += len(value)
+      elif kind == 'error':
+        print("Illegal character '%s'" % value)
+      elif kind == 'ID':
+        yield Token(reserved.get(value, 'ID'), value, self.lineno, m.start())
+      else:
+        yield Token(kind, value, self.lineno, m.start())
@@ -0,0 +1,38 @@
+import os
+import re
+import mmap
+
+# sources this big are scanned in place through mmap instead of being read into a string
+MMAP_THRESHOLD = 2**20
+# text mode would translate or decode these, so such files are still read as text
+TEXT_ONLY_REGEX = re.compile(rb'[\r\x80-\xff]')
+
+# with Source(path) as data: data is the mapped file or, for small files and text=True, one string
+class Source:
+  def __init__(self, path, text=False):
+    self.path = path
+    self.text = text
+    self.mapped = None
+
+  def __enter__(self):
+    if not self.text and os.path.getsize(self.path) >= MMAP_THRESHOLD:
+      with open(self.path, 'rb') as f:
+        self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+      if TEXT_ONLY_REGEX.search(self.mapped) is None:
+        return self.mapped
+      self.close()
+    with open(self.path, 'r') as f:
+      return f.read()
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+  def close(self):
+    if self.mapped is None:
+      return
+    try:
+      self.mapped.close()
+    except BufferError:
+      # a scan stopped by a syntax error still holds a match, the map goes with it
+      pass
+    self.mapped = None
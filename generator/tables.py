@@ -0,0 +1,20 @@
+import os
+from generator.lexer import GENERATOR_DIR
+from generator.parser import Parser
+
+# usage: python -m generator.tables
+# parsers load the shipped tables without checking the grammar, so run this after editing lexer.py or parser.py
+
+TABLE_MODULES = ('lextab', 'parsetab')
+
+def build():
+  for name in TABLE_MODULES:
+    path = os.path.join(GENERATOR_DIR, name + '.py')
+    if os.path.exists(path):
+      os.remove(path)
+  Parser()
+  return [os.path.join(GENERATOR_DIR, name + '.py') for name in TABLE_MODULES]
+
+if __name__ == '__main__':
+  for path in build():
+    print(path)
@@ -1,35 +1,103 @@
 import sys
 import re
+import math
 import traceback
 import argparse
+from generator.cache import parse
 from generator.parser import Parser
-from visitor.interpreter_visitor import InterpreterVisitor
+from util.stats import globalStats
+from model.symbol_table import set_history_limit, HISTORY_FULL, HISTORY_OFF
+from model.breakpoint import LineIndex, parse_condition
+from visitor.interpreter_visitor import InterpreterVisitor, MEMO_SIZE
 from visitor.print_visitor import PrintVisitor
+from visitor.resolver_visitor import ResolverVisitor
+from visitor.bytecode_visitor import BytecodeVisitor
+from visitor.closure_visitor import ClosureVisitor
+from engine.vm import VirtualMachine
+from engine.closure import ClosureEngine
+from engine.python import PythonEngine
 
 CLI_NEXT_REGEX = re.compile('^next(?:\s(.+))?$')
 CLI_PRINT_REGEX = re.compile('^print(?:\s(.+))?$')
 CLI_TRACE_REGEX = re.compile('^trace(?:\s(\w+))?$')
+CLI_BACK_REGEX = re.compile('^back(?:\s(.+))?$')
+CLI_GOTO_REGEX = re.compile('^goto(?:\s(.+))?$')
+CLI_BREAK_REGEX = re.compile('^break(?:\s+(\S+)(?:\s+if\s+(.+))?)?$')
+CLI_WATCH_REGEX = re.compile('^watch(?:\s+(\S+)(?:\s+if\s+(.+))?)?$')
+CLI_CONTINUE_REGEX = re.compile('^continue$')
 CLI_EXIT_REGEX = re.compile('^exit$')
 LINE_RGEX = re.compile('^\d+$')
 VARIABLE_RGEX = re.compile('^[a-zA-Z_$][a-zA-Z_$0-9]*$')
+BATCH_BUFFER_SIZE = 2**20
+
+def history_limit(value):
+  if value == 'full':
+    return HISTORY_FULL
+  elif value == 'off':
+    return HISTORY_OFF
+  elif LINE_RGEX.search(value) is not None and int(value) > 0:
+    return int(value)
+  raise argparse.ArgumentTypeError("use 'full', 'off' or a number of values to keep")
 
 if __name__ == '__main__':
   parser = argparse.ArgumentParser(description='AST optimizer')
   parser.add_argument('input', type=str, metavar='Input_File', help='Input .c file path')
   parser.add_argument('--debug', action='store_true')
+  parser.add_argument('--engine', choices=['tree', 'vm', 'closure'], default='tree', help='Execution engine')
+  parser.add_argument('--run', '--batch', action='store_true', help='Run to the end without the CLI')
+  parser.add_argument('--fast', action='store_true', help='Transpile to python and run to the end without the CLI')
+  parser.add_argument('--no-cache', action='store_true', help='Parse the input again instead of loading the cached AST')
+  parser.add_argument('--lexer', choices=['scanner', 'ply'], default='scanner', help='Tokenizer feeding the parser')
+  parser.add_argument('--parser', choices=['lalr', 'rd'], default='lalr', help='PLY LALR tables or recursive descent')
+  parser.add_argument('--stats', action='store_true', help='Report parse peak memory on stderr')
+  parser.add_argument('--history', type=history_limit, default=HISTORY_FULL, metavar='{full,off,N}', help='Values kept per variable for trace')
+  parser.add_argument('--checkpoint-interval', type=int, default=1000, metavar='N', help='Lines between the tree engine checkpoints used by back and goto, 0 keeps only the start')
+  parser.add_argument('--memo-size', type=int, default=MEMO_SIZE, metavar='N', help='Results kept per pure function in a batch run of the tree engine, 0 turns memoization off')
   args = parser.parse_args()
+  set_history_limit(args.history)
+  if args.stats:
+    globalStats.enable()
 
   sys.setrecursionlimit(2**16)
+  # nobody reads the output interactively, so printf only fills a buffer flushed at exit
+  if args.run or args.fast:
+    sys.stdout = open(sys.stdout.fileno(), 'w', buffering=BATCH_BUFFER_SIZE, closefd=False)
+  flowVisitor = None
+  if args.fast:
+    flowVisitor = PythonEngine(args.input, debug=args.debug, cache=not args.no_cache, lexer=args.lexer, engine=args.parser)
+    flowVisitor.run()
+    globalStats.report()
+    sys.stdout.flush()
+    sys.exit(1 if flowVisitor.runtime_error else 0)
   try:
-    parser = Parser(debug=args.debug)
-    ast = parser.run(args.input)
+    globalStats.start_memory()
+    ast = parse(args.input, debug=args.debug, cache=not args.no_cache, lexer=args.lexer, engine=args.parser)
+    globalStats.stop_memory('Parse peak memory')
     if args.debug:
       printVisitor = PrintVisitor()
       ast.accept(printVisitor)
       print(printVisitor)
-    flowVisitor = InterpreterVisitor(debug=args.debug)
-    ast.accept(flowVisitor)
-    while True:
+    if args.engine == 'vm':
+      program = ast.accept(BytecodeVisitor())
+      if args.debug:
+        print(program)
+      flowVisitor = VirtualMachine(program, debug=args.debug)
+      run = flowVisitor.run
+    elif args.engine == 'closure':
+      flowVisitor = ClosureEngine(debug=args.debug)
+      flowVisitor.load(ast.accept(ClosureVisitor(flowVisitor)))
+      run = flowVisitor.run
+    else:
+      ast.accept(ResolverVisitor())
+      flowVisitor = InterpreterVisitor(debug=args.debug, batch=args.run, checkpoint_interval=args.checkpoint_interval, memo_size=args.memo_size)
+      flowVisitor.start(ast)
+      run = flowVisitor.run
+      lineIndex = LineIndex(ast)
+      conditionParser = None
+    if args.run:
+      flowVisitor.add_linenum(math.inf)
+    run()
+    while not args.run:
       input_str = input(str(flowVisitor.linenos) + '>>' if args.debug else '>>')
       if CLI_NEXT_REGEX.search(input_str):
         m = CLI_NEXT_REGEX.match(input_str)
@@ -39,7 +107,7 @@ if __name__ == '__main__':
           continue
         lines = 1 if lines_str is None else int(m.groups()[0])
         flowVisitor.add_linenum(lines)
-        ast.accept(flowVisitor)
+        run()
       elif CLI_PRINT_REGEX.search(input_str):
         m = CLI_PRINT_REGEX.match(input_str)
         symbol = m.groups()[0]
@@ -54,12 +122,95 @@ if __name__ == '__main__':
           print('Invalid typing of the variable name')
           continue
         flowVisitor.trace(symbol)
+      elif CLI_BACK_REGEX.search(input_str):
+        m = CLI_BACK_REGEX.match(input_str)
+        lines_str = m.groups()[0]
+        if lines_str is not None and LINE_RGEX.search(lines_str) is None:
+          print('Incorrect command usage : try ‘back [lines]')
+          continue
+        if args.engine != 'tree':
+          print('back needs the tree engine')
+          continue
+        flowVisitor.back(1 if lines_str is None else int(lines_str))
+      elif CLI_GOTO_REGEX.search(input_str):
+        m = CLI_GOTO_REGEX.match(input_str)
+        line_count_str = m.groups()[0]
+        if line_count_str is None or LINE_RGEX.search(line_count_str) is None:
+          print('Incorrect command usage : try ‘goto [line count]')
+          continue
+        if args.engine != 'tree':
+          print('goto needs the tree engine')
+          continue
+        flowVisitor.goto(int(line_count_str))
+      elif CLI_BREAK_REGEX.search(input_str):
+        m = CLI_BREAK_REGEX.match(input_str)
+        location, condition_str = m.groups()
+        if location is None or (LINE_RGEX.search(location) is None and VARIABLE_RGEX.search(location) is None):
+          print('Incorrect command usage : try ‘break [line|function] [if expression]')
+          continue
+        if args.engine != 'tree':
+          print('break needs the tree engine')
+          continue
+        if LINE_RGEX.search(location) is not None:
+          lineno = lineIndex.resolve(int(location))
+          if lineno is None:
+            print('No line to stop on from line {}'.format(location))
+            continue
+        else:
+          lineno = lineIndex.function_lineno(location)
+          if lineno is None:
+            print('Invisible function')
+            continue
+        condition = None
+        if condition_str is not None:
+          if conditionParser is None:
+            conditionParser = Parser(lexer=args.lexer, engine=args.parser)
+          condition = parse_condition(conditionParser, condition_str)
+          if condition is None:
+            print('Invalid breakpoint condition')
+            continue
+        breakpoint = flowVisitor.set_breakpoint(lineno, condition)
+        print('Breakpoint {} at line {}'.format(breakpoint.number, breakpoint.lineno))
+      elif CLI_WATCH_REGEX.search(input_str):
+        m = CLI_WATCH_REGEX.match(input_str)
+        symbol, condition_str = m.groups()
+        if symbol is None or VARIABLE_RGEX.search(symbol) is None:
+          print('Incorrect command usage : try ‘watch [symbol] [if expression]')
+          continue
+        if args.engine != 'tree':
+          print('watch needs the tree engine')
+          continue
+        if symbol not in lineIndex.names:
+          print('Invisible variable')
+          continue
+        condition = None
+        if condition_str is not None:
+          if conditionParser is None:
+            conditionParser = Parser(lexer=args.lexer, engine=args.parser)
+          condition = parse_condition(conditionParser, condition_str)
+          if condition is None:
+            print('Invalid watchpoint condition')
+            continue
+        watchpoint = flowVisitor.set_watchpoint(symbol, condition)
+        print('Watchpoint {} on {}'.format(watchpoint.number, watchpoint.symbol))
+      elif CLI_CONTINUE_REGEX.search(input_str):
+        if args.engine != 'tree':
+          print('continue needs the tree engine')
+          continue
+        flowVisitor.resume()
       elif CLI_EXIT_REGEX.search(input_str):
         break
       else:
-        print('Invalid command. use : next / next [number] / trace [symbol] / print [symbol] / exit')
+        print('Invalid command. use : next / next [number] / back / back [number] / goto [line count] / break [line|function] [if expression] / watch [symbol] [if expression] / continue / trace [symbol] / print [symbol] / exit')
   except:
     if args.debug:
       exc_info = sys.exc_info()
       traceback.print_exception(*exc_info)
       del exc_info
+  if isinstance(flowVisitor, InterpreterVisitor) and flowVisitor.batch:
+    globalStats.add('Memo hits', flowVisitor.memo_hits)
+    globalStats.add('Memo misses', flowVisitor.memo_misses)
+  globalStats.report()
+  if args.run:
+    sys.stdout.flush()
+    sys.exit(1 if flowVisitor is None or flowVisitor.runtime_error else 0)
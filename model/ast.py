@@ -1,18 +1,59 @@
-from util.helper import getVisitorFunc, props
+import sys
+from util.helper import dispatchTables, props
 
-class Node():
-  def __init__(self, linespan=None):
-    self.linespan = linespan
+LINE_BITS = 32
+LINE_MASK = (1 << LINE_BITS) - 1
+
+# what the optimizer passes write on a node, allocated on the first write
+class NodeFlags:
+  __slots__ = ('visited', 'terminated', 'result', 'used')
+
+  def __init__(self):
     self.visited = False
     self.terminated = False
     self.result = None
+    self.used = True
+
+def flag(name, default):
+  def get(node):
+    flags = node.flags
+    return default if flags is None else getattr(flags, name)
+
+  def set(node, value):
+    if node.flags is None:
+      node.flags = NodeFlags()
+    setattr(node.flags, name, value)
+  return property(get, set)
+
+class Node():
+  __slots__ = ('packed_linespan', 'use_paren', 'parent', 'flags')
+  default_reachable = False
+
+  def __init__(self, linespan=None):
+    self.linespan = linespan
     self.use_paren = False
     self.parent = None
-    self.used = True
-    self.default_reachable = False
+    self.flags = None
+
+  visited = flag('visited', False)
+  terminated = flag('terminated', False)
+  result = flag('result', None)
+  used = flag('used', True)
+
+  # (first line, last line) kept in one int
+  @property
+  def linespan(self):
+    packed_linespan = self.packed_linespan
+    if packed_linespan is None:
+      return None
+    return packed_linespan >> LINE_BITS, packed_linespan & LINE_MASK
+
+  @linespan.setter
+  def linespan(self, linespan):
+    self.packed_linespan = None if linespan is None else linespan[0] << LINE_BITS | linespan[1]
 
   def accept(self, visitor):
-    return getVisitorFunc(visitor, self.__class__)(self)
+    return dispatchTables[visitor.__class__][self.__class__](visitor, self)
 
   def is_empty(self):
     return False
@@ -25,7 +66,7 @@ class Node():
     return new_node
 
   def get_excutable_lineno(self):
-    return self.linespan[1]
+    return self.packed_linespan & LINE_MASK
 
   def need_semi(self):
     return True
@@ -48,6 +89,8 @@ class Node():
     return self.default_reachable or self.visited or self.used
 
 class ArrayNode(Node):
+  __slots__ = ('childs',)
+
   def __init__(self, child=None, linespan=None):
     super().__init__(linespan=linespan)
     self.childs = []
@@ -65,6 +108,8 @@ class ArrayNode(Node):
     return new_node
 
 class EmptyNode(Node):
+  __slots__ = ()
+
   def is_empty(self):
     return True
 
@@ -73,12 +118,14 @@ class EmptyNode(Node):
     return new_node
 
 class TypeNode(Node):
+  __slots__ = ('types',)
+  default_reachable = True
+
   def __init__(self, type=None, linespan=None):
     super().__init__(linespan=linespan)
     self.types = []
     if (type is not None):
       self.add_type(type)
-    self.default_reachable = True
 
   def get_type(self):
     if (len(self.types) > 0):
@@ -86,7 +133,7 @@ class TypeNode(Node):
     return None
 
   def add_type(self, type):
-    self.types.append(type)
+    self.types.append(sys.intern(type) if type is not None else type)
 
   def clone(self):
     new_node = self.__class__(linespan=self.linespan)
@@ -95,6 +142,8 @@ class TypeNode(Node):
     return new_node
 
 class Const(Node):
+  __slots__ = ('value',)
+
   def __init__(self, value, linespan=None):
     super().__init__(linespan=linespan)
     self.value = value
@@ -103,22 +152,26 @@ class Const(Node):
     return self.__class__(self.value, linespan=self.linespan)
 
 class BaseSection(ArrayNode):
+  __slots__ = ('names',)
+
   def __init__(self, child=None, linespan=None):
     super().__init__(child=child, linespan=linespan)
-    self.scope_pushed = False
+    self.names = None # slot names of the scope, set by ResolverVisitor
 
   def get_excutable_lineno(self):
-    return self.linespan[0]
+    return self.packed_linespan >> LINE_BITS
 
 class RootSection(BaseSection):
-  def __init__(self, child=None, linespan=None):
-    super().__init__(child=child, linespan=linespan)
-    self.default_reachable = True
+  __slots__ = ()
+  default_reachable = True
 
 class Section(BaseSection):
-  pass
+  __slots__ = ()
 
 class Declaration(Node):
+  __slots__ = ('type', 'name', 'declarator', 'slot')
+  default_reachable = True
+
   def __init__(self, declarator, linespan=None):
     super().__init__(linespan=linespan)
     self.type = declarator.type
@@ -126,18 +179,22 @@ class Declaration(Node):
     self.name = declarator.name
     self.declarator = declarator
     self.declarator.parent = self
-    self.default_reachable = True
+    self.slot = None
 
   def clone(self):
     return self.__class__(self.declarator.clone(), linespan=self.linespan)
 
 class FnDeclaration(Declaration):
+  __slots__ = ('parameterGroup', 'body', 'names', 'pure')
+
   def __init__(self, declarator, body, linespan=None):
     super().__init__(declarator, linespan=linespan)
     self.parameterGroup = declarator.parameterGroup
     self.parameterGroup.parent = self
     self.body = body
     self.body.parent = self
+    self.names = None
+    self.pure = None # no side effects and no outside reads, set by PurityVisitor
 
   def need_semi(self):
     return False
@@ -146,14 +203,17 @@ class FnDeclaration(Declaration):
     return self.__class__(self.declarator.clone(), self.body.clone(), linespan=self.linespan)
 
 class VaDeclarationList(ArrayNode):
-  pass
+  __slots__ = ()
 
 class Declarator(Node):
+  __slots__ = ('type', 'name', 'slot')
+  default_reachable = True
+
   def __init__(self, name, linespan=None):
     super().__init__(linespan=linespan)
     self.type = None
-    self.name = name
-    self.default_reachable = True
+    self.name = sys.intern(name)
+    self.slot = None
 
   def add_type(self, typeNode):
     if self.type is None:
@@ -169,6 +229,8 @@ class Declarator(Node):
     return new_node
 
 class FnDeclarator(Declarator):
+  __slots__ = ('parameterGroup',)
+
   def __init__(self, name, parameterGroup=None, linespan=None):
     super().__init__(name, linespan=linespan)
     self.parameterGroup = parameterGroup
@@ -181,9 +243,11 @@ class FnDeclarator(Declarator):
     return new_node
 
 class VaDeclarator(Declarator):
-  pass
+  __slots__ = ()
 
 class ArrayDeclarator(Declarator):
+  __slots__ = ('size',)
+
   def __init__(self, name, size, linespan=None):
     super().__init__(name, linespan=linespan)
     self.size = int(size)
@@ -195,11 +259,12 @@ class ArrayDeclarator(Declarator):
     return new_node
 
 class ParameterGroup(ArrayNode):
-  def __init__(self, child=None, linespan=None):
-    super().__init__(child=child, linespan=linespan)
-    self.default_reachable = True
+  __slots__ = ()
+  default_reachable = True
 
 class ConditionalStatement(Node):
+  __slots__ = ('expr', 'then_section', 'else_section')
+
   def __init__(self, expr, then_section, else_section, linespan=None):
     super().__init__(linespan=linespan)
     self.expr = expr
@@ -210,7 +275,7 @@ class ConditionalStatement(Node):
     self.else_section.parent = self
 
   def get_excutable_lineno(self):
-    return self.expr.linespan[1]
+    return self.expr.packed_linespan & LINE_MASK
 
   def need_semi(self):
     return False
@@ -219,6 +284,8 @@ class ConditionalStatement(Node):
     return self.__class__(self.expr.clone(), self.then_section.clone(), self.else_section.clone(), linespan=self.linespan)
 
 class LoopStatement(Node):
+  __slots__ = ('init_stmt', 'expr', 'term_stmt', 'section', 'names', 'origin_expr', 'origin_section', 'origin_term_stmt')
+
   def __init__(self, expr, section, linespan=None):
     super().__init__(linespan=linespan)
     self.init_stmt = None
@@ -227,9 +294,13 @@ class LoopStatement(Node):
     self.term_stmt = None
     self.section = section
     self.section.parent = self
+    self.names = None
+    self.origin_expr = None
+    self.origin_section = None
+    self.origin_term_stmt = None
 
   def get_excutable_lineno(self):
-    return self.expr.linespan[1]
+    return self.expr.packed_linespan & LINE_MASK
 
   def need_semi(self):
     return False
@@ -238,6 +309,8 @@ class LoopStatement(Node):
     return self.__class__(self.expr.clone(), self.section.clone(), linespan=self.linespan)
 
 class While(LoopStatement):
+  __slots__ = ()
+
   def save_origin(self):
     self.origin_expr = self.expr.clone()
     self.origin_expr.parent = self
@@ -251,18 +324,17 @@ class While(LoopStatement):
     self.section.parent = self
 
 class For(LoopStatement):
+  __slots__ = ()
+
   def __init__(self, init_stmt, expr, term_stmt, section, linespan=None):
     super().__init__(expr, section, linespan=linespan)
     self.init_stmt = init_stmt
     self.init_stmt.parent = self
     self.term_stmt = term_stmt
     self.term_stmt.parent = self
-    self.origin_expr = None
-    self.origin_section = None
-    self.origin_term_stmt = None
 
   def get_excutable_lineno(self):
-    return self.term_stmt.linespan[1]
+    return self.term_stmt.packed_linespan & LINE_MASK
 
   def save_origin(self):
     self.origin_expr = self.expr.clone()
@@ -284,9 +356,11 @@ class For(LoopStatement):
     return self.__class__(self.init_stmt.clone(), self.expr.clone(), self.term_stmt.clone(), self.section.clone(), linespan=self.linespan)
 
 class JumpStatement(Node):
-  pass
+  __slots__ = ()
 
 class Return(JumpStatement):
+  __slots__ = ('expr',)
+
   def __init__(self, expr, linespan=None):
     super().__init__(linespan=linespan)
     self.expr = expr
@@ -296,27 +370,31 @@ class Return(JumpStatement):
     return self.__class__(self.expr.clone(), linespan=self.linespan)
 
 class Break(JumpStatement):
-  pass
+  __slots__ = ()
 
 class Continue(JumpStatement):
-  pass
+  __slots__ = ()
 
 class ArgumentList(ArrayNode):
-  pass
+  __slots__ = ()
 
 class BinaryOp(Node):
+  __slots__ = ('left', 'right', 'op')
+
   def __init__(self, op, left, right, linespan=None):
     super().__init__(linespan=linespan)
     self.left = left
     self.left.parent = self
     self.right = right
     self.right.parent = self
-    self.op = op
+    self.op = sys.intern(op)
 
   def clone(self):
     return self.__class__(self.op, self.left.clone(), self.right.clone(), linespan=self.linespan)
 
 class AssignOp(BinaryOp):
+  __slots__ = ()
+
   def __init__(self, op, left, right, linespan=None):
     super().__init__(op, left, right, linespan=linespan)
     self.op = '='
@@ -337,33 +415,43 @@ class AssignOp(BinaryOp):
     self.right.parent = self
 
 class UnaryOp(Node):
+  __slots__ = ('expr', 'op')
+
   def __init__(self, op, expr, linespan=None):
     super().__init__(linespan=linespan)
     self.expr = expr
     self.expr.parent = self
-    self.op = op
+    self.op = sys.intern(op)
 
   def clone(self):
     return self.__class__(self.op, self.expr.clone(), linespan=self.linespan)
 
 class FnExpression(Node):
+  __slots__ = ('expr', 'arguments')
+
   def __init__(self, expr, arguments, linespan=None):
     super().__init__(linespan=linespan)
     self.expr = expr
     self.expr.parent = self
     self.arguments = arguments
-    self.arguments.parent = self
-    self.body = None # body will be cloned on FlowVisitor
-    self.initialized = False
+    # a call without arguments holds the EmptyNode class itself
+    if isinstance(arguments, Node):
+      self.arguments.parent = self
 
   def clone(self):
     return self.__class__(self.expr.clone(), self.arguments.clone(), linespan=self.linespan)
 
 class VaExpression(Node):
+  __slots__ = ('name', 'pointer', 'depth', 'slot', 'cast')
+
   def __init__(self, name, linespan=None):
     super().__init__(linespan=linespan)
-    self.name = name
+    self.name = sys.intern(name)
     self.pointer = None
+    # (depth, slot) of the binding and its cast, set by ResolverVisitor
+    self.depth = None
+    self.slot = None
+    self.cast = None
 
   def set_pointer(self, type):
     self.pointer = type
@@ -374,6 +462,8 @@ class VaExpression(Node):
     return new_node
 
 class ArrayExpression(Node):
+  __slots__ = ('expr', 'index')
+
   def __init__(self, expr, index, linespan=None):
     super().__init__(linespan=linespan)
     self.expr = expr
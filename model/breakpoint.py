@@ -0,0 +1,77 @@
+import io
+import bisect
+import contextlib
+from model import ast
+from model.flat_ast import FIELDS
+
+# a condition is parsed as the only statement of a function body
+CONDITION_HEADER = 'void f(){\n'
+CONDITION_FOOTER = ';\n}'
+EXPRESSIONS = (ast.BinaryOp, ast.UnaryOp, ast.FnExpression, ast.VaExpression, ast.ArrayExpression, ast.Const)
+
+class Breakpoint:
+  def __init__(self, number, lineno, condition=None):
+    self.number = number
+    self.lineno = lineno
+    self.condition = condition
+
+class Watchpoint:
+  def __init__(self, number, symbol, condition=None):
+    self.number = number
+    self.symbol = symbol
+    self.condition = condition
+
+# lines the tree engine can stop on, those of statements, loop conditions and sections,
+# the top level functions and the names declared in any scope
+class LineIndex:
+  def __init__(self, root):
+    lines = set()
+    self.functions = {}
+    self.names = set()
+    stack = [root]
+    while stack:
+      node = stack.pop()
+      self.names.update(getattr(node, 'names', None) or ())
+      if node.__class__ is ast.Section:
+        lines.update(child.get_excutable_lineno() for child in node.childs)
+      elif isinstance(node, ast.FnDeclaration):
+        self.functions[node.name] = node
+      elif isinstance(node, ast.ConditionalStatement):
+        lines.update(section.get_excutable_lineno() for section in (node.then_section, node.else_section) if not section.is_empty())
+      elif isinstance(node, ast.LoopStatement):
+        lines.add(node.expr.get_excutable_lineno())
+        lines.add(node.section.get_excutable_lineno())
+      if isinstance(node, ast.ArrayNode):
+        stack.extend(node.childs)
+        continue
+      for field in FIELDS.get(node.__class__, ()):
+        child = getattr(node, field)
+        if isinstance(child, ast.Node):
+          stack.append(child)
+    self.lines = sorted(lines)
+
+  # the first line from lineno on that can be stopped on, None past the last one
+  def resolve(self, lineno):
+    i = bisect.bisect_left(self.lines, lineno)
+    return self.lines[i] if i < len(self.lines) else None
+
+  def function_lineno(self, name):
+    function = self.functions.get(name)
+    if function is None:
+      return None
+    return self.resolve(function.body.linespan[0])
+
+# None when text is not a single expression
+def parse_condition(parser, text):
+  output = io.StringIO()
+  with contextlib.redirect_stdout(output):
+    try:
+      root = parser.parse(CONDITION_HEADER + text + CONDITION_FOOTER)
+    except Exception:
+      return None
+  if output.getvalue() or len(root.childs) != 1 or not isinstance(root.childs[0], ast.FnDeclaration):
+    return None
+  if len(root.childs[0].body.childs) != 1:
+    return None
+  condition = root.childs[0].body.childs[0]
+  return condition if isinstance(condition, EXPRESSIONS) else None
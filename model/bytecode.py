@@ -0,0 +1,112 @@
+import operator
+
+# Stack
+
+CONST = 0
+POP = 1
+NEW_ARRAY = 2
+
+# Variable
+
+LOAD_LOCAL = 10
+LOAD_GLOBAL = 11
+STORE_LOCAL = 12
+STORE_GLOBAL = 13
+DEFINE_LOCAL = 14
+LOAD_INDEX = 15
+STORE_INDEX = 16
+
+# Operator
+
+BINARY = 20
+COMPARE = 21
+NEGATE = 22
+
+# Flow
+
+JUMP = 30
+JUMP_IF_FALSE = 31
+CALL = 32
+RETURN = 33
+HALT = 34
+FAIL = 35
+
+# Line counting
+
+LINE = 40
+LINE_COMPOUND = 41
+LINE_TO = 42
+LINE_SET = 43
+LINE_PUSH = 44
+LINE_POP = 45
+
+OPNAMES = {value: name for name, value in globals().items() if name.isupper() and isinstance(value, int)}
+
+BINARY_OPERATORS = {
+  '+': operator.add,
+  '-': operator.sub,
+  '*': operator.mul,
+  '/': operator.truediv,
+  '%': operator.mod,
+  '++': operator.add,
+  '--': operator.sub,
+  '&&': lambda left, right: left and right,
+  '||': lambda left, right: left or right,
+}
+
+COMPARE_OPERATORS = {
+  '==': operator.eq,
+  '!=': operator.ne,
+  '<': operator.lt,
+  '>': operator.gt,
+  '<=': operator.le,
+  '>=': operator.ge,
+}
+
+class Code:
+  def __init__(self, name, node=None):
+    self.name = name
+    self.node = node
+    self.lineno = 1
+    self.parameters = []
+    self.instructions = []
+    self.linenos = []
+    self.names = []
+
+  def add_local(self, name):
+    self.names.append(name)
+    return len(self.names) - 1
+
+  def get_nlocals(self):
+    return len(self.names)
+
+  def emit(self, op, arg=None, lineno=0):
+    self.instructions.append((op, arg))
+    self.linenos.append(lineno)
+    return len(self.instructions) - 1
+
+  def patch(self, index, arg):
+    self.instructions[index] = (self.instructions[index][0], arg)
+
+  def position(self):
+    return len(self.instructions)
+
+  def __str__(self):
+    s = '{}:\n'.format(self.name)
+    for i, (op, arg) in enumerate(self.instructions):
+      s += '  {:4d} {:4d} {:16s}{}\n'.format(self.linenos[i], i, OPNAMES[op], '' if arg is None else arg)
+    return s
+
+class Program:
+  def __init__(self, main):
+    self.main = main
+    self.codes = {}
+
+  def add_code(self, node, code):
+    self.codes[node] = code
+
+  def get_code(self, node):
+    return self.codes[node]
+
+  def __str__(self):
+    return '\n'.join(code.__str__() for code in [self.main] + list(self.codes.values()))
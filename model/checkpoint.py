@@ -0,0 +1,49 @@
+# a paused InterpreterVisitor. histories only grow, so a list one keeps its length and shares its logs,
+# scopes, deques and arrays are copied and written back in place because frames and logs hold them
+class Checkpoint:
+  def __init__(self, visitor):
+    self.line_count = visitor.line_count
+    self.linenos = list(visitor.linenos)
+    self.global_scope = visitor.global_scope
+    self.scopes = list(visitor.scopes)
+    self.frames = [frame.copy() for frame in visitor.continuation]
+    self.scope_states = []
+    self.history_states = []
+    self.arrays = []
+    seen = set()
+    for scope in self.scopes:
+      while scope is not None and id(scope) not in seen:
+        seen.add(id(scope))
+        self.scope_states.append((scope, list(scope.values), list(scope.histories)))
+        for history in scope.histories:
+          if history is not None:
+            self.history_states.append((history, len(history.history) if history.history.__class__ is list else list(history.history)))
+        self.save_arrays(scope.values, seen)
+        scope = scope.parent
+    for frame in self.frames:
+      self.save_arrays(frame.values, seen)
+
+  def save_arrays(self, values, seen):
+    for value in values:
+      if value.__class__ is list and id(value) not in seen:
+        seen.add(id(value))
+        self.arrays.append((value, list(value)))
+
+  def restore(self, visitor):
+    for scope, values, histories in self.scope_states:
+      scope.values[:] = values
+      scope.histories[:] = histories
+    for history, state in self.history_states:
+      if state.__class__ is int:
+        del history.history[state:]
+      else:
+        history.history.clear()
+        history.history.extend(state)
+    for array, values in self.arrays:
+      array[:] = values
+    visitor.line_count = self.line_count
+    visitor.line_num = 0
+    visitor.linenos = list(self.linenos)
+    visitor.global_scope = self.global_scope
+    visitor.scopes = list(self.scopes)
+    visitor.continuation = [frame.copy() for frame in self.frames]
@@ -0,0 +1,207 @@
+from array import array
+from model import ast
+
+NONE = -1
+NO_LINE = 0xFFFFFFFF
+
+USE_PAREN = 1
+USED = 2
+VISITED = 4
+
+# kind 0 stands for a missing child, kind 1 for the EmptyNode class a call without arguments holds
+ABSENT = 0
+EMPTY_CLASS = 1
+KINDS = (None, None, ast.EmptyNode, ast.TypeNode, ast.Const, ast.RootSection, ast.Section, ast.FnDeclaration,
+  ast.VaDeclarationList, ast.FnDeclarator, ast.VaDeclarator, ast.ArrayDeclarator, ast.ParameterGroup,
+  ast.ConditionalStatement, ast.While, ast.For, ast.Return, ast.Break, ast.Continue, ast.ArgumentList,
+  ast.BinaryOp, ast.AssignOp, ast.UnaryOp, ast.FnExpression, ast.VaExpression, ast.ArrayExpression)
+KIND = {cls: kind for kind, cls in enumerate(KINDS) if cls is not None}
+
+# fixed children in order, ArrayNode kinds keep their childs instead
+FIELDS = {
+  ast.FnDeclaration: ('declarator', 'body'),
+  ast.FnDeclarator: ('type', 'parameterGroup'),
+  ast.VaDeclarator: ('type',),
+  ast.ArrayDeclarator: ('type',),
+  ast.ConditionalStatement: ('expr', 'then_section', 'else_section'),
+  ast.While: ('expr', 'section'),
+  ast.For: ('init_stmt', 'expr', 'term_stmt', 'section'),
+  ast.Return: ('expr',),
+  ast.BinaryOp: ('left', 'right'),
+  ast.AssignOp: ('left', 'right'),
+  ast.UnaryOp: ('expr',),
+  ast.FnExpression: ('expr', 'arguments'),
+  ast.ArrayExpression: ('expr', 'index'),
+}
+
+# one row per node in preorder, so a subtree is the rows from its index up to the next sibling of an ancestor
+class FlatAst:
+  def __init__(self):
+    self.kind = array('B')
+    self.op = array('i')
+    self.first_child = array('i')
+    self.next_sibling = array('i')
+    self.line_start = array('I')
+    self.line_end = array('I')
+    self.const_value_index = array('i')
+    self.flags = array('B')
+    # ops, pointers and names, then const values, type lists and array sizes
+    self.strings = []
+    self.values = []
+    self.string_index = {}
+    self.value_index = {}
+
+  def __len__(self):
+    return len(self.kind)
+
+  def __getstate__(self):
+    return {name: value for name, value in vars(self).items() if name not in ('string_index', 'value_index')}
+
+  def __setstate__(self, state):
+    vars(self).update(state)
+    self.string_index = {string: index for index, string in enumerate(self.strings)}
+    self.value_index = {(value.__class__, value): index for index, value in enumerate(self.values)}
+
+  def intern_string(self, string):
+    if string is None:
+      return NONE
+    index = self.string_index.get(string)
+    if index is None:
+      index = self.string_index[string] = len(self.strings)
+      self.strings.append(string)
+    return index
+
+  def intern_value(self, value):
+    key = (value.__class__, value)
+    index = self.value_index.get(key)
+    if index is None:
+      index = self.value_index[key] = len(self.values)
+      self.values.append(value)
+    return index
+
+  def children(self, index):
+    child = self.first_child[index]
+    next_sibling = self.next_sibling
+    while child != NONE:
+      yield child
+      child = next_sibling[child]
+
+  def get_op(self, index):
+    op = self.op[index]
+    return None if op == NONE else self.strings[op]
+
+  def get_value(self, index):
+    return self.values[self.const_value_index[index]]
+
+  def get_linespan(self, index):
+    if self.line_start[index] == NO_LINE:
+      return None
+    return self.line_start[index], self.line_end[index]
+
+  def append(self, kind, op=NONE, value=NONE, linespan=None, flags=0):
+    index = len(self.kind)
+    self.kind.append(kind)
+    self.op.append(op)
+    self.first_child.append(NONE)
+    self.next_sibling.append(NONE)
+    self.line_start.append(NO_LINE if linespan is None else linespan[0])
+    self.line_end.append(NO_LINE if linespan is None else linespan[1])
+    self.const_value_index.append(value)
+    self.flags.append(flags)
+    return index
+
+  @classmethod
+  def from_tree(cls, root):
+    flat = cls()
+    flat.add(root)
+    return flat
+
+  def add(self, node):
+    if node is None:
+      return self.append(ABSENT)
+    if node is ast.EmptyNode:
+      return self.append(EMPTY_CLASS)
+    node_class = node.__class__
+    op = NONE
+    value = NONE
+    if node_class is ast.TypeNode:
+      value = self.intern_value(tuple(node.types))
+    elif node_class is ast.Const:
+      value = self.intern_value(node.value)
+    elif node_class is ast.VaExpression:
+      op = self.intern_string(node.name)
+      value = self.intern_value(node.pointer)
+    elif isinstance(node, ast.Declarator):
+      op = self.intern_string(node.name)
+      if node_class is ast.ArrayDeclarator:
+        value = self.intern_value(node.size)
+    elif isinstance(node, (ast.BinaryOp, ast.UnaryOp)):
+      op = self.intern_string(node.op)
+    flags = (node.use_paren and USE_PAREN) | (node.used and USED) | (node.visited and VISITED)
+    index = self.append(KIND[node_class], op, value, node.linespan, flags)
+
+    if isinstance(node, ast.ArrayNode):
+      childs = node.childs
+    else:
+      childs = [getattr(node, field) for field in FIELDS.get(node_class, ())]
+    previous = NONE
+    for child in childs:
+      child_index = self.add(child)
+      if previous == NONE:
+        self.first_child[index] = child_index
+      else:
+        self.next_sibling[previous] = child_index
+      previous = child_index
+    return index
+
+  def to_tree(self):
+    return self.build(0)
+
+  def build(self, index):
+    kind = self.kind[index]
+    if kind == ABSENT:
+      return None
+    if kind == EMPTY_CLASS:
+      return ast.EmptyNode
+    node_class = KINDS[kind]
+    childs = [self.build(child) for child in self.children(index)]
+    linespan = self.get_linespan(index)
+
+    if issubclass(node_class, ast.ArrayNode):
+      node = node_class(linespan=linespan)
+      for child in childs:
+        node.add(child)
+    elif node_class is ast.EmptyNode or issubclass(node_class, ast.JumpStatement) and node_class is not ast.Return:
+      node = node_class(linespan=linespan)
+    elif node_class is ast.TypeNode:
+      node = node_class(linespan=linespan)
+      for type in self.get_value(index):
+        node.add_type(type)
+    elif node_class is ast.Const:
+      node = node_class(self.get_value(index), linespan=linespan)
+    elif node_class is ast.VaExpression:
+      node = node_class(self.get_op(index), linespan=linespan)
+      node.set_pointer(self.get_value(index))
+    elif issubclass(node_class, ast.Declarator):
+      type = childs.pop(0)
+      if node_class is ast.ArrayDeclarator:
+        node = node_class(self.get_op(index), self.get_value(index), linespan=linespan)
+      else:
+        node = node_class(self.get_op(index), *childs, linespan=linespan)
+      if type is not None:
+        node.add_type(type)
+    elif node_class is ast.AssignOp:
+      # already desugared, so the right side is kept as it is
+      node = node_class('=', *childs, linespan=linespan)
+    elif issubclass(node_class, (ast.BinaryOp, ast.UnaryOp)):
+      node = node_class(self.get_op(index), *childs, linespan=linespan)
+    else:
+      node = node_class(*childs, linespan=linespan)
+
+    flags = self.flags[index]
+    node.use_paren = bool(flags & USE_PAREN)
+    if not flags & USED:
+      node.used = False
+    if flags & VISITED:
+      node.visited = True
+    return node
@@ -1,4 +1,23 @@
+from collections import deque
+
+# history limit for new symbols : None keeps every value, N keeps the last N
+HISTORY_FULL = None
+HISTORY_OFF = 1
+history_limit = HISTORY_FULL
+
+# hooks called with (history, old value, new value) after a write to a watched symbol
+watches = {}
+
+def set_history_limit(limit):
+  global history_limit
+  history_limit = limit
+
+def set_watch(symbol, hook):
+  watches[symbol] = hook
+
 class Log:
+  __slots__ = ('value', 'lineno', 'assign_node')
+
   def __init__(self, lineno, value=None, assign_node=None):
     self.value = value
     self.lineno = lineno
@@ -12,6 +31,9 @@ class History:
   def __init__(self, symbol):
     self.symbol = symbol
     self.history = []
+    if history_limit is not HISTORY_FULL:
+      self.history = deque(maxlen=history_limit)
+    self.watch = watches.get(symbol) if watches else None
 
   def add(self, lineno, value, assign_node):
     self.history.append(Log(lineno, value, assign_node))
@@ -19,9 +41,12 @@ class History:
   def get(self):
     return self.history[-1].value
 
+  # a traced symbol keeps its full history from then on
   def trace(self):
     for log in self.history:
       print('{} = {}'.format(self.symbol, log.__str__()))
+    if self.history.__class__ is deque:
+      self.history = list(self.history)
 
   def set_used(self, used):
     if self.history[-1].assign_node is not None:
@@ -55,43 +80,105 @@ class SymbolTable:
   def __init__(self, node, inherit_symbol_table=None):
     self.node = node
     self.table = {}
-    if (inherit_symbol_table):
-      self.table.update(inherit_symbol_table.table)
+    self.parent = inherit_symbol_table
+
+  # walk the scope chain instead of copying the parent table on every push
+  def lookup(self, symbol):
+    scope = self
+    while symbol not in scope.table:
+      scope = scope.parent
+      if scope is None:
+        raise KeyError(symbol)
+    return scope.table[symbol]
 
   def define(self, symbol, type, lineno, value=None, assign_node=None):
     self.table[symbol] = SymbolTableEntry(symbol, type)
     self.add(symbol, lineno, value, assign_node)
 
   def add(self, symbol, lineno, value, assign_node=None):
-    self.table[symbol].add_log(lineno, value, assign_node)
+    self.lookup(symbol).add_log(lineno, value, assign_node)
 
   def has(self, symbol):
-    return symbol in self.table
+    scope = self
+    while scope is not None:
+      if symbol in scope.table:
+        return True
+      scope = scope.parent
+    return False
 
   def get(self, symbol):
-    return self.table[symbol].get()
+    return self.lookup(symbol).get()
 
   def trace(self, symbol):
-    self.table[symbol].trace()
+    self.lookup(symbol).trace()
 
   def set_constant(self, symbol, constant, constant_section):
-    self.table[symbol].constant = constant
-    self.table[symbol].constant_section = constant_section
+    entry = self.lookup(symbol)
+    entry.constant = constant
+    entry.constant_section = constant_section
 
   def is_constant(self, symbol):
-    return self.table[symbol].constant
+    return self.lookup(symbol).constant
 
   def get_constant_section(self, symbol):
-    return self.table[symbol].constant_section
+    return self.lookup(symbol).constant_section
 
   def set_used(self, symbol):
-    self.table[symbol].set_used(True)
+    self.lookup(symbol).set_used(True)
 
   def set_pure_function(self, symbol, pure):
-    self.table[symbol].pure_function = pure
+    self.lookup(symbol).pure_function = pure
 
   def is_pure_function(self, symbol):
-    return self.table[symbol].pure_function
+    return self.lookup(symbol).pure_function
 
   def get_type(self, symbol):
-    return self.table[symbol].type
+    return self.lookup(symbol).type
+
+# slot indexed scope for resolved programs, the names only serve print and trace
+class Scope:
+  def __init__(self, node, names, parent=None):
+    self.node = node
+    self.names = names
+    self.parent = parent
+    self.values = [None] * len(names)
+    self.histories = [None] * len(names)
+
+  def define(self, slot, lineno, value):
+    self.values[slot] = value
+    self.histories[slot] = History(self.names[slot])
+    self.histories[slot].add(lineno, value, None)
+    if self.histories[slot].watch is not None:
+      self.histories[slot].watch(self.histories[slot], None, value)
+
+  def get(self, depth, slot):
+    scope = self
+    while depth:
+      scope = scope.parent
+      depth -= 1
+    if scope.histories[slot] is None:
+      raise KeyError(scope.names[slot])
+    return scope.values[slot]
+
+  def add(self, depth, slot, lineno, value):
+    scope = self
+    while depth:
+      scope = scope.parent
+      depth -= 1
+    history = scope.histories[slot]
+    history.add(lineno, value, None)
+    # the only cost for a symbol nobody watches
+    if history.watch is None:
+      scope.values[slot] = value
+      return
+    old, scope.values[slot] = scope.values[slot], value
+    history.watch(history, old, value)
+
+  def lookup(self, symbol):
+    scope = self
+    while scope is not None:
+      for slot, name in enumerate(scope.names):
+        if name == symbol and scope.histories[slot] is not None:
+          return scope.histories[slot]
+      scope = scope.parent
+    return None
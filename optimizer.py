@@ -1,6 +1,16 @@
+import io
+import os
 import re
+import sys
+import time
 import argparse
+import tempfile
+import tracemalloc
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from generator.cache import parse
 from generator.parser import Parser
+from util.stats import globalStats
 from visitor.write_visitor import WriteVisitor
 from visitor.constant_folding_visitor import ConstantFoldingVisitor
 from visitor.print_visitor import PrintVisitor
@@ -10,27 +20,140 @@ CLI_PRINT_REGEX = re.compile('^print(?:\s(.+))?$')
 CLI_TRACE_REGEX = re.compile('^trace\s(\w+)$')
 LINE_RGEX = re.compile('^\d+$')
 VARIABLE_RGEX = re.compile('^[a-zA-Z_$][a-zA-Z_$0-9]*$')
+SOURCE_SUFFIX = '.c'
+
+# set in each batch worker by init_worker, so the parser tables are loaded once per process
+workerParser = None
+workerOptions = None
+
+# writes the optimized source to stream one top level declaration at a time
+def optimize(ast, stream, debug=False):
+  constantFoldingVisitor = ConstantFoldingVisitor(debug=debug, mark_used=True)
+  ast.accept(constantFoldingVisitor)
+  ast.accept(constantFoldingVisitor)
+  writeVisitor = WriteVisitor(dead_code_elimination=True, stream=stream)
+  ast.accept(writeVisitor)
+  return constantFoldingVisitor.runtime_error
+
+# streams into a temporary file next to target_path, which is only replaced once the whole output is written
+def optimize_to(ast, target_path, debug=False):
+  fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target_path) or '.')
+  try:
+    with os.fdopen(fd, 'w') as f:
+      runtime_error = optimize(ast, f, debug=debug)
+    # mkstemp creates the file for the owner only, an output gets the usual umask permissions
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(tmp_path, 0o666 & ~umask)
+    os.replace(tmp_path, target_path)
+  except:
+    os.remove(tmp_path)
+    raise
+  return runtime_error
+
+def init_worker(debug, cache, lexer, engine, stats):
+  global workerParser, workerOptions
+  workerParser = Parser(debug=debug, lexer=lexer, engine=engine)
+  workerOptions = (debug, cache, stats)
+
+# constant folding runs the program, its output is kept apart from the report.
+# with stats the parse peak memory of the worker is sent back, None otherwise
+def optimize_file(src_path, target_path):
+  debug, cache, stats = workerOptions
+  parse_time = optimize_time = 0
+  parse_memory = None
+  output = io.StringIO()
+  with contextlib.redirect_stdout(output):
+    try:
+      start = time.perf_counter()
+      if stats:
+        tracemalloc.start()
+      try:
+        ast = parse(src_path, debug=debug, cache=cache, parser=workerParser)
+      finally:
+        if stats:
+          parse_memory = tracemalloc.get_traced_memory()[1]
+          tracemalloc.stop()
+      parse_time = time.perf_counter() - start
+      start = time.perf_counter()
+      runtime_error = optimize_to(ast, target_path, debug=debug)
+      optimize_time = time.perf_counter() - start
+      status = 'run-time error' if runtime_error else 'ok'
+    except SyntaxError:
+      status = 'syntax error'
+    except Exception as e:
+      status = e.__class__.__name__
+  return status, parse_time, optimize_time, parse_memory, output.getvalue()
+
+# (input, output) pairs, directories are searched for .c files and keep their layout under output_dir
+def batch_paths(paths, output_dir):
+  pairs = []
+  for path in paths:
+    if not os.path.isdir(path):
+      pairs.append((path, os.path.join(output_dir, os.path.basename(path))))
+      continue
+    for directory, dirnames, filenames in os.walk(path):
+      dirnames.sort()
+      for name in sorted(filenames):
+        if name.endswith(SOURCE_SUFFIX):
+          src_path = os.path.join(directory, name)
+          pairs.append((src_path, os.path.join(output_dir, os.path.relpath(src_path, path))))
+  return pairs
+
+def run_batch(pairs, args):
+  for src_path, target_path in pairs:
+    os.makedirs(os.path.dirname(target_path) or '.', exist_ok=True)
+  failed = 0
+  start = time.perf_counter()
+  initargs = (args.debug, not args.no_cache, args.lexer, args.parser, args.stats)
+  with ProcessPoolExecutor(max_workers=args.jobs, initializer=init_worker, initargs=initargs) as executor:
+    src_paths = [src_path for src_path, target_path in pairs]
+    target_paths = [target_path for src_path, target_path in pairs]
+    print('{:<40}{:>12}{:>15}  {}'.format('file', 'parse (ms)', 'optimize (ms)', 'status'))
+    for src_path, result in zip(src_paths, executor.map(optimize_file, src_paths, target_paths)):
+      status, parse_time, optimize_time, parse_memory, output = result
+      print('{:<40}{:>12.1f}{:>15.1f}  {}'.format(src_path, parse_time * 1000, optimize_time * 1000, status))
+      if parse_memory is not None:
+        globalStats.add('Parse peak memory {}'.format(src_path), '%.1f KiB' % (parse_memory / 1024))
+      if args.debug:
+        print(output, end='')
+      if status != 'ok':
+        failed += 1
+  print('{} files, {} failed, {:.2f} s'.format(len(pairs), failed, time.perf_counter() - start))
+  return failed
 
 if __name__ == '__main__':
   parser = argparse.ArgumentParser(description='AST optimizer')
-  parser.add_argument('input', type=str, metavar='Input_File', help='Input .c file path')
-  parser.add_argument('output', type=str, metavar='Output_File', help='Output .c file path')
+  parser.add_argument('paths', type=str, nargs='+', metavar='Path', help='Input .c file path and output .c file path, or with --output-dir any .c files and directories')
   parser.add_argument('--debug', action='store_true')
+  parser.add_argument('--no-cache', action='store_true', help='Parse the input again instead of loading the cached AST')
+  parser.add_argument('--lexer', choices=['scanner', 'ply'], default='scanner', help='Tokenizer feeding the parser')
+  parser.add_argument('--parser', choices=['lalr', 'rd'], default='lalr', help='PLY LALR tables or recursive descent')
+  parser.add_argument('--stats', action='store_true', help='Report parse peak memory on stderr')
+  parser.add_argument('--output-dir', type=str, help='Optimize every input in a process pool and write the results here')
+  parser.add_argument('--jobs', type=int, default=None, help='Batch worker processes, the number of CPUs by default')
   args = parser.parse_args()
+  if args.stats:
+    globalStats.enable()
 
-  src_path = args.input
-  target_path = args.output
-  parser = Parser(debug=args.debug)
-  ast = parser.run(src_path)
+  if args.output_dir is not None:
+    pairs = batch_paths(args.paths, args.output_dir)
+    target_paths = [target_path for src_path, target_path in pairs]
+    if len(set(target_paths)) != len(target_paths):
+      parser.error('inputs with the same name would write the same output file')
+    failed = run_batch(pairs, args)
+    globalStats.report()
+    sys.exit(1 if failed else 0)
+  if len(args.paths) != 2:
+    parser.error('expected Input_File Output_File, or --output-dir for more inputs')
+
+  src_path, target_path = args.paths
+  globalStats.start_memory()
+  ast = parse(src_path, debug=args.debug, cache=not args.no_cache, lexer=args.lexer, engine=args.parser)
+  globalStats.stop_memory('Parse peak memory')
   if args.debug:
     printVisitor = PrintVisitor()
     ast.accept(printVisitor)
     print(printVisitor)
-  constantFoldingVisitor = ConstantFoldingVisitor(debug=args.debug, mark_used=True)
-  ast.accept(constantFoldingVisitor)
-  ast.accept(constantFoldingVisitor)
-  writeVisitor = WriteVisitor(dead_code_elimination=True)
-  s = ast.accept(writeVisitor)
-  f = open(target_path, 'w')
-  f.write(s)
-  f.close()
+  optimize_to(ast, target_path, debug=args.debug)
+  globalStats.report()
@@ -9,5 +9,31 @@ def getVisitorFunc(visitor, node_class):
         return visitorFunc
   return None
 
-def props(cls):
-  return [i for i in cls.__dict__.keys() if i[:1] != '_']
+# resolve a visitor method once per (visitor class, node class) pair
+class DispatchTable(dict):
+  def __init__(self, visitor_class):
+    super().__init__()
+    self.visitor_class = visitor_class
+
+  def __missing__(self, node_class):
+    visitorFunc = getVisitorFunc(self.visitor_class, node_class)
+    self[node_class] = visitorFunc
+    return visitorFunc
+
+class DispatchTables(dict):
+  def __missing__(self, visitor_class):
+    table = DispatchTable(visitor_class)
+    self[visitor_class] = table
+    return table
+
+dispatchTables = DispatchTables()
+
+# slot names of a node, base classes first, cached per node class
+propsCache = {}
+
+def props(node):
+  names = propsCache.get(node.__class__)
+  if names is None:
+    names = [i for cls in reversed(node.__class__.__mro__) for i in getattr(cls, '__slots__', ()) if i[:1] != '_']
+    propsCache[node.__class__] = names
+  return names
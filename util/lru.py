@@ -0,0 +1,22 @@
+from collections import OrderedDict
+
+# returned by get for a key not kept, a void function caches None
+MISSING = object()
+
+# keeps the size most recently used entries
+class LRUCache:
+  def __init__(self, size):
+    self.size = size
+    self.entries = OrderedDict()
+
+  def get(self, key):
+    entries = self.entries
+    if key not in entries:
+      return MISSING
+    entries.move_to_end(key)
+    return entries[key]
+
+  def put(self, key, value):
+    self.entries[key] = value
+    if len(self.entries) > self.size:
+      self.entries.popitem(last=False)
@@ -0,0 +1,32 @@
+import sys
+import tracemalloc
+
+# numbers collected for --stats, reported on stderr so program output is left alone
+class Stats:
+  def __init__(self):
+    self.enabled = False
+    self.entries = []
+
+  def enable(self):
+    self.enabled = True
+
+  def add(self, name, value):
+    if self.enabled:
+      self.entries.append((name, value))
+
+  def start_memory(self):
+    if self.enabled:
+      tracemalloc.start()
+
+  def stop_memory(self, name):
+    if not self.enabled:
+      return
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    self.add(name, '%.1f KiB' % (peak / 1024))
+
+  def report(self):
+    for name, value in self.entries:
+      print('%s : %s' % (name, value), file=sys.stderr)
+
+globalStats = Stats()
@@ -1,16 +1,25 @@
 def type_cast(type, value):
+  return type_caster(type)(value)
+
+def type_caster(type):
   last_type = type.get_type()
   types = type.types
   if last_type == 'int':
-    return int(value)
+    return int
   elif last_type == 'float':
-    return float(value)
+    return float
   elif last_type == 'char':
-    return str(value)
+    return str
   elif last_type == '*':
     if len(types) > 2 and types[1] == 'char':
-      return str(value)
+      return str
     else:
-      return value
+      return no_cast
   else:
-    raise ValueError
+    return invalid_cast
+
+def no_cast(value):
+  return value
+
+def invalid_cast(value):
+  raise ValueError
@@ -0,0 +1,329 @@
+from model import ast
+from model import bytecode as bc
+from model.bytecode import Code, Program
+from util.type import type_caster
+from util.function import globalFunctionTable
+from util.helper import props
+
+class BytecodeVisitor:
+  def __init__(self):
+    self.program = None
+    self.code = None
+    self.global_scope = {}
+    self.scopes = []
+    self.blocks = []
+    self.returns = None
+    self.functions = []
+    self.lazy = False
+
+  def emit(self, op, arg=None, node=None):
+    lineno = 0 if node is None or node.linespan is None else node.linespan[0]
+    return self.code.emit(op, arg, lineno)
+
+  def patch(self, index):
+    self.code.patch(index, self.code.position())
+
+  def push_scope(self):
+    self.scopes.append({})
+
+  def pop_scope(self):
+    self.scopes.pop()
+
+  def declare(self, name, type):
+    scope = self.scopes[-1]
+    if name in scope:
+      slot = scope[name][0]
+    else:
+      slot = self.code.add_local(name)
+    scope[name] = (slot, type_caster(type))
+    return slot
+
+  def resolve(self, name):
+    for scope in reversed(self.scopes):
+      if name in scope:
+        return bc.LOAD_LOCAL, bc.STORE_LOCAL, scope[name]
+    if self.code is not self.program.main and name in self.global_scope:
+      return bc.LOAD_GLOBAL, bc.STORE_GLOBAL, self.global_scope[name]
+    return None
+
+  def statement(self, node, lazy):
+    self.lazy = lazy
+    if isinstance(node, ast.ConditionalStatement) or isinstance(node, ast.LoopStatement):
+      if lazy:
+        self.emit(bc.LINE_COMPOUND, node.get_excutable_lineno(), node)
+      node.accept(self)
+      return
+    # a call keeps the caller's line until the statement completes
+    lineno = node.get_excutable_lineno()
+    has_call = lazy and self.has_call(node)
+    if has_call:
+      self.emit(bc.LINE_COMPOUND, lineno, node)
+    elif lazy:
+      self.emit(bc.LINE, lineno, node)
+    node.accept(self)
+    if not (isinstance(node, ast.Declaration) or isinstance(node, ast.VaDeclarationList) or isinstance(node, ast.JumpStatement)):
+      self.emit(bc.POP)
+    if has_call:
+      self.emit(bc.LINE_SET, (lineno + 1, 0))
+
+  def has_call(self, node):
+    if isinstance(node, ast.FnExpression):
+      return True
+    for prop in props(node):
+      child = getattr(node, prop)
+      if prop != 'parent' and isinstance(child, ast.Node) and self.has_call(child):
+        return True
+    return False
+
+  def section(self, node):
+    for child in node.childs:
+      self.statement(child, True)
+    self.emit(bc.LINE_TO, node.linespan[1], node)
+
+  def branch(self, node):
+    self.emit(bc.LINE_PUSH, node.linespan[0])
+    self.emit(bc.LINE_TO, node.linespan[0], node)
+    self.blocks.append({'loop': False})
+    self.push_scope()
+    self.section(node)
+    self.pop_scope()
+    self.blocks.pop()
+
+  # leave branches up to the innermost loop
+  def leave_branches(self):
+    for block in reversed(self.blocks):
+      if block['loop']:
+        return block
+      self.emit(bc.LINE_POP, None)
+    return None
+
+  def function(self, node):
+    code = Code(node.name, node)
+    code.lineno = node.body.linespan[0]
+    self.program.add_code(node, code)
+    self.code = code
+    self.scopes = [{}]
+    self.blocks = []
+    self.returns = None
+    if not node.parameterGroup.is_empty():
+      for parameter in node.parameterGroup.childs:
+        code.parameters.append((self.declare(parameter.name, parameter.type), parameter.linespan[0]))
+    self.section(node.body)
+    self.emit(bc.CONST, None)
+    self.emit(bc.RETURN)
+
+  def patch_returns(self, returns):
+    for jump in self.returns:
+      self.patch(jump)
+    self.returns = returns
+
+  # def Node(self): // all child node implemented by itself
+
+  # def ArrayNode(self): // all child node implemented by itself
+
+  # def TypeNode(self): // not necessary
+
+  def EmptyNode(self, node):
+    self.emit(bc.CONST, None)
+
+  def Const(self, node):
+    self.emit(bc.CONST, node.value, node)
+
+  def BaseSection(self, node):
+    self.section(node)
+
+  def RootSection(self, node):
+    self.program = Program(Code('<module>', node))
+    self.code = self.program.main
+    self.scopes = [self.global_scope]
+    for child in node.childs:
+      self.returns = []
+      self.statement(child, False)
+      self.patch_returns(None)
+    self.emit(bc.HALT)
+
+    while self.functions:
+      self.function(self.functions.pop(0))
+    return self.program
+
+  # def Section(self): // covered by BaseSection
+
+  # def Declaration(self): // all child node implemented by itself
+
+  def FnDeclaration(self, node):
+    self.emit(bc.CONST, node, node)
+    self.emit(bc.DEFINE_LOCAL, (self.declare(node.name, node.type), node.linespan[0]), node)
+    if node.name != 'main':
+      self.functions.append(node)
+      return
+
+    # main runs inline, in the scope that declares it
+    returns, blocks = self.returns, self.blocks
+    self.returns, self.blocks = [], []
+    self.emit(bc.LINE_SET, (node.body.linespan[0], 0))
+    self.section(node.body)
+    self.patch_returns(returns)
+    self.blocks = blocks
+
+  def VaDeclarationList(self, node):
+    for child in node.childs:
+      child.accept(self)
+
+  # def Declarator(self): // all child node implemented by itself
+
+  # def FnDeclarator(self): // covered by FnDeclaration
+
+  def VaDeclarator(self, node):
+    self.emit(bc.CONST, None, node)
+    self.emit(bc.DEFINE_LOCAL, (self.declare(node.name, node.type), node.linespan[0]), node)
+
+  def ArrayDeclarator(self, node):
+    self.emit(bc.NEW_ARRAY, node.size, node)
+    self.emit(bc.DEFINE_LOCAL, (self.declare(node.name, node.type), node.linespan[0]), node)
+
+  # def ParameterGroup(self): // covered by function
+
+  def ConditionalStatement(self, node):
+    end_lineno = node.linespan[1] + (1 if self.lazy else 0)
+    node.expr.accept(self)
+    else_jump = self.emit(bc.JUMP_IF_FALSE, None, node)
+    self.branch(node.then_section)
+    self.emit(bc.LINE_POP, (end_lineno, 1))
+    end_jump = self.emit(bc.JUMP)
+    self.patch(else_jump)
+    if not node.else_section.is_empty():
+      self.branch(node.else_section)
+      self.emit(bc.LINE_POP, (end_lineno, 1))
+    else:
+      self.emit(bc.LINE_SET, (end_lineno, 0))
+    self.patch(end_jump)
+
+  def LoopStatement(self, node):
+    end_lineno = node.linespan[1] + (1 if self.lazy else 0)
+    self.emit(bc.LINE_PUSH, node.get_excutable_lineno() + 1)
+    self.push_scope()
+    if node.init_stmt is not None:
+      node.init_stmt.accept(self)
+      self.emit(bc.POP)
+
+    loop = {'loop': True, 'breaks': [], 'continues': [], 'lineno': node.linespan[1]}
+    self.blocks.append(loop)
+    start = self.emit(bc.LINE_TO, node.expr.linespan[1], node.expr)
+    node.expr.accept(self)
+    exit_jump = self.emit(bc.JUMP_IF_FALSE, None, node.expr)
+    self.emit(bc.LINE_TO, node.section.linespan[0], node.section)
+    self.section(node.section)
+    for jump in loop['continues']:
+      self.patch(jump)
+    if node.term_stmt is not None:
+      node.term_stmt.accept(self)
+      self.emit(bc.POP)
+    self.emit(bc.LINE_SET, (node.linespan[0], 1))
+    self.emit(bc.JUMP, start)
+    self.blocks.pop()
+
+    self.patch(exit_jump)
+    self.emit(bc.LINE_POP, (end_lineno, 1))
+    done_jump = self.emit(bc.JUMP)
+    for jump in loop['breaks']:
+      self.patch(jump)
+    self.emit(bc.LINE_POP, (end_lineno, 0))
+    self.patch(done_jump)
+    self.pop_scope()
+
+  # def While(self): // covered by LoopStatement
+
+  # def For(self): // covered by LoopStatement
+
+  # def JumpStatement(self): // all child node implemented by itself
+
+  def Return(self, node):
+    node.expr.accept(self)
+    if self.returns is None:
+      self.emit(bc.RETURN, None, node)
+      return
+    self.emit(bc.POP)
+    for block in reversed(self.blocks):
+      self.emit(bc.LINE_POP, (block['lineno'], 0) if block['loop'] else None)
+    self.returns.append(self.emit(bc.JUMP, None, node))
+
+  def Break(self, node):
+    loop = self.leave_branches()
+    if loop is None:
+      self.emit(bc.FAIL, None, node)
+      return
+    loop['breaks'].append(self.emit(bc.JUMP, None, node))
+
+  def Continue(self, node):
+    loop = self.leave_branches()
+    if loop is None:
+      self.emit(bc.FAIL, None, node)
+      return
+    loop['continues'].append(self.emit(bc.JUMP, None, node))
+
+  def ArgumentList(self, node):
+    for child in node.childs:
+      child.accept(self)
+
+  def BinaryOp(self, node):
+    node.left.accept(self)
+    node.right.accept(self)
+    if node.op in bc.COMPARE_OPERATORS:
+      self.emit(bc.COMPARE, bc.COMPARE_OPERATORS[node.op], node)
+    elif node.op in bc.BINARY_OPERATORS:
+      self.emit(bc.BINARY, bc.BINARY_OPERATORS[node.op], node)
+    else:
+      self.emit(bc.FAIL, None, node)
+
+    if (node.op == '++' or node.op == '--') and node.left.__class__ is ast.VaExpression:
+      target = self.resolve(node.left.name)
+      if target is None:
+        self.emit(bc.FAIL, None, node)
+        return
+      load, store, (slot, cast) = target
+      self.emit(store, (slot, None, node.linespan[0]), node)
+
+  def AssignOp(self, node):
+    node.right.accept(self)
+    if node.left.__class__ is ast.VaExpression:
+      target = self.resolve(node.left.name)
+      if target is None:
+        self.emit(bc.FAIL, None, node)
+        return
+      load, store, (slot, cast) = target
+      self.emit(store, (slot, cast, node.linespan[0]), node)
+    elif node.left.__class__ is ast.ArrayExpression:
+      node.left.expr.accept(self)
+      node.left.index.accept(self)
+      self.emit(bc.STORE_INDEX, None, node)
+    else:
+      self.emit(bc.FAIL, None, node)
+
+  def UnaryOp(self, node):
+    node.expr.accept(self)
+    if node.op == '-':
+      self.emit(bc.NEGATE, None, node)
+    elif node.op != '+':
+      self.emit(bc.FAIL, None, node)
+
+  def FnExpression(self, node):
+    node.expr.accept(self)
+    arguments = node.arguments.childs if isinstance(node.arguments, ast.ArgumentList) else []
+    for argument in arguments:
+      argument.accept(self)
+    self.emit(bc.CALL, len(arguments), node)
+
+  def VaExpression(self, node):
+    target = self.resolve(node.name)
+    if target is not None:
+      load, store, (slot, cast) = target
+      self.emit(load, slot, node)
+    elif globalFunctionTable.has(node.name):
+      self.emit(bc.CONST, globalFunctionTable.get(node.name), node)
+    else:
+      self.emit(bc.FAIL, None, node)
+
+  def ArrayExpression(self, node):
+    node.expr.accept(self)
+    node.index.accept(self)
+    self.emit(bc.LOAD_INDEX, None, node)
@@ -0,0 +1,476 @@
+from model import ast
+from util.type import type_caster
+from util.function import globalFunctionTable, Function
+from util.helper import props
+
+BREAK = 'break'
+CONTINUE = 'continue'
+RETURN = 'return'
+
+BINARY_CLOSURES = {
+  '+': lambda left, right: lambda frame: left(frame) + right(frame),
+  '-': lambda left, right: lambda frame: left(frame) - right(frame),
+  '*': lambda left, right: lambda frame: left(frame) * right(frame),
+  '/': lambda left, right: lambda frame: left(frame) / right(frame),
+  '%': lambda left, right: lambda frame: left(frame) % right(frame),
+  '++': lambda left, right: lambda frame: left(frame) + right(frame),
+  '--': lambda left, right: lambda frame: left(frame) - right(frame),
+  '==': lambda left, right: lambda frame: 1 if left(frame) == right(frame) else 0,
+  '!=': lambda left, right: lambda frame: 1 if left(frame) != right(frame) else 0,
+  '<': lambda left, right: lambda frame: 1 if left(frame) < right(frame) else 0,
+  '>': lambda left, right: lambda frame: 1 if left(frame) > right(frame) else 0,
+  '<=': lambda left, right: lambda frame: 1 if left(frame) <= right(frame) else 0,
+  '>=': lambda left, right: lambda frame: 1 if left(frame) >= right(frame) else 0,
+}
+
+class ClosureError(Exception):
+  def __init__(self, lineno):
+    super().__init__(lineno)
+    self.lineno = lineno
+
+class Closure:
+  def __init__(self, name, node=None):
+    self.name = name
+    self.node = node
+    self.lineno = 1
+    self.names = []
+    self.parameters = []
+    self.body = None
+
+  def add_local(self, name):
+    self.names.append(name)
+    return len(self.names) - 1
+
+  def get_nlocals(self):
+    return len(self.names)
+
+def fail(frame):
+  raise ValueError
+
+# A frame is a flat list: values from the front, histories from the back,
+# so slot i is frame[i] and its history is frame[-1 - i].
+class ClosureVisitor:
+  def __init__(self, engine):
+    self.engine = engine
+    self.closure = None
+    self.main = None
+    self.global_frame = engine.global_frame
+    self.global_scope = {}
+    self.scopes = []
+    self.blocks = []
+    self.closures = {}
+    self.functions = []
+    self.lazy = False
+
+  def push_scope(self):
+    self.scopes.append({})
+
+  def pop_scope(self):
+    self.scopes.pop()
+
+  def declare(self, name, type):
+    scope = self.scopes[-1]
+    if name in scope:
+      slot = scope[name][0]
+    else:
+      slot = self.closure.add_local(name)
+    scope[name] = (slot, type_caster(type))
+    return slot
+
+  def resolve(self, name):
+    for scope in reversed(self.scopes):
+      if name in scope:
+        return False, scope[name]
+    if self.closure is not self.main and name in self.global_scope:
+      return True, self.global_scope[name]
+    return None
+
+  def has_call(self, node):
+    if isinstance(node, ast.FnExpression):
+      return True
+    for prop in props(node):
+      child = getattr(node, prop)
+      if prop != 'parent' and isinstance(child, ast.Node) and self.has_call(child):
+        return True
+    return False
+
+  def guard(self, function, lineno):
+    def guarded(frame):
+      try:
+        return function(frame)
+      except ClosureError:
+        raise
+      except Exception as e:
+        raise ClosureError(lineno) from e
+    return guarded
+
+  def statement(self, node, lazy):
+    engine = self.engine
+    linenos = engine.linenos
+    lineno = node.get_excutable_lineno()
+    error_lineno = node.linespan[0]
+    is_jump = isinstance(node, ast.JumpStatement)
+    self.lazy = lazy
+    inner = node.accept(self)
+    if isinstance(node, ast.ConditionalStatement) or isinstance(node, ast.LoopStatement):
+      if not lazy:
+        return inner
+      line_compound = engine.line_compound
+      def compound_statement(frame):
+        line_compound(lineno)
+        return inner(frame)
+      return compound_statement
+
+    if not lazy:
+      def root_statement(frame):
+        try:
+          inner(frame)
+        except ClosureError:
+          raise
+        except Exception as e:
+          raise ClosureError(error_lineno) from e
+      return root_statement
+    # a call keeps the caller's line until the statement completes
+    if self.has_call(node):
+      line_compound = engine.line_compound
+      def call_statement(frame):
+        line_compound(lineno)
+        try:
+          signal = inner(frame)
+        except ClosureError:
+          raise
+        except Exception as e:
+          raise ClosureError(error_lineno) from e
+        if is_jump:
+          return signal
+        linenos[-1] = lineno + 1
+      return call_statement
+    line = engine.line
+    def simple_statement(frame):
+      line(lineno)
+      try:
+        signal = inner(frame)
+      except ClosureError:
+        raise
+      except Exception as e:
+        raise ClosureError(error_lineno) from e
+      if is_jump:
+        return signal
+    return simple_statement
+
+  def section(self, node):
+    engine = self.engine
+    line_to = engine.line_to
+    statements = tuple(self.statement(child, True) for child in node.childs)
+    end_lineno = node.linespan[1]
+    def section(frame):
+      for statement in statements:
+        signal = statement(frame)
+        if signal is not None:
+          return signal
+      line_to(end_lineno)
+    return section
+
+  def branch(self, node):
+    engine = self.engine
+    linenos = engine.linenos
+    line_to = engine.line_to
+    start_lineno = node.linespan[0]
+    self.blocks.append(False)
+    self.push_scope()
+    section = self.section(node)
+    self.pop_scope()
+    self.blocks.pop()
+    def branch(frame):
+      linenos.append(start_lineno)
+      line_to(start_lineno)
+      signal = section(frame)
+      linenos.pop()
+      return signal
+    return branch
+
+  def function(self, node):
+    closure = Closure(node.name, node)
+    closure.lineno = node.body.linespan[0]
+    self.closures[node] = closure
+    self.closure = closure
+    self.scopes = [{}]
+    self.blocks = []
+    if not node.parameterGroup.is_empty():
+      for parameter in node.parameterGroup.childs:
+        closure.parameters.append((self.declare(parameter.name, parameter.type), parameter.linespan[0]))
+    closure.body = self.section(node.body)
+
+  def define(self, slot, lineno, value):
+    name = self.closure.names[slot]
+    engine = self.engine
+    def define(frame):
+      history = engine.new_history(name)
+      history.add(lineno, value(), None)
+      frame[slot] = history.get()
+      frame[-1 - slot] = history
+    return define
+
+  def store(self, name, cast, lineno, right):
+    target = self.resolve(name)
+    if target is None:
+      return fail
+    is_global, (slot, target_cast) = target
+    cast = target_cast if cast else None
+    if is_global:
+      global_frame = self.global_frame
+      def store_global(frame):
+        value = right(frame)
+        if cast is not None:
+          value = cast(value)
+        global_frame[slot] = value
+        global_frame[-1 - slot].add(lineno, value, None)
+        return value
+      return store_global
+    def store(frame):
+      value = right(frame)
+      if cast is not None:
+        value = cast(value)
+      frame[slot] = value
+      frame[-1 - slot].add(lineno, value, None)
+      return value
+    return store
+
+  # def Node(self): // all child node implemented by itself
+
+  # def ArrayNode(self): // all child node implemented by itself
+
+  # def TypeNode(self): // not necessary
+
+  def EmptyNode(self, node):
+    return lambda frame: None
+
+  def Const(self, node):
+    value = node.value
+    return lambda frame: value
+
+  # def BaseSection(self): // covered by section
+
+  def RootSection(self, node):
+    self.main = Closure('<module>', node)
+    self.closure = self.main
+    self.scopes = [self.global_scope]
+    statements = tuple(self.statement(child, False) for child in node.childs)
+    while self.functions:
+      self.function(self.functions.pop(0))
+    self.global_frame.extend([None] * (2 * self.main.get_nlocals()))
+
+    def root(frame):
+      for statement in statements:
+        statement(frame)
+    self.main.body = root
+    return self.main
+
+  # def Section(self): // covered by section
+
+  # def Declaration(self): // all child node implemented by itself
+
+  def FnDeclaration(self, node):
+    define = self.define(self.declare(node.name, node.type), node.linespan[0], lambda: node)
+    if node.name != 'main':
+      self.functions.append(node)
+      return define
+
+    # main runs inline, in the scope that declares it
+    linenos = self.engine.linenos
+    body_lineno = node.body.linespan[0]
+    blocks = self.blocks
+    self.blocks = []
+    body = self.section(node.body)
+    self.blocks = blocks
+    def main(frame):
+      define(frame)
+      linenos[-1] = body_lineno
+      body(frame)
+    return main
+
+  def VaDeclarationList(self, node):
+    declarations = tuple(child.accept(self) for child in node.childs)
+    def declaration_list(frame):
+      for declaration in declarations:
+        declaration(frame)
+    return declaration_list
+
+  # def Declarator(self): // all child node implemented by itself
+
+  # def FnDeclarator(self): // covered by FnDeclaration
+
+  def VaDeclarator(self, node):
+    return self.define(self.declare(node.name, node.type), node.linespan[0], lambda: None)
+
+  def ArrayDeclarator(self, node):
+    size = node.size
+    return self.define(self.declare(node.name, node.type), node.linespan[0], lambda: [None] * size)
+
+  # def ParameterGroup(self): // covered by function
+
+  def ConditionalStatement(self, node):
+    engine = self.engine
+    linenos = engine.linenos
+    end_lineno = node.linespan[1] + (1 if self.lazy else 0)
+    expr = self.guard(node.expr.accept(self), node.expr.linespan[0])
+    then_branch = self.branch(node.then_section)
+    else_branch = None if node.else_section.is_empty() else self.branch(node.else_section)
+    def conditional(frame):
+      if expr(frame):
+        signal = then_branch(frame)
+      elif else_branch is not None:
+        signal = else_branch(frame)
+      else:
+        linenos[-1] = end_lineno
+        return None
+      if signal is not None:
+        return signal
+      engine.line_num -= 1
+      linenos[-1] = end_lineno
+    return conditional
+
+  def LoopStatement(self, node):
+    engine = self.engine
+    linenos = engine.linenos
+    line_to = engine.line_to
+    end_lineno = node.linespan[1] + (1 if self.lazy else 0)
+    return_lineno = node.linespan[1]
+    start_lineno = node.linespan[0]
+    push_lineno = node.get_excutable_lineno() + 1
+    expr_lineno = node.expr.linespan[1]
+    section_lineno = node.section.linespan[0]
+
+    self.push_scope()
+    init_stmt = None if node.init_stmt is None else self.guard(node.init_stmt.accept(self), node.init_stmt.linespan[0])
+    expr = self.guard(node.expr.accept(self), node.expr.linespan[0])
+    self.blocks.append(True)
+    section = self.section(node.section)
+    self.blocks.pop()
+    term_stmt = None if node.term_stmt is None else self.guard(node.term_stmt.accept(self), node.term_stmt.linespan[0])
+    self.pop_scope()
+
+    def loop(frame):
+      linenos.append(push_lineno)
+      if init_stmt is not None:
+        init_stmt(frame)
+      while True:
+        line_to(expr_lineno)
+        if not expr(frame):
+          linenos.pop()
+          linenos[-1] = end_lineno
+          engine.line_num -= 1
+          return None
+        line_to(section_lineno)
+        signal = section(frame)
+        if signal is BREAK:
+          linenos.pop()
+          linenos[-1] = end_lineno
+          return None
+        elif signal is not None and signal is not CONTINUE:
+          linenos.pop()
+          linenos[-1] = return_lineno
+          return signal
+        if term_stmt is not None:
+          term_stmt(frame)
+        linenos[-1] = start_lineno
+        engine.line_num -= 1
+    return loop
+
+  # def While(self): // covered by LoopStatement
+
+  # def For(self): // covered by LoopStatement
+
+  # def JumpStatement(self): // all child node implemented by itself
+
+  def Return(self, node):
+    expr = self.guard(node.expr.accept(self), node.linespan[0])
+    return lambda frame: (RETURN, expr(frame))
+
+  def Break(self, node):
+    if True not in self.blocks:
+      return fail
+    return lambda frame: BREAK
+
+  def Continue(self, node):
+    if True not in self.blocks:
+      return fail
+    return lambda frame: CONTINUE
+
+  # def ArgumentList(self): // covered by FnExpression
+
+  def BinaryOp(self, node):
+    left = node.left.accept(self)
+    right = node.right.accept(self)
+    if node.op == '&&':
+      def binary(frame):
+        left_result = left(frame)
+        right_result = right(frame)
+        return left_result and right_result
+    elif node.op == '||':
+      def binary(frame):
+        left_result = left(frame)
+        right_result = right(frame)
+        return left_result or right_result
+    elif node.op in BINARY_CLOSURES:
+      binary = BINARY_CLOSURES[node.op](left, right)
+    else:
+      return fail
+    if (node.op == '++' or node.op == '--') and node.left.__class__ is ast.VaExpression:
+      return self.store(node.left.name, False, node.linespan[0], binary)
+    return binary
+
+  def AssignOp(self, node):
+    right = node.right.accept(self)
+    if node.left.__class__ is ast.VaExpression:
+      return self.store(node.left.name, True, node.linespan[0], right)
+    elif node.left.__class__ is ast.ArrayExpression:
+      expr = node.left.expr.accept(self)
+      index = node.left.index.accept(self)
+      def assign_index(frame):
+        value = right(frame)
+        array = expr(frame)
+        array[index(frame)] = value
+        return array
+      return assign_index
+    return fail
+
+  def UnaryOp(self, node):
+    expr = node.expr.accept(self)
+    if node.op == '-':
+      return lambda frame: -expr(frame)
+    elif node.op == '+':
+      return expr
+    return fail
+
+  def FnExpression(self, node):
+    call = self.engine.call
+    closures = self.closures
+    expr = node.expr.accept(self)
+    arguments = node.arguments.childs if isinstance(node.arguments, ast.ArgumentList) else []
+    arguments = tuple(argument.accept(self) for argument in arguments)
+    def function_call(frame):
+      function = expr(frame)
+      argument_values = [argument(frame) for argument in arguments]
+      if function.__class__ is Function:
+        return function.run(*argument_values)
+      return call(closures[function], argument_values)
+    return function_call
+
+  def VaExpression(self, node):
+    target = self.resolve(node.name)
+    if target is not None:
+      is_global, (slot, cast) = target
+      if is_global:
+        global_frame = self.global_frame
+        return lambda frame: global_frame[slot]
+      return lambda frame: frame[slot]
+    elif globalFunctionTable.has(node.name):
+      function = globalFunctionTable.get(node.name)
+      return lambda frame: function
+    return fail
+
+  def ArrayExpression(self, node):
+    expr = node.expr.accept(self)
+    index = node.index.accept(self)
+    return lambda frame: expr(frame)[index(frame)]
@@ -4,6 +4,7 @@ from model.symbol_table import SymbolTable
 from model import ast
 from util.type import type_cast
 from util.function import globalFunctionTable, Function
+from visitor.purity_visitor import PurityVisitor
 
 class ConstantFoldingVisitor:
   def __init__(self, debug=False, mark_used=False):
@@ -16,11 +17,13 @@ class ConstantFoldingVisitor:
     self.check_constant_outer = False
     self.check_constant_self = False
     self.mark_used = mark_used
+    self.call_depth = 0
 
   def accept(self, node):
     try :
       result, jum_stmt = node.accept(self)
-      node.visited = True
+      if not self.call_depth:
+        node.visited = True
       return result, jum_stmt
     except:
       if not self.runtime_error:
@@ -90,10 +93,14 @@ class ConstantFoldingVisitor:
         return scope.node
     return None
 
+  # function bodies are shared with their declaration, so a call must not rewrite them
   def replace(self, base_node, target_node):
-    if not self.freeze_constant_folding:
+    if not self.freeze_constant_folding and not self.call_depth:
         base_node.replace(target_node)
 
+  def assign_node(self, node):
+    return None if self.call_depth else node
+
   def set_used(self, symbol):
     if not self.mark_used:
       return
@@ -116,9 +123,10 @@ class ConstantFoldingVisitor:
         node.result = result
         return node.result, jump_stmt
 
-    return node.result, None
+    return None, None
 
   def RootSection(self, node):
+    node.accept(PurityVisitor())
     for child in node.childs:
       self.accept(child)
     print('End of program')
@@ -130,7 +138,8 @@ class ConstantFoldingVisitor:
 
   def FnDeclaration(self, node):
     scope = self.get_scope()
-    scope.define(node.name, node.type, node.linespan[0], node, node)
+    scope.define(node.name, node.type, node.linespan[0], node, self.assign_node(node))
+    scope.set_pure_function(node.name, node.pure)
 
     func_scope = SymbolTable(node, self.global_scope)
     if node.name != 'main':
@@ -156,12 +165,12 @@ class ConstantFoldingVisitor:
 
   def VaDeclarator(self, node):
     scope = self.get_scope()
-    scope.define(node.name, node.type, node.linespan[0], None, node)
+    scope.define(node.name, node.type, node.linespan[0], None, self.assign_node(node))
     return None, None
 
   def ArrayDeclarator(self, node):
     scope = self.get_scope()
-    scope.define(node.name, node.type, node.linespan[0], [None] * node.size, node)
+    scope.define(node.name, node.type, node.linespan[0], [None] * node.size, self.assign_node(node))
     return None, None
 
   # def ParameterGroup(self): // not necessary
@@ -185,7 +194,8 @@ class ConstantFoldingVisitor:
     self.check_constant_outer = False
     self.check_constant_self = True
 
-    node.save_origin()
+    if not self.call_depth:
+      node.save_origin()
     scope = self.get_scope()
     self.push_scope(SymbolTable(node, scope))
 
@@ -220,8 +230,9 @@ class ConstantFoldingVisitor:
 
       self.check_constant_self = prev_check_constant_self
       self.check_constant_outer = True
-      node.save_origin()
-      node.load_origin()
+      if not self.call_depth:
+        node.save_origin()
+        node.load_origin()
 
     self.check_constant_outer = prev_check_constant_outer
     self.pop_scope()
@@ -234,6 +245,7 @@ class ConstantFoldingVisitor:
   # def JumpStatement(self): // all child node implemented by itself
 
   def Return(self, node):
+    node.result = None
     if not node.expr.is_empty():
       result, jump_stmt = self.accept(node.expr)
       node.result = result
@@ -311,7 +323,7 @@ class ConstantFoldingVisitor:
     if node.op == '++' or node.op == '--':
       scope = self.get_scope()
       if node.left.__class__ is ast.VaExpression:
-        scope.add(node.left.name, node.linespan[0], node.result, node)
+        scope.add(node.left.name, node.linespan[0], node.result, self.assign_node(node))
         self.set_constant(node.left.name, self.is_constant(node.left.name))
       elif (node.left.__class__ is ast.Const):
         self.replace(node, ast.Const(node.result, node.linespan))
@@ -328,7 +340,7 @@ class ConstantFoldingVisitor:
       symbol = node.left.name
       if right_result is not None:
         right_result = type_cast(scope.get_type(symbol), right_result)
-      scope.add(symbol, node.linespan[0], right_result, node)
+      scope.add(symbol, node.linespan[0], right_result, self.assign_node(node))
       node.result = scope.get(symbol)
       self.set_constant(symbol, node.right.__class__ is ast.Const)
     elif node.left.__class__ is ast.ArrayExpression:
@@ -369,15 +381,16 @@ class ConstantFoldingVisitor:
       if expr_result.__class__ is Function:
         node.result = expr_result.run(*arguments_result)
       else:
-        if not node.initialized:
-          node.body = expr_result.body.clone()
-          func_scope = SymbolTable(expr_result, self.global_scope)
-          self.push_scope(func_scope)
-          for i, parameter in enumerate(expr_result.parameterGroup.childs):
-            func_scope.define(parameter.name, parameter.type, parameter.linespan[0], arguments_result[i], None)
-          node.initialized = True
-
-        body_result, body_jump_stmt = self.accept(node.body)
+        func_scope = SymbolTable(expr_result, self.global_scope)
+        self.push_scope(func_scope)
+        for i, parameter in enumerate(expr_result.parameterGroup.childs):
+          func_scope.define(parameter.name, parameter.type, parameter.linespan[0], arguments_result[i], None)
+
+        self.call_depth += 1
+        try:
+          body_result, body_jump_stmt = self.accept(expr_result.body)
+        finally:
+          self.call_depth -= 1
         self.pop_scope()
         node.result = body_result
       if self.get_scope().is_pure_function(expr_result.name) and node.result is not None:
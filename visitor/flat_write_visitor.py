@@ -0,0 +1,221 @@
+from model import ast
+from model.flat_ast import KINDS, KIND, USE_PAREN, USED
+from util.helper import getVisitorFunc
+
+EMPTY = KIND[ast.EmptyNode]
+NO_SEMI = {KIND[ast.FnDeclaration], KIND[ast.ConditionalStatement], KIND[ast.While], KIND[ast.For]}
+
+# WriteVisitor over the rows of a FlatAst, the node at an index is written by the method of its kind
+class FlatWriteVisitor:
+  def __init__(self, dead_code_elimination=False):
+    self.s = ''
+    self._indent = 0
+    self.dead_code_elimination = dead_code_elimination
+    self.dispatch = [None if cls is None else getVisitorFunc(self, cls) for cls in KINDS]
+
+  def __str__(self):
+    return self.s
+
+  def write(self, flat):
+    self.flat = flat
+    self.kind = flat.kind
+    self.first_child = flat.first_child
+    self.flags = flat.flags
+    self.s = self.accept(0)
+    return self.s
+
+  def accept(self, index):
+    return self.dispatch[self.kind[index]](index)
+
+  def is_empty(self, index):
+    return self.kind[index] == EMPTY
+
+  def indent(self):
+    self._indent += 1
+
+  def unindent(self):
+    self._indent -= 1
+
+  def get_indent_str(self):
+    return '  ' * self._indent
+
+  # used implies reachable, so the used bit alone decides
+  def should_write(self, index):
+    return not self.dead_code_elimination or self.flags[index] & USED
+
+  def Node(self, index):
+    raise ValueError
+
+  def ArrayNode(self, index):
+    raise ValueError
+
+  def EmptyNode(self, index):
+    return ''
+
+  def TypeNode(self, index):
+    if not self.should_write(index):
+      return ''
+    return self.flat.get_value(index)[-1]
+
+  def Const(self, index):
+    if not self.should_write(index):
+      return ''
+    value = self.flat.get_value(index)
+    if isinstance(value, str):
+      return '"{}"'.format(value)
+    return str(value)
+
+  def BaseSection(self, index):
+    if not self.should_write(index):
+      return ''
+    s = ''
+    self.indent()
+    for child in self.flat.children(index):
+      child_str = self.accept(child)
+      if not child_str:
+        continue
+      s += '{}{}{}\n'.format(self.get_indent_str(), child_str, '' if self.kind[child] in NO_SEMI else ';')
+    self.unindent()
+    return s
+
+  def RootSection(self, index):
+    if not self.should_write(index):
+      return ''
+    s = ''
+    for child in self.flat.children(index):
+      s += '{}{}\n'.format(self.get_indent_str(), self.accept(child))
+    return s
+
+  def FnDeclaration(self, index):
+    if not self.should_write(index):
+      return ''
+    declarator, body = self.flat.children(index)
+    type, parameter_group = self.flat.children(declarator)
+    parameter_str = 'void' if self.is_empty(parameter_group) else self.accept(parameter_group)
+    s = '{}{} {}({})\n'.format(self.get_indent_str(), self.accept(type), self.flat.get_op(declarator), parameter_str)
+    s += '{}{{\n'.format(self.get_indent_str())
+    s += self.accept(body)
+    s += '{}}}'.format(self.get_indent_str())
+    return s
+
+  def VaDeclarationList(self, index):
+    if not self.should_write(index):
+      return ''
+    childs = list(self.flat.children(index))
+    variable_list_str = ', '.join(filter(None, map(self.accept, childs)))
+    if not variable_list_str:
+      return ''
+    return '{} {}'.format(self.accept(self.first_child[childs[0]]), variable_list_str)
+
+  def Declarator(self, index):
+    if not self.should_write(index):
+      return ''
+    return '{}{}'.format(''.join(self.flat.get_value(self.first_child[index])[:-1]), self.flat.get_op(index))
+
+  def ArrayDeclarator(self, index):
+    if not self.should_write(index):
+      return ''
+    return '{}[{}]'.format(self.flat.get_op(index), self.flat.get_value(index))
+
+  def ParameterGroup(self, index):
+    if not self.should_write(index):
+      return ''
+    paramemter_list = map(lambda n: '{} {}'.format(self.accept(self.first_child[n]), self.accept(n)), self.flat.children(index))
+    return ', '.join(paramemter_list)
+
+  def ConditionalStatement(self, index):
+    if not self.should_write(index):
+      return ''
+    expr, then_section, else_section = self.flat.children(index)
+    s = 'if ({})\n'.format(self.accept(expr))
+    s += '{}{{\n'.format(self.get_indent_str())
+    s += self.accept(then_section)
+    s += '{}}}'.format(self.get_indent_str())
+
+    if not self.is_empty(else_section):
+      s += '\n{}else\n'.format(self.get_indent_str())
+      s += '{}{{\n'.format(self.get_indent_str())
+      s += self.accept(else_section)
+      s += '{}}}'.format(self.get_indent_str())
+
+    return s
+
+  def While(self, index):
+    if not self.should_write(index):
+      return ''
+    expr, section = self.flat.children(index)
+    s = 'while({})\n'.format(self.accept(expr))
+    s += '{}{{\n'.format(self.get_indent_str())
+    s += self.accept(section)
+    s += '{}}}'.format(self.get_indent_str())
+    return s
+
+  def For(self, index):
+    if not self.should_write(index):
+      return ''
+    init_stmt, expr, term_stmt, section = self.flat.children(index)
+    s = 'for({}; {}; {})\n'.format(self.accept(init_stmt), self.accept(expr), self.accept(term_stmt))
+    s += '{}{{\n'.format(self.get_indent_str())
+    s += self.accept(section)
+    s += '{}}}'.format(self.get_indent_str())
+    return s
+
+  def Return(self, index):
+    if not self.should_write(index):
+      return ''
+    expr = self.first_child[index]
+    if self.is_empty(expr):
+      return 'return'
+    return 'return {}'.format(self.accept(expr))
+
+  def Break(self, index):
+    if not self.should_write(index):
+      return ''
+    return 'break'
+
+  def Continue(self, index):
+    if not self.should_write(index):
+      return ''
+    return 'continue'
+
+  def ArgumentList(self, index):
+    if not self.should_write(index):
+      return ''
+    return ', '.join(map(self.accept, self.flat.children(index)))
+
+  def BinaryOp(self, index):
+    if not self.should_write(index):
+      return ''
+    op = self.flat.get_op(index)
+    left, right = self.flat.children(index)
+    if op == '++':
+      return '{}++'.format(self.accept(left))
+    elif op == '--':
+      return '{}--'.format(self.accept(left))
+    if self.flags[index] & USE_PAREN:
+      return '({} {} {})'.format(self.accept(left), op, self.accept(right))
+    return '{} {} {}'.format(self.accept(left), op, self.accept(right))
+
+  def UnaryOp(self, index):
+    if not self.should_write(index):
+      return ''
+    return '{}{}'.format(self.flat.get_op(index), self.accept(self.first_child[index]))
+
+  def FnExpression(self, index):
+    if not self.should_write(index):
+      return ''
+    expr, arguments = self.flat.children(index)
+    return '{}({})'.format(self.accept(expr), self.accept(arguments))
+
+  def VaExpression(self, index):
+    if not self.should_write(index):
+      return ''
+    if self.flat.get_value(index) is not None:
+      return '*{}'.format(self.flat.get_op(index))
+    return self.flat.get_op(index)
+
+  def ArrayExpression(self, index):
+    if not self.should_write(index):
+      return ''
+    expr, array_index = self.flat.children(index)
+    return '{}[{}]'.format(self.accept(expr), self.accept(array_index))
@@ -1,49 +1,250 @@
+import os
 import sys
 import traceback
-from model.symbol_table import SymbolTable
+import contextlib
+import math
+from model.symbol_table import Scope, set_watch
+from model.checkpoint import Checkpoint
+from model.breakpoint import Breakpoint, Watchpoint
 from model import ast
-from util.type import type_cast
+from model.flat_ast import FIELDS
 from util.function import globalFunctionTable, Function
+from util.helper import dispatchTables
+from util.lru import LRUCache, MISSING
+from visitor.purity_visitor import PurityVisitor
+
+# a node method is called with its frame and the (result, jump_stmt) of the child it asked for last.
+# it returns a child node to evaluate next, PAUSE when the line budget runs out, or its own (result, jump_stmt)
+PAUSE = object()
+
+# results kept per pure function in a batch run
+MEMO_SIZE = 2**16
+
+# continue runs in steps of this many lines until a breakpoint stops it
+CONTINUE_LINES = 2**16
+
+# pc is where the node resumes, values keeps the child results it still needs
+class Frame:
+  __slots__ = ('node', 'pc', 'values')
+
+  def __init__(self, node):
+    self.node = node
+    self.pc = 0
+    self.values = []
+
+  def copy(self):
+    frame = Frame(self.node)
+    frame.pc = self.pc
+    frame.values = list(self.values)
+    return frame
 
 class InterpreterVisitor:
-  def __init__(self, debug=False):
-    self.global_scope = SymbolTable(ast.EmptyNode(), globalFunctionTable)
-    self.scopes = [self.global_scope]
+  def __init__(self, debug=False, batch=False, checkpoint_interval=None, memo_size=MEMO_SIZE):
+    self.global_scope = None
+    self.scopes = []
     self.linenos = [1]
     self.line_num = 0
     self.debug = debug
+    self.batch = batch
     self.runtime_error = False
-
-  def accept(self, node):
-    try :
-      if node.terminated:
-        return node.terminated, node.result, None
-      terminated, result, jum_stmt = node.accept(self)
-      node.visited = True
-      return terminated, result, jum_stmt
-    except:
+    # frames of every node being evaluated, innermost last, so next resumes where it paused
+    self.continuation = []
+    # lines run so far, a checkpoint is kept every checkpoint_interval of them, 0 keeps only the start
+    self.line_count = 0
+    self.checkpoint_interval = checkpoint_interval
+    self.checkpoints = []
+    # breakpoints by line, hit is the one the last run stopped on, which the next run passes once
+    self.breakpoints = {}
+    self.breakpoint_count = 0
+    self.hit = None
+    self.at_breakpoint = False
+    # watchpoints by symbol, stop after a write that changes the value of a variable of that name
+    self.watchpoints = {}
+    self.watchpoint_count = 0
+    # (array, symbol) by id of every array a watched history has held, element stores bypass the histories
+    self.watched_arrays = {}
+    # results of pure functions by arguments, only a batch run skips their bodies since stepping shows every line
+    self.memo_size = memo_size
+    self.memos = {}
+    self.memo_hits = 0
+    self.memo_misses = 0
+
+  def start(self, node):
+    self.continuation = [Frame(node)]
+
+  def run(self):
+    if self.batch:
+      self.execute()
+      return
+    self.hit = None
+    lines = self.line_num
+    self.line_num = 0
+    while True:
+      step = lines
+      if self.checkpoints and self.checkpoint_interval:
+        step = min(lines, self.checkpoints[-1].line_count + self.checkpoint_interval - self.line_count)
+      lines -= step
+      self.line_num += step
+      self.execute()
+      self.line_count += step - self.line_num
+      if self.hit is not None:
+        self.line_num = 0
+        return
+      if not self.continuation:
+        return
+      if self.checkpoint_interval is not None:
+        if not self.checkpoints or self.checkpoint_interval and self.line_count >= self.checkpoints[-1].line_count + self.checkpoint_interval:
+          self.checkpoints.append(Checkpoint(self))
+      if not lines:
+        return
+
+  # runs until a breakpoint stops it or the program ends
+  def resume(self):
+    self.add_linenum(CONTINUE_LINES)
+    self.run()
+    while self.continuation and self.hit is None:
+      self.add_linenum(CONTINUE_LINES)
+      self.run()
+
+  def set_breakpoint(self, lineno, condition=None):
+    self.breakpoint_count += 1
+    self.breakpoints[lineno] = Breakpoint(self.breakpoint_count, lineno, condition)
+    return self.breakpoints[lineno]
+
+  # every history of the symbol calls watched on a write, those already defined included
+  def set_watchpoint(self, symbol, condition=None):
+    self.watchpoint_count += 1
+    self.watchpoints[symbol] = Watchpoint(self.watchpoint_count, symbol, condition)
+    set_watch(symbol, self.watched)
+    seen = set()
+    for scope in self.scopes:
+      while scope is not None and id(scope) not in seen:
+        seen.add(id(scope))
+        for slot, history in enumerate(scope.histories):
+          if history is not None and history.symbol == symbol:
+            history.watch = self.watched
+            if scope.values[slot].__class__ is list:
+              self.watched_arrays[id(scope.values[slot])] = scope.values[slot], symbol
+        scope = scope.parent
+    return self.watchpoints[symbol]
+
+  # restores the nearest checkpoint before line_count, then runs up to it without printing again.
+  # breakpoints and watchpoints do not stop it on the way
+  def goto(self, line_count):
+    breakpoints, self.breakpoints = self.breakpoints, {}
+    watchpoints, self.watchpoints = self.watchpoints, {}
+    self.at_breakpoint = False
+    try:
+      if line_count >= self.line_count:
+        self.add_linenum(line_count - self.line_count)
+        self.run()
+        return
+      while len(self.checkpoints) > 1 and self.checkpoints[-1].line_count > line_count:
+        self.checkpoints.pop()
+      self.checkpoints[-1].restore(self)
+      self.runtime_error = False
+      with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        self.add_linenum(line_count - self.line_count)
+        self.run()
+    finally:
+      self.breakpoints = breakpoints
+      self.watchpoints = watchpoints
+
+  def back(self, lines):
+    self.goto(max(self.line_count - lines, 0))
+
+  def execute(self):
+    continuation = self.continuation
+    if not continuation:
       if not self.runtime_error:
-        if self.debug:
-          exc_info = sys.exc_info()
-          traceback.print_exception(*exc_info)
-          del exc_info
-        print('Run-time error : line %d' % node.linespan[0])
-        self.runtime_error = True
+        print('End of program')
+      return
+    try:
+      self.drive(continuation)
+    except:
+      self.fail(continuation[-1].node)
+
+  # runs the frames of continuation until it is empty or one pauses, the failing frame is left on top
+  def drive(self, continuation):
+    table = dispatchTables[self.__class__]
+    value = None
+    while continuation:
+      frame = continuation[-1]
+      request = table[frame.node.__class__](self, frame, value)
+      if request.__class__ is tuple:
+        continuation.pop()
+        value = request
+      elif request is PAUSE:
+        return PAUSE
+      else:
+        continuation.append(Frame(request))
+        value = None
+    return value
+
+  # the condition runs where the program stopped, with its names bound to the scopes open there
+  def test(self, breakpoint):
+    if breakpoint.condition is None:
+      return True
+    self.bind(breakpoint.condition)
+    batch, line_num = self.batch, self.line_num
+    scopes, linenos = len(self.scopes), len(self.linenos)
+    self.batch, self.line_num = True, math.inf
+    try:
+      result, jump_stmt = self.drive([Frame(breakpoint.condition)])
+    except:
+      # a call that failed leaves its scope open
+      del self.scopes[scopes:]
+      del self.linenos[linenos:]
+      print('Invalid breakpoint condition')
+      return True
+    finally:
+      self.batch, self.line_num = batch, line_num
+    return result
+
+  def bind(self, node):
+    if node.__class__ is ast.VaExpression:
+      node.depth = node.slot = None
+      scope, depth = self.get_scope(), 0
+      while scope is not None and node.depth is None:
+        for slot, name in enumerate(scope.names):
+          if name == node.name and scope.histories[slot] is not None:
+            node.depth, node.slot = depth, slot
+        scope, depth = scope.parent, depth + 1
+      return
+    for field in FIELDS.get(node.__class__, ()):
+      self.bind(getattr(node, field))
+    if isinstance(node, ast.ArrayNode):
+      for child in node.childs:
+        self.bind(child)
+
+  def fail(self, node):
+    if self.debug:
+      exc_info = sys.exc_info()
+      traceback.print_exception(*exc_info)
+      del exc_info
+    print('Run-time error : line %d' % node.linespan[0])
+    self.runtime_error = True
+    self.continuation.clear()
 
   def print(self, symbol):
-    scope = self.get_scope()
-    if not scope.has(symbol):
-      print('Invisible variable')
+    history = self.get_scope().lookup(symbol)
+    if history is not None:
+      target = history.get()
+    elif globalFunctionTable.has(symbol):
+      target = globalFunctionTable.get(symbol)
     else:
-      target = scope.get(symbol)
-      print('N/A' if target is None else target)
+      print('Invisible variable')
+      return
+    print('N/A' if target is None else target)
 
   def trace(self, symbol):
-    scope = self.get_scope()
-    if not scope.has(symbol):
-      print('Invisible variable')
+    history = self.get_scope().lookup(symbol)
+    if history is not None:
+      history.trace()
+    elif globalFunctionTable.has(symbol):
+      globalFunctionTable.trace(symbol)
     else:
-      scope.trace(symbol)
+      print('Invisible variable')
 
   def add_linenum(self, line_num):
     self.line_num += line_num
@@ -59,6 +260,16 @@ class InterpreterVisitor:
   def get_scope(self):
     return self.scopes[-1]
 
+  def load(self, node):
+    if node.depth is None:
+      return globalFunctionTable.get(node.name)
+    return self.get_scope().get(node.depth, node.slot)
+
+  def store(self, node, lineno, value):
+    if node.depth is None:
+      raise KeyError(node.name)
+    self.get_scope().add(node.depth, node.slot, lineno, value)
+
   def get_lineno(self):
     return self.linenos[-1]
 
@@ -71,28 +282,58 @@ class InterpreterVisitor:
         return True
     return False
 
-  # return to_return, terminated, result, jump_stmt
-  def visit_with_linecount(self, node, lazy=False):
-    if not node.visited:
-      lineno = node.get_excutable_lineno()
-      if lineno > self.get_lineno() + self.line_num - 1:
-        self.update_lineno(self.get_lineno() + self.line_num)
-        self.line_num = 0
-        return True, False, None, None
-      else:
-        self.line_num -= lineno - self.get_lineno()
-        if lazy:
-          self.line_num -= 1
-        self.update_lineno(lineno)
-    prev_terminated = node.terminated
-    terminated, result, jump_stmt = self.accept(node)
-    if not terminated:
-      return True, False, None, None
-    elif jump_stmt is not None:
-      return True, node.terminated, node.result, jump_stmt
-    if lazy and (not prev_terminated):
-      self.update_lineno(self.get_lineno() + 1)
-    return False, node.terminated, node.result, None
+  # False when the budget runs out before lineno, the caller pauses and checks again when resumed
+  def reach(self, lineno, lazy=False):
+    # a batch run never pauses, so lines are not counted at all
+    if self.batch:
+      return True
+    if lineno > self.get_lineno() + self.line_num - 1:
+      self.update_lineno(self.get_lineno() + self.line_num)
+      self.line_num = 0
+      return False
+    if self.breakpoints and lineno in self.breakpoints and self.stop(self.breakpoints[lineno]):
+      # the lines left are not run, like a pause right before lineno
+      self.line_num -= lineno - self.get_lineno()
+      self.update_lineno(lineno)
+      return False
+    self.line_num -= lineno - self.get_lineno()
+    if lazy:
+      self.line_num -= 1
+    self.update_lineno(lineno)
+    return True
+
+  def stop(self, breakpoint):
+    if self.at_breakpoint:
+      self.at_breakpoint = False
+      return False
+    if not self.test(breakpoint):
+      return False
+    print('Breakpoint {}, line {}'.format(breakpoint.number, breakpoint.lineno))
+    self.hit = breakpoint
+    self.at_breakpoint = True
+    return True
+
+  # the write is done, so the run pauses at the next line it reaches as if its budget ran out there
+  def watched(self, history, old, value):
+    if value.__class__ is list:
+      self.watched_arrays[id(value)] = value, history.symbol
+    self.watch_stop(self.watchpoints.get(history.symbol), history.history[-1].lineno, history.symbol, old, value)
+
+  # a store into an array a watched variable holds, through any name it was passed as
+  def watched_element(self, array, index, lineno, old, value):
+    array, symbol = self.watched_arrays[id(array)]
+    self.watch_stop(self.watchpoints.get(symbol), lineno, '{}[{}]'.format(symbol, index), old, value)
+
+  def watch_stop(self, watchpoint, lineno, target, old, value):
+    # a batch run and a condition being tested never stop
+    if watchpoint is None or self.batch or old == value or self.hit is not None:
+      return
+    if not self.test(watchpoint):
+      return
+    print('Watchpoint {}, line {} : {} = {} (was {})'.format(watchpoint.number, lineno, target, value, 'N/A' if old is None else old))
+    self.hit = watchpoint
+    self.line_count -= self.line_num
+    self.line_num = 0
 
   # def ArrayNode(self): // all child node implemented by itself
 
@@ -100,163 +341,162 @@ class InterpreterVisitor:
 
   # def TypeNode(self): // maybe not necessary
 
-  def Const(self, node):
-    node.terminated = True
-    node.result = node.value
-    return node.terminated, node.result, None
-
-  def BaseSection(self, node):
-    for child in node.childs:
-      to_return, terminated, result, jump_stmt = self.visit_with_linecount(child, True)
-      if to_return:
-        node.terminated = terminated
-        node.result = result
-        return node.terminated, node.result, jump_stmt
-
-    section_end_lineno = node.linespan[1]
+  def Const(self, frame, value):
+    return frame.node.value, None
+
+  # pc 2i counts the line of child i, 2i + 1 waits for its result
+  def BaseSection(self, frame, value):
+    childs = frame.node.childs
+    while frame.pc < 2 * len(childs):
+      if frame.pc % 2:
+        if value[1] is not None:
+          return value
+        if not self.batch:
+          self.update_lineno(self.get_lineno() + 1)
+        frame.pc += 1
+        continue
+      child = childs[frame.pc // 2]
+      if not self.reach(child.get_excutable_lineno(), True):
+        return PAUSE
+      frame.pc += 1
+      return child
+
+    section_end_lineno = frame.node.linespan[1]
     if section_end_lineno > self.get_lineno() + self.line_num - 1:
       self.update_lineno(self.get_lineno() + self.line_num)
       self.line_num = 0
-      return False, None, None
-    else:
-      self.line_num -= section_end_lineno - self.get_lineno()
-      self.update_lineno(section_end_lineno)
-
-    node.terminated = True
-    return node.terminated, node.result, None
-
-  def RootSection(self, node):
-    for child in node.childs:
-      terminated, result, jump_stmt = self.accept(child)
-      if not terminated:
-        return False, None, None
+      return PAUSE
+    self.line_num -= section_end_lineno - self.get_lineno()
+    self.update_lineno(section_end_lineno)
+
+    return None, None
+
+  def RootSection(self, frame, value):
+    node = frame.node
+    if self.global_scope is None:
+      node.accept(PurityVisitor())
+      self.global_scope = Scope(node, node.names)
+      self.scopes.append(self.global_scope)
+    if frame.pc < len(node.childs):
+      frame.pc += 1
+      return node.childs[frame.pc - 1]
     print('End of program')
-    node.terminated = True
-    return node.terminated, node.result, None
+    return None, None
 
   # def Section(self): // covered by BaseSection
 
   # def Declaration(self): // all child node implemented by itself
 
-  def FnDeclaration(self, node):
-    if not node.visited:
-      scope = self.get_scope()
-      scope.define(node.name, node.type, node.linespan[0], node)
-    if node.name == 'main':
-      func_scope = SymbolTable(node, self.global_scope)
-      if not node.parameterGroup.is_empty():
-        for i, parameter in enumerate(node.parameterGroup.childs):
-          func_scope.define(parameter.name, parameter.type, parameter.linespan[0])
-      if not node.body.visited:
+  def FnDeclaration(self, frame, value):
+    node = frame.node
+    if frame.pc == 0:
+      self.get_scope().define(node.slot, node.linespan[0], node)
+      if node.name == 'main':
+        frame.pc = 1
         self.update_lineno(node.body.linespan[0])
-      terminated, result, jump_stmt = self.accept(node.body)
-      if not terminated:
-        return False, None, None
-    node.terminated = True
-    return node.terminated, node.result, None
-
-  def VaDeclarationList(self, node):
-    for child in node.childs:
-      self.accept(child)
-    node.terminated = True
-    return node.terminated, node.result, None
+        return node.body
+    return None, None
+
+  def VaDeclarationList(self, frame, value):
+    childs = frame.node.childs
+    if frame.pc < len(childs):
+      frame.pc += 1
+      return childs[frame.pc - 1]
+    return None, None
 
   # def Declarator(self): // all child node implemented by itself
 
   # def FnDeclarator(self): // covered by FnDeclaration
 
-  def VaDeclarator(self, node):
-    scope = self.get_scope()
-    scope.define(node.name, node.type, node.linespan[0], None)
-    return True, None, None
+  def VaDeclarator(self, frame, value):
+    node = frame.node
+    self.get_scope().define(node.slot, node.linespan[0], None)
+    return None, None
 
-  def ArrayDeclarator(self, node):
-    scope = self.get_scope()
-    scope.define(node.name, node.type, node.linespan[0], [None] * node.size)
-    return True, None, None
+  def ArrayDeclarator(self, frame, value):
+    node = frame.node
+    self.get_scope().define(node.slot, node.linespan[0], [None] * node.size)
+    return None, None
 
   # def ParameterGroup(self): // not necessary
 
-  def ConditionalStatement(self, node):
-    expr_terminated, expr_result, expr_jump_stmt = self.accept(node.expr)
-    if not expr_terminated:
-      return False, None, None
-    if expr_result or (not node.else_section.is_empty()):
+  # pc 1 picks the section, 2 counts its line, 3 waits for it
+  def ConditionalStatement(self, frame, value):
+    node = frame.node
+    if frame.pc == 0:
+      frame.pc = 1
+      return node.expr
+    if frame.pc == 1:
+      expr_result = value[0]
+      if not expr_result and node.else_section.is_empty():
+        self.update_lineno(node.linespan[1])
+        return None, None
       section = node.then_section if expr_result else node.else_section
-      if not section.scope_pushed:
-        self.push_scope(SymbolTable(node, self.get_scope()), section.linespan[0])
-        self.update_lineno(section.linespan[0])
-        section.scope_pushed = True
-      to_return, terminated, result, jump_stmt = self.visit_with_linecount(section)
-      if to_return:
-        if jump_stmt is not None:
-          self.pop_scope()
-        node.terminated = terminated
-        node.result = result
-        return node.terminated, node.result, jump_stmt
-      self.pop_scope()
-      self.line_num -= 1
-
+      self.push_scope(Scope(node, section.names, self.get_scope()), section.linespan[0])
+      self.update_lineno(section.linespan[0])
+      frame.values.append(section)
+      frame.pc = 2
+    if frame.pc == 2:
+      section = frame.values[0]
+      if not self.reach(section.get_excutable_lineno()):
+        return PAUSE
+      frame.pc = 3
+      return section
+    self.pop_scope()
+    if value[1] is not None:
+      return value
+    self.line_num -= 1
     self.update_lineno(node.linespan[1])
-    node.terminated = True
-    return node.terminated, node.result, None
-
-  def LoopStatement(self, node):
-    if not node.visited:
-      node.save_origin()
-      scope = self.get_scope()
-      self.push_scope(SymbolTable(node, scope), node.get_excutable_lineno() + 1)
-
-    if node.init_stmt is not None:
-      init_stmt_terminated, init_stmt_result, init_stmt_jump_stmt = self.accept(node.init_stmt)
-      if not init_stmt_terminated:
-        return False, None, None
+    return None, None
 
+  # pc 1 counts the line of expr, 2 waits for it, 3 counts the line of section, 4 waits for it, 5 for term_stmt
+  def LoopStatement(self, frame, value):
+    node = frame.node
     while True:
-      to_return, expr_terminated, expr_result, expr_jump_stmt = self.visit_with_linecount(node.expr)
-      if to_return:
-        node.terminated = expr_terminated
-        node.result = expr_result
-        return node.terminated, node.result, expr_jump_stmt
-
-      if not expr_result:
-        self.pop_scope()
-        node.terminated = True
-        self.update_lineno(node.linespan[1])
-        self.line_num -= 1
-        return node.terminated, node.result, None
-
-      to_return, terminated, result, jump_stmt = self.visit_with_linecount(node.section)
-      if to_return:
+      if frame.pc == 0:
+        self.push_scope(Scope(node, node.names, self.get_scope()), node.get_excutable_lineno() + 1)
+        frame.pc = 1
+        if node.init_stmt is not None:
+          return node.init_stmt
+      elif frame.pc == 1:
+        if not self.reach(node.expr.get_excutable_lineno()):
+          return PAUSE
+        frame.pc = 2
+        return node.expr
+      elif frame.pc == 2:
+        if not value[0]:
+          self.pop_scope()
+          self.update_lineno(node.linespan[1])
+          self.line_num -= 1
+          return None, None
+        frame.pc = 3
+      elif frame.pc == 3:
+        if not self.reach(node.section.get_excutable_lineno()):
+          return PAUSE
+        frame.pc = 4
+        return node.section
+      elif frame.pc == 4:
+        result, jump_stmt = value
         if jump_stmt is not None:
           if isinstance(jump_stmt, ast.Return):
             self.pop_scope()
             self.update_lineno(node.linespan[1])
-            node.terminated = terminated
-            node.result = result
-            return node.terminated, node.result, jump_stmt
+            return result, jump_stmt
           elif isinstance(jump_stmt, ast.Break):
             self.pop_scope()
             self.update_lineno(node.linespan[1])
-            node.terminated = terminated
-            return node.terminated, None, None
+            return None, None
           elif isinstance(jump_stmt, ast.Continue):
             pass
           else:
             raise ValueError
-        else:
-          node.terminated = terminated
-          return node.terminated, None, None
-
-      if node.term_stmt is not None:
-        term_stmt_terminated, term_stmt_result, term_stmt_jump_stmt = self.accept(node.term_stmt)
-        if (not term_stmt_terminated):
-          return False, None, None
-
-      self.update_lineno(node.linespan[0])
-      self.line_num -= 1
-
-      node.load_origin()
+        frame.pc = 5
+        if node.term_stmt is not None:
+          return node.term_stmt
+      else:
+        self.update_lineno(node.linespan[0])
+        self.line_num -= 1
+        frame.pc = 1
 
   # def While(self): // covered by LoopStatement
 
@@ -264,174 +504,193 @@ class InterpreterVisitor:
 
   # def JumpStatement(self): // all child node implemented by itself
 
-  def Return(self, node):
-    if not node.expr.is_empty():
-      terminated, result, jump_stmt = self.accept(node.expr)
-      if (not terminated):
-        return False, None, None
-      node.result = result
-    node.terminated = True
-    return node.terminated, node.result, node
+  def Return(self, frame, value):
+    node = frame.node
+    if frame.pc == 0 and not node.expr.is_empty():
+      frame.pc = 1
+      return node.expr
+    return (None if value is None else value[0]), node
 
-  def Break(self, node):
+  def Break(self, frame, value):
     if not self.is_in_loop():
       raise ValueError
-    node.terminated = True
-    return node.terminated, node.result, node
+    return None, frame.node
 
-  def Continue(self, node):
+  def Continue(self, frame, value):
     if not self.is_in_loop():
       raise ValueError
-    node.terminated = True
-    return node.terminated, node.result, node
-
-  def ArgumentList(self, node):
-    results = []
-    for child in node.childs:
-      terminated, result, jump_stmt = self.accept(child)
-      if (not terminated):
-        return False, None, None
-      results.append(result)
-    node.result = results
-    node.terminated = True
-    return node.terminated, node.result, None
-
-  def BinaryOp(self, node):
-    left_terminated, left_result, left_jump_stmt = self.accept(node.left)
-    if not left_terminated:
-      return False, None, None
-    right_terminated, right_result, right_jump_stmt = self.accept(node.right)
-    if not right_terminated:
-      return False, None, None
+    return None, frame.node
+
+  def ArgumentList(self, frame, value):
+    childs = frame.node.childs
+    if frame.pc:
+      frame.values.append(value[0])
+    if frame.pc < len(childs):
+      frame.pc += 1
+      return childs[frame.pc - 1]
+    return frame.values, None
+
+  def BinaryOp(self, frame, value):
+    node = frame.node
+    if frame.pc == 0:
+      frame.pc = 1
+      return node.left
+    if frame.pc == 1:
+      frame.pc = 2
+      frame.values.append(value[0])
+      return node.right
+    left_result = frame.values[0]
+    right_result = value[0]
 
     if node.op == '==':
-      node.result = left_result == right_result
+      result = left_result == right_result
     elif node.op == '!=':
-      node.result = left_result != right_result
+      result = left_result != right_result
     elif node.op == '<':
-      node.result = left_result < right_result
+      result = left_result < right_result
     elif node.op == '>':
-      node.result = left_result > right_result
+      result = left_result > right_result
     elif node.op == '<=':
-      node.result = left_result <= right_result
+      result = left_result <= right_result
     elif node.op == '>=':
-      node.result = left_result >= right_result
+      result = left_result >= right_result
     elif node.op == '+':
-      node.result = left_result + right_result
+      result = left_result + right_result
     elif node.op == '-':
-      node.result = left_result - right_result
+      result = left_result - right_result
     elif node.op == '&&':
-      node.result = left_result and right_result
+      result = left_result and right_result
     elif node.op == '||':
-      node.result = left_result or right_result
+      result = left_result or right_result
     elif node.op == '*':
-      node.result = left_result * right_result
+      result = left_result * right_result
     elif node.op == '/':
-      node.result = left_result / right_result
+      result = left_result / right_result
     elif node.op == '%':
-      node.result = left_result % right_result
+      result = left_result % right_result
     elif node.op == '++':
-      node.result = left_result + right_result
+      result = left_result + right_result
     elif node.op == '--':
-      node.result = left_result - right_result
+      result = left_result - right_result
     else:
       raise ValueError
 
-    if node.result is True:
-      node.result = 1
-    elif node.result is False:
-      node.result = 0
+    if result is True:
+      result = 1
+    elif result is False:
+      result = 0
 
     if node.op == '++' or node.op == '--':
-      scope = self.get_scope()
       if node.left.__class__ is ast.VaExpression:
-        scope.add(node.left.name, node.linespan[0], node.result)
-    node.terminated = True
-    return node.terminated, node.result, None
-
-  def AssignOp(self, node):
-    right_terminated, right_result, right_jump_stmt = self.accept(node.right)
-    if not right_terminated:
-      return False, None, None
-
-    scope = self.get_scope()
-    if node.left.__class__ is ast.VaExpression:
-      symbol = node.left.name
-      right_result = type_cast(scope.get_type(symbol), right_result)
-      scope.add(symbol, node.linespan[0], right_result)
-      node.result = scope.get(symbol)
-    elif node.left.__class__ is ast.ArrayExpression:
-      expr_terminated, expr_result, expr_jump_stmt = self.accept(node.left.expr)
-      if not expr_terminated:
-        return False, None, None
-      index_terminated, index_result, index_jump_stmt = self.accept(node.left.index)
-      if not index_terminated:
-        return False, None, None
-      expr_result[index_result] = right_result
-      node.result = expr_result
-    else:
-      raise ValueError
-
-    node.terminated = True
-    return node.terminated, node.result, None
-
-  def UnaryOp(self, node):
-    expr_terminated, expr_result, expr_jump_stmt = self.accept(node.expr)
-    if not expr_terminated:
-      return False, None, None
-
+        self.store(node.left, node.linespan[0], result)
+    return result, None
+
+  def AssignOp(self, frame, value):
+    node = frame.node
+    if frame.pc == 0:
+      frame.pc = 1
+      return node.right
+    if frame.pc == 1:
+      right_result = value[0]
+      if node.left.__class__ is ast.VaExpression:
+        if node.left.depth is None:
+          raise KeyError(node.left.name)
+        result = node.left.cast(right_result)
+        self.store(node.left, node.linespan[0], result)
+        return result, None
+      elif node.left.__class__ is ast.ArrayExpression:
+        frame.values.append(right_result)
+        frame.pc = 2
+        return node.left.expr
+      else:
+        raise ValueError
+    if frame.pc == 2:
+      frame.values.append(value[0])
+      frame.pc = 3
+      return node.left.index
+    right_result, expr_result = frame.values
+    if self.watched_arrays and id(expr_result) in self.watched_arrays:
+      old = expr_result[value[0]]
+      expr_result[value[0]] = right_result
+      self.watched_element(expr_result, value[0], frame.node.linespan[0], old, right_result)
+      return expr_result, None
+    expr_result[value[0]] = right_result
+    return expr_result, None
+
+  def UnaryOp(self, frame, value):
+    node = frame.node
+    if frame.pc == 0:
+      frame.pc = 1
+      return node.expr
+    expr_result = value[0]
 
     if node.op == '+':
-      node.result = expr_result
+      result = expr_result
     elif node.op == '-':
-      node.result = -expr_result
+      result = -expr_result
     else:
       raise ValueError
 
-    node.terminated = True
-    return node.terminated, node.result, None
-
-  def FnExpression(self, node):
-    expr_terminated, expr_result, expr_jump_stmt = self.accept(node.expr)
-    if not expr_terminated:
-      return False, None, None
-    arguments_terminated, arguments_result, arguments_jump_stmt = self.accept(node.arguments)
-    if not arguments_terminated:
-      return False, None, None
+    return result, None
+
+  # pc 1 waits for the function, 2 for the arguments, 3 for the body
+  def FnExpression(self, frame, value):
+    node = frame.node
+    if frame.pc == 0:
+      frame.pc = 1
+      return node.expr
+    if frame.pc == 1:
+      frame.values.append(value[0])
+      frame.pc = 2
+      if isinstance(node.arguments, ast.Node):
+        return node.arguments
+      value = [], None
+    if frame.pc == 3:
+      self.pop_scope()
+      if len(frame.values) > 1:
+        self.memos[frame.values[0]].put(frame.values[1], value[0])
+      return value[0], None
+    expr_result = frame.values[0]
+    arguments_result = value[0]
 
     if expr_result.__class__ is Function:
-      node.result = expr_result.run(*arguments_result)
-    else:
-      if not node.initialized:
-        node.body = expr_result.body.clone()
-        func_scope = SymbolTable(expr_result, self.global_scope)
-        self.push_scope(func_scope, node.body.linespan[0])
-        for i, parameter in enumerate(expr_result.parameterGroup.childs):
-          func_scope.define(parameter.name, parameter.type, parameter.linespan[0], arguments_result[i])
-        node.initialized = True
-
-      body_terminated, body_result, body_jump_stmt = self.accept(node.body)
-      if not body_terminated:
-        return False, None, None
-      self.pop_scope()
-      node.result = body_result
-    node.terminated = True
-    return node.terminated, node.result, None
-
-  def VaExpression(self, node):
-    scope = self.get_scope()
-    node.result = scope.get(node.name)
-    node.terminated = True
-    return node.terminated, node.result, None
-
-  def ArrayExpression(self, node):
-    expr_terminated, expr_result, expr_jump_stmt = self.accept(node.expr)
-    if not expr_terminated:
-      return False, None, None
-    index_terminated, index_result, index_jump_stmt = self.accept(node.index)
-    if not index_terminated:
-      return False, None, None
-
-    node.result = expr_result[index_result]
-    node.terminated = True
-    return node.terminated, node.result, None
+      return expr_result.run(*arguments_result), None
+
+    if self.batch and self.memo_size and expr_result.pure:
+      # the classes keep f(1) apart from f(1.0), an array argument is not hashable and is not cached
+      key = tuple(arguments_result), tuple(argument.__class__ for argument in arguments_result)
+      memo = self.memos.get(expr_result)
+      if memo is None:
+        memo = self.memos[expr_result] = LRUCache(self.memo_size)
+      try:
+        result = memo.get(key)
+      except TypeError:
+        result, key = MISSING, None
+      if result is not MISSING:
+        self.memo_hits += 1
+        return result, None
+      if key is not None:
+        self.memo_misses += 1
+        frame.values.append(key)
+
+    func_scope = Scope(expr_result, expr_result.names, self.global_scope)
+    self.push_scope(func_scope, expr_result.body.linespan[0])
+    if not expr_result.parameterGroup.is_empty():
+      for i, parameter in enumerate(expr_result.parameterGroup.childs):
+        func_scope.define(parameter.slot, parameter.linespan[0], arguments_result[i])
+    frame.pc = 3
+    return expr_result.body
+
+  def VaExpression(self, frame, value):
+    return self.load(frame.node), None
+
+  def ArrayExpression(self, frame, value):
+    node = frame.node
+    if frame.pc == 0:
+      frame.pc = 1
+      return node.expr
+    if frame.pc == 1:
+      frame.values.append(value[0])
+      frame.pc = 2
+      return node.index
+    return frame.values[0][value[0]], None
@@ -0,0 +1,174 @@
+from model import ast
+from util.function import globalFunctionTable
+
+# sets pure on every FnDeclaration : a function is not pure when it calls printf or another function that is not,
+# writes an array or a name declared outside of it, or reads a variable declared outside of it
+class PurityVisitor:
+  def __init__(self):
+    self.functions = {}
+    self.function = None
+    self.scopes = []
+    self.impure = set()
+    self.calls = {}
+
+  def declare(self, name):
+    if self.scopes:
+      self.scopes[-1].add(name)
+
+  def is_local(self, name):
+    for scope in self.scopes:
+      if name in scope:
+        return True
+    return False
+
+  # code at the top level runs once, only function bodies matter
+  def taint(self):
+    if self.function is not None:
+      self.impure.add(self.function.name)
+
+  def write(self, node):
+    if node.__class__ is ast.VaExpression:
+      if not self.is_local(node.name):
+        self.taint()
+    else:
+      self.taint()
+
+  # def Node(self): // all child node implemented by itself
+
+  # def ArrayNode(self): // all child node implemented by itself
+
+  def EmptyNode(self, node):
+    pass
+
+  def TypeNode(self, node):
+    pass
+
+  def Const(self, node):
+    pass
+
+  def BaseSection(self, node):
+    for child in node.childs:
+      child.accept(self)
+
+  def RootSection(self, node):
+    for child in node.childs:
+      if isinstance(child, ast.FnDeclaration):
+        self.functions[child.name] = child
+    for child in node.childs:
+      child.accept(self)
+    # impurity flows from callees to callers until nothing changes
+    changed = True
+    while changed:
+      changed = False
+      for name, callees in self.calls.items():
+        if name not in self.impure and not callees.issubset(self.functions.keys() - self.impure):
+          self.impure.add(name)
+          changed = True
+    for name, function in self.functions.items():
+      function.pure = name not in self.impure
+    return node
+
+  def Section(self, node):
+    self.scopes.append(set())
+    self.BaseSection(node)
+    self.scopes.pop()
+
+  # def Declaration(self): // all child node implemented by itself
+
+  def FnDeclaration(self, node):
+    self.function = node
+    self.calls[node.name] = set()
+    self.scopes = [set()]
+    if not node.parameterGroup.is_empty():
+      for parameter in node.parameterGroup.childs:
+        self.declare(parameter.name)
+    node.body.accept(self)
+    self.scopes = []
+    self.function = None
+
+  def VaDeclarationList(self, node):
+    for child in node.childs:
+      child.accept(self)
+
+  # def Declarator(self): // all child node implemented by itself
+
+  # def FnDeclarator(self): // covered by FnDeclaration
+
+  def VaDeclarator(self, node):
+    self.declare(node.name)
+
+  def ArrayDeclarator(self, node):
+    self.declare(node.name)
+
+  # def ParameterGroup(self): // covered by FnDeclaration
+
+  def ConditionalStatement(self, node):
+    node.expr.accept(self)
+    for section in (node.then_section, node.else_section):
+      if not section.is_empty():
+        section.accept(self)
+
+  def LoopStatement(self, node):
+    self.scopes.append(set())
+    if node.init_stmt is not None:
+      node.init_stmt.accept(self)
+    node.expr.accept(self)
+    node.section.accept(self)
+    if node.term_stmt is not None:
+      node.term_stmt.accept(self)
+    self.scopes.pop()
+
+  # def While(self): // covered by LoopStatement
+
+  # def For(self): // covered by LoopStatement
+
+  # def JumpStatement(self): // all child node implemented by itself
+
+  def Return(self, node):
+    node.expr.accept(self)
+
+  def Break(self, node):
+    pass
+
+  def Continue(self, node):
+    pass
+
+  def ArgumentList(self, node):
+    for child in node.childs:
+      child.accept(self)
+
+  def BinaryOp(self, node):
+    if node.op == '++' or node.op == '--':
+      self.write(node.left)
+    node.left.accept(self)
+    node.right.accept(self)
+
+  def AssignOp(self, node):
+    self.write(node.left)
+    if node.left.__class__ is ast.ArrayExpression:
+      node.left.accept(self)
+    node.right.accept(self)
+
+  def UnaryOp(self, node):
+    node.expr.accept(self)
+
+  def FnExpression(self, node):
+    if node.expr.__class__ is not ast.VaExpression:
+      self.taint()
+      node.expr.accept(self)
+    elif self.function is not None:
+      name = node.expr.name
+      if name in self.functions and not self.is_local(name):
+        self.calls[self.function.name].add(name)
+      elif not globalFunctionTable.has(name) or not globalFunctionTable.is_pure_function(name):
+        self.taint()
+    if isinstance(node.arguments, ast.Node):
+      node.arguments.accept(self)
+
+  def VaExpression(self, node):
+    if not self.is_local(node.name) and node.name not in self.functions:
+      self.taint()
+
+  def ArrayExpression(self, node):
+    node.expr.accept(self)
+    node.index.accept(self)
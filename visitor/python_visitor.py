@@ -0,0 +1,343 @@
+from model import ast
+from util.type import type_caster, no_cast
+from util.function import globalFunctionTable
+
+CAST_NAMES = {
+  int: 'int',
+  float: 'float',
+  str: 'str',
+  no_cast: None,
+}
+
+COMPARE_OPS = ('==', '!=', '<', '>', '<=', '>=')
+ARITHMETIC_OPS = ('+', '-', '*', '/', '%')
+
+class PythonVisitor:
+  def __init__(self):
+    self.lines = []
+    self._indent = 0
+    self.global_scope = {}
+    # every name the root scope ends up with, those declared later are visible like in ResolverVisitor
+    self.root_names = {}
+    self.scopes = []
+    self.nonlocals = None
+    self.loops = []
+    self.in_function = False
+    self.slot = 0
+
+  def __str__(self):
+    return '\n'.join(self.lines) + '\n'
+
+  def indent(self):
+    self._indent += 1
+
+  def unindent(self):
+    self._indent -= 1
+
+  def write(self, s, node=None):
+    line = '  ' * self._indent + s
+    if node is not None and node.linespan is not None:
+      line += '  # {}'.format(node.linespan[0])
+    self.lines.append(line)
+    return len(self.lines) - 1
+
+  def push_scope(self):
+    self.scopes.append({})
+
+  def pop_scope(self):
+    self.scopes.pop()
+
+  def declare(self, name, type):
+    scope = self.scopes[-1]
+    if scope is self.global_scope:
+      pyname = '{}_g'.format(name)
+    elif name in scope:
+      pyname = scope[name][0]
+    else:
+      pyname = '{}_{}'.format(name, self.slot)
+      self.slot += 1
+    scope[name] = (pyname, CAST_NAMES.get(type_caster(type), '_invalid_cast'))
+    return pyname
+
+  # the top level declarations and those of the main body, the last one of a name wins
+  def declare_root(self, node):
+    for child in node.childs:
+      declarations = [child]
+      if isinstance(child, ast.FnDeclaration) and child.name == 'main':
+        declarations += child.body.childs
+      for declaration in declarations:
+        if isinstance(declaration, ast.VaDeclarationList):
+          declarators = declaration.childs
+        elif isinstance(declaration, ast.FnDeclaration):
+          declarators = [declaration]
+        else:
+          continue
+        for declarator in declarators:
+          self.root_names[declarator.name] = ('{}_g'.format(declarator.name), CAST_NAMES.get(type_caster(declarator.type), '_invalid_cast'))
+
+  def resolve(self, name):
+    for scope in reversed(self.scopes):
+      if name in scope:
+        return scope[name]
+    return self.root_names.get(name)
+
+  def is_global(self, name, target):
+    return target is self.global_scope.get(name) or target is self.root_names.get(name)
+
+  def store(self, name, value, cast, as_expression):
+    target = self.resolve(name)
+    if target is None:
+      return '_undefined({!r})'.format(name)
+    pyname, cast_name = target
+    if cast and cast_name is not None:
+      value = '{}({})'.format(cast_name, value)
+    if self.nonlocals is not None and self.is_global(name, target):
+      self.nonlocals.add(pyname)
+    if as_expression:
+      return '({} := {})'.format(pyname, value)
+    return '{} = {}'.format(pyname, value)
+
+  def condition(self, node):
+    if node.__class__ is ast.BinaryOp and node.op in COMPARE_OPS:
+      return '{} {} {}'.format(node.left.accept(self), node.op, node.right.accept(self))
+    return node.accept(self)
+
+  def has_return(self, node):
+    if isinstance(node, ast.Return):
+      return True
+    return any(self.has_return(child) for child in getattr(node, 'childs', [])) or \
+      any(self.has_return(getattr(node, prop)) for prop in ('then_section', 'else_section', 'section') if hasattr(node, prop))
+
+  def statement(self, node):
+    if isinstance(node, ast.ConditionalStatement) or isinstance(node, ast.LoopStatement) \
+        or isinstance(node, ast.VaDeclarationList) or isinstance(node, ast.JumpStatement) or isinstance(node, ast.FnDeclaration):
+      node.accept(self)
+    elif node.__class__ is ast.AssignOp and node.left.__class__ is ast.VaExpression:
+      self.write(self.store(node.left.name, node.right.accept(self), True, False), node)
+    elif node.__class__ is ast.AssignOp and node.left.__class__ is ast.ArrayExpression:
+      s = '{}[{}] = {}'.format(node.left.expr.accept(self), node.left.index.accept(self), node.right.accept(self))
+      self.write(s, node)
+    elif node.__class__ is ast.BinaryOp and (node.op == '++' or node.op == '--') and node.left.__class__ is ast.VaExpression:
+      value = '{} {} 1'.format(node.left.accept(self), node.op[0])
+      self.write(self.store(node.left.name, value, False, False), node)
+    else:
+      self.write(node.accept(self), node)
+
+  def section(self, node):
+    self.indent()
+    start = len(self.lines)
+    for child in node.childs:
+      self.statement(child)
+    if len(self.lines) == start:
+      self.write('pass')
+    self.unindent()
+
+  # main runs in the scope that declares it, like ResolverVisitor, so the other functions see its variables
+  def function(self, node, name):
+    parameters = []
+    if node.name != 'main':
+      self.push_scope()
+    if not node.parameterGroup.is_empty():
+      for parameter in node.parameterGroup.childs:
+        parameters.append(self.declare(parameter.name, parameter.type))
+    parameters.append('*_')
+    self.write('def {}({}):'.format(name, ', '.join(parameters)), node)
+    nonlocals, loops, in_function = self.nonlocals, self.loops, self.in_function
+    self.nonlocals, self.loops, self.in_function = set(), [], True
+    self.indent()
+    header = self.write('')
+    self.unindent()
+    self.section(node.body)
+    if self.nonlocals:
+      self.lines[header] = '  ' * (self._indent + 1) + 'nonlocal {}'.format(', '.join(sorted(self.nonlocals)))
+    else:
+      self.lines.pop(header)
+    self.nonlocals, self.loops, self.in_function = nonlocals, loops, in_function
+    if node.name != 'main':
+      self.pop_scope()
+
+  def Node(self, node):
+    raise ValueError
+
+  def ArrayNode(self, node):
+    raise ValueError
+
+  def EmptyNode(self, node):
+    return 'None'
+
+  # def TypeNode(self): // not necessary
+
+  def Const(self, node):
+    return repr(node.value)
+
+  def BaseSection(self, node):
+    self.section(node)
+
+  def RootSection(self, node):
+    self.write('def __program__():')
+    self.indent()
+    header = self.write('')
+    self.scopes = [self.global_scope]
+    self.declare_root(node)
+    for child in node.childs:
+      if self.has_return(child):
+        self.write('try:')
+        self.indent()
+        self.statement(child)
+        self.unindent()
+        self.write('except _RootReturn:')
+        self.write('  pass')
+      else:
+        self.statement(child)
+    global_names = sorted(pyname for pyname, cast_name in self.global_scope.values())
+    if global_names:
+      self.lines[header] = '  ' * self._indent + ' = '.join(global_names) + ' = None'
+    else:
+      self.lines.pop(header)
+    self.unindent()
+    self.write('')
+    self.write('__program__()')
+    return str(self)
+
+  # def Section(self): // covered by BaseSection
+
+  # def Declaration(self): // all child node implemented by itself
+
+  def FnDeclaration(self, node):
+    name = self.declare(node.name, node.type)
+    if self.nonlocals is not None and self.scopes[-1] is self.global_scope:
+      self.nonlocals.add(name)
+    self.function(node, name)
+    if node.name == 'main':
+      self.write('{}()'.format(name), node)
+
+  def VaDeclarationList(self, node):
+    for child in node.childs:
+      child.accept(self)
+
+  # def Declarator(self): // all child node implemented by itself
+
+  # def FnDeclarator(self): // covered by FnDeclaration
+
+  def VaDeclarator(self, node):
+    name = self.declare(node.name, node.type)
+    if self.nonlocals is not None and self.scopes[-1] is self.global_scope:
+      self.nonlocals.add(name)
+    self.write('{} = None'.format(name), node)
+
+  def ArrayDeclarator(self, node):
+    name = self.declare(node.name, node.type)
+    if self.nonlocals is not None and self.scopes[-1] is self.global_scope:
+      self.nonlocals.add(name)
+    self.write('{} = [None] * {}'.format(name, node.size), node)
+
+  # def ParameterGroup(self): // covered by function
+
+  def ConditionalStatement(self, node):
+    self.write('if {}:'.format(self.condition(node.expr)), node.expr)
+    self.push_scope()
+    self.section(node.then_section)
+    self.pop_scope()
+    if not node.else_section.is_empty():
+      self.write('else:')
+      self.push_scope()
+      self.section(node.else_section)
+      self.pop_scope()
+
+  def LoopStatement(self, node):
+    self.push_scope()
+    if node.init_stmt is not None:
+      self.statement(node.init_stmt)
+    self.write('while {}:'.format(self.condition(node.expr)), node.expr)
+    self.loops.append(node)
+    self.indent()
+    start = len(self.lines)
+    for child in node.section.childs:
+      self.statement(child)
+    if node.term_stmt is not None:
+      self.statement(node.term_stmt)
+    if len(self.lines) == start:
+      self.write('pass')
+    self.unindent()
+    self.loops.pop()
+    self.pop_scope()
+
+  # def While(self): // covered by LoopStatement
+
+  # def For(self): // covered by LoopStatement
+
+  # def JumpStatement(self): // all child node implemented by itself
+
+  def Return(self, node):
+    if not self.in_function:
+      self.write('raise _RootReturn', node)
+    elif node.expr.is_empty():
+      self.write('return', node)
+    else:
+      self.write('return {}'.format(node.expr.accept(self)), node)
+
+  def Break(self, node):
+    if not self.loops:
+      self.write('_fail()', node)
+      return
+    self.write('break', node)
+
+  def Continue(self, node):
+    if not self.loops:
+      self.write('_fail()', node)
+      return
+    # continue still runs the term statement of a for loop
+    if self.loops[-1].term_stmt is not None:
+      self.statement(self.loops[-1].term_stmt)
+    self.write('continue', node)
+
+  def ArgumentList(self, node):
+    return ', '.join(child.accept(self) for child in node.childs)
+
+  def BinaryOp(self, node):
+    left = node.left.accept(self)
+    right = node.right.accept(self)
+    if node.op in COMPARE_OPS:
+      return '(1 if {} {} {} else 0)'.format(left, node.op, right)
+    elif node.op in ARITHMETIC_OPS:
+      return '({} {} {})'.format(left, node.op, right)
+    elif node.op == '&&':
+      return '_and({}, {})'.format(left, right)
+    elif node.op == '||':
+      return '_or({}, {})'.format(left, right)
+    elif node.op == '++' or node.op == '--':
+      value = '{} {} {}'.format(left, node.op[0], right)
+      if node.left.__class__ is ast.VaExpression:
+        return self.store(node.left.name, value, False, True)
+      return '({})'.format(value)
+    return '_fail()'
+
+  def AssignOp(self, node):
+    right = node.right.accept(self)
+    if node.left.__class__ is ast.VaExpression:
+      return self.store(node.left.name, right, True, True)
+    elif node.left.__class__ is ast.ArrayExpression:
+      return '_store({}, {}, {})'.format(right, node.left.expr.accept(self), node.left.index.accept(self))
+    return '_fail()'
+
+  def UnaryOp(self, node):
+    if node.op == '-':
+      return '(-{})'.format(node.expr.accept(self))
+    elif node.op == '+':
+      return node.expr.accept(self)
+    return '_fail()'
+
+  def FnExpression(self, node):
+    arguments = node.arguments.accept(self) if isinstance(node.arguments, ast.ArgumentList) else ''
+    return '{}({})'.format(node.expr.accept(self), arguments)
+
+  def VaExpression(self, node):
+    target = self.resolve(node.name)
+    if target is not None:
+      return target[0]
+    elif globalFunctionTable.has(node.name):
+      return '_builtin_{}'.format(node.name)
+    return '_undefined({!r})'.format(node.name)
+
+  def ArrayExpression(self, node):
+    return '{}[{}]'.format(node.expr.accept(self), node.index.accept(self))
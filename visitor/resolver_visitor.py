@@ -0,0 +1,158 @@
+from model import ast
+from util.type import type_caster
+
+class ResolverVisitor:
+  def __init__(self):
+    self.scopes = []
+    self.pending = []
+
+  def push_scope(self, node):
+    node.names = []
+    self.scopes.append((node.names, {}))
+
+  def pop_scope(self):
+    self.scopes.pop()
+
+  def declare(self, node, type):
+    names, symbols = self.scopes[-1]
+    if node.name in symbols:
+      slot = symbols[node.name][0]
+    else:
+      slot = len(names)
+      names.append(node.name)
+    symbols[node.name] = (slot, type_caster(type))
+    node.slot = slot
+
+  def resolve(self, node):
+    for depth, (names, symbols) in enumerate(reversed(self.scopes)):
+      if node.name in symbols:
+        node.depth = depth
+        node.slot, node.cast = symbols[node.name]
+        return
+    # globals declared later are visible once the root has run up to them
+    self.pending.append((node, len(self.scopes) - 1))
+
+  def bind_pending(self):
+    names, symbols = self.scopes[0]
+    for node, depth in self.pending:
+      if node.name in symbols:
+        node.depth = depth
+        node.slot, node.cast = symbols[node.name]
+    self.pending = []
+
+  # def Node(self): // all child node implemented by itself
+
+  # def ArrayNode(self): // all child node implemented by itself
+
+  def EmptyNode(self, node):
+    pass
+
+  def TypeNode(self, node):
+    pass
+
+  def Const(self, node):
+    pass
+
+  def BaseSection(self, node):
+    for child in node.childs:
+      child.accept(self)
+
+  def RootSection(self, node):
+    self.push_scope(node)
+    for child in node.childs:
+      child.accept(self)
+    self.bind_pending()
+    self.pop_scope()
+    return node
+
+  # def Section(self): // covered by BaseSection
+
+  # def Declaration(self): // all child node implemented by itself
+
+  def FnDeclaration(self, node):
+    self.declare(node, node.type)
+    # main runs in the scope that declares it
+    if node.name == 'main':
+      node.body.accept(self)
+      return
+    self.push_scope(node)
+    if not node.parameterGroup.is_empty():
+      for parameter in node.parameterGroup.childs:
+        self.declare(parameter, parameter.type)
+    node.body.accept(self)
+    self.pop_scope()
+
+  def VaDeclarationList(self, node):
+    for child in node.childs:
+      child.accept(self)
+
+  # def Declarator(self): // all child node implemented by itself
+
+  # def FnDeclarator(self): // covered by FnDeclaration
+
+  def VaDeclarator(self, node):
+    self.declare(node, node.type)
+
+  def ArrayDeclarator(self, node):
+    self.declare(node, node.type)
+
+  # def ParameterGroup(self): // covered by FnDeclaration
+
+  def ConditionalStatement(self, node):
+    node.expr.accept(self)
+    for section in (node.then_section, node.else_section):
+      if section.is_empty():
+        continue
+      self.push_scope(section)
+      section.accept(self)
+      self.pop_scope()
+
+  def LoopStatement(self, node):
+    self.push_scope(node)
+    if node.init_stmt is not None:
+      node.init_stmt.accept(self)
+    node.expr.accept(self)
+    node.section.accept(self)
+    if node.term_stmt is not None:
+      node.term_stmt.accept(self)
+    self.pop_scope()
+
+  # def While(self): // covered by LoopStatement
+
+  # def For(self): // covered by LoopStatement
+
+  # def JumpStatement(self): // all child node implemented by itself
+
+  def Return(self, node):
+    node.expr.accept(self)
+
+  def Break(self, node):
+    pass
+
+  def Continue(self, node):
+    pass
+
+  def ArgumentList(self, node):
+    for child in node.childs:
+      child.accept(self)
+
+  def BinaryOp(self, node):
+    node.left.accept(self)
+    node.right.accept(self)
+
+  # def AssignOp(self): // covered by BinaryOp
+
+  def UnaryOp(self, node):
+    node.expr.accept(self)
+
+  def FnExpression(self, node):
+    node.expr.accept(self)
+    if isinstance(node.arguments, ast.Node):
+      node.arguments.accept(self)
+
+  def VaExpression(self, node):
+    self.resolve(node)
+
+  def ArrayExpression(self, node):
+    node.expr.accept(self)
+    node.index.accept(self)
@@ -1,12 +1,31 @@
+# fragments go to a list, flushed to stream after each top level node when one is given
 class WriteVisitor:
-  def __init__(self, dead_code_elimination=False):
+  def __init__(self, dead_code_elimination=False, stream=None):
     self.s = ''
     self._indent = 0
     self.dead_code_elimination = dead_code_elimination
+    self.stream = stream
+    self.parts = []
 
   def __str__(self):
     return self.s
 
+  def write(self, s):
+    if s:
+      self.parts.append(s)
+
+  # a node wrote nothing when the number of parts did not move, reset drops what was written since
+  def mark(self):
+    return len(self.parts)
+
+  def reset(self, mark):
+    del self.parts[mark:]
+
+  def flush(self):
+    if self.stream is not None:
+      self.stream.writelines(self.parts)
+      self.parts = []
+
   def indent(self):
     self._indent += 1
 
@@ -26,70 +45,88 @@ class WriteVisitor:
     raise ValueError
 
   def EmptyNode(self, node):
-    if not self.should_write(node):
-      return ''
-    return ''
+    pass
 
   def TypeNode(self, node):
     if not self.should_write(node):
-      return ''
-    return node.types[-1]
+      return
+    self.write(node.types[-1])
 
   def Const(self, node):
     if not self.should_write(node):
-      return ''
+      return
     if isinstance(node.value, str):
-      return '"{}"'.format(node.value)
-    return str(node.value)
+      self.write('"{}"'.format(node.value))
+    else:
+      self.write(str(node.value))
 
   def BaseSection(self, node):
     if not self.should_write(node):
-      return ''
-    s = ''
+      return
     self.indent()
     for child in node.childs:
-      child_str = child.accept(self)
-      if not child_str:
+      mark = self.mark()
+      self.write(self.get_indent_str())
+      child_mark = self.mark()
+      child.accept(self)
+      if self.mark() == child_mark:
+        self.reset(mark)
         continue
-      s += '{}{}{}\n'.format(self.get_indent_str(), child.accept(self), ';' if child.need_semi() else '')
+      self.write(';\n' if child.need_semi() else '\n')
     self.unindent()
-    return s
 
   def RootSection(self, node):
     if not self.should_write(node):
-      return ''
-    s = ''
+      return self.s
     for child in node.childs:
-      s += '{}{}\n'.format(self.get_indent_str(), child.accept(self))
-    return s
+      self.write(self.get_indent_str())
+      child.accept(self)
+      self.write('\n')
+      self.flush()
+    if self.stream is None:
+      self.s = ''.join(self.parts)
+      self.parts = []
+    return self.s
 
   def Declaration(self, node):
     raise ValueError
 
   def FnDeclaration(self, node):
     if not self.should_write(node):
-      return ''
-    parameter_str = 'void' if node.parameterGroup.is_empty() else node.parameterGroup.accept(self)
-    s = '{}{} {}({})\n'.format(self.get_indent_str(), node.type.accept(self), node.name, parameter_str)
-    s += '{}{{\n'.format(self.get_indent_str())
-    s += node.body.accept(self)
-    s += '{}}}'.format(self.get_indent_str())
-    return s
+      return
+    self.write(self.get_indent_str())
+    node.type.accept(self)
+    self.write(' {}('.format(node.name))
+    if node.parameterGroup.is_empty():
+      self.write('void')
+    else:
+      node.parameterGroup.accept(self)
+    self.write(')\n{}{{\n'.format(self.get_indent_str()))
+    node.body.accept(self)
+    self.write('{}}}'.format(self.get_indent_str()))
 
   def VaDeclarationList(self, node):
     if not self.should_write(node):
-      return ''
-    variable_list = filter(lambda s: s, map(lambda n: n.accept(self), node.childs))
-    variable_list_str = ', '.join(variable_list)
-    if not variable_list_str:
-      return ''
-    s = '{} {}'.format(node.childs[0].type.accept(self), variable_list_str)
-    return s
+      return
+    mark = self.mark()
+    node.childs[0].type.accept(self)
+    self.write(' ')
+    list_mark = self.mark()
+    for child in node.childs:
+      child_mark = self.mark()
+      if child_mark != list_mark:
+        self.write(', ')
+      separator_mark = self.mark()
+      child.accept(self)
+      if self.mark() == separator_mark:
+        self.reset(child_mark)
+    if self.mark() == list_mark:
+      self.reset(mark)
 
   def Declarator(self, node):
     if not self.should_write(node):
-      return ''
-    return '{}{}'.format(''.join(node.type.types[:-1]), node.name)
+      return
+    self.write('{}{}'.format(''.join(node.type.types[:-1]), node.name))
 
   def FnDeclarator(self, node):
     raise ValueError
@@ -98,109 +135,131 @@ class WriteVisitor:
 
   def ArrayDeclarator(self, node):
     if not self.should_write(node):
-      return ''
-    return '{}[{}]'.format(node.name, node.size)
+      return
+    self.write('{}[{}]'.format(node.name, node.size))
 
   def ParameterGroup(self, node):
     if not self.should_write(node):
-      return ''
-    paramemter_list = map(lambda n: '{} {}'.format(n.type.accept(self), n.accept(self)), node.childs)
-    return ', '.join(paramemter_list)
+      return
+    for i, child in enumerate(node.childs):
+      if i:
+        self.write(', ')
+      child.type.accept(self)
+      self.write(' ')
+      child.accept(self)
 
   def ConditionalStatement(self, node):
     if not self.should_write(node):
-      return ''
-    s = 'if ({})\n'.format(node.expr.accept(self))
-    s += '{}{{\n'.format(self.get_indent_str())
-    s += node.then_section.accept(self)
-    s += '{}}}'.format(self.get_indent_str())
+      return
+    self.write('if (')
+    node.expr.accept(self)
+    self.write(')\n{}{{\n'.format(self.get_indent_str()))
+    node.then_section.accept(self)
+    self.write('{}}}'.format(self.get_indent_str()))
 
     if not node.else_section.is_empty():
-      s += '\n{}else\n'.format(self.get_indent_str(), node.expr.accept(self))
-      s += '{}{{\n'.format(self.get_indent_str())
-      s += node.else_section.accept(self)
-      s += '{}}}'.format(self.get_indent_str())
-
-    return s
+      self.write('\n{0}else\n{0}{{\n'.format(self.get_indent_str()))
+      node.else_section.accept(self)
+      self.write('{}}}'.format(self.get_indent_str()))
 
   def LoopStatement(self, node):
     raise ValueError
 
   def While(self, node):
     if not self.should_write(node):
-      return ''
-    s = 'while({})\n'.format(node.expr.accept(self))
-    s += '{}{{\n'.format(self.get_indent_str())
-    s += node.section.accept(self)
-    s += '{}}}'.format(self.get_indent_str())
-    return s
+      return
+    self.write('while(')
+    node.expr.accept(self)
+    self.write(')\n{}{{\n'.format(self.get_indent_str()))
+    node.section.accept(self)
+    self.write('{}}}'.format(self.get_indent_str()))
 
   def For(self, node):
     if not self.should_write(node):
-      return ''
-    s = 'for({}; {}; {})\n'.format(node.init_stmt.accept(self), node.expr.accept(self), node.term_stmt.accept(self))
-    s += '{}{{\n'.format(self.get_indent_str())
-    s += node.section.accept(self)
-    s += '{}}}'.format(self.get_indent_str())
-    return s
+      return
+    self.write('for(')
+    node.init_stmt.accept(self)
+    self.write('; ')
+    node.expr.accept(self)
+    self.write('; ')
+    node.term_stmt.accept(self)
+    self.write(')\n{}{{\n'.format(self.get_indent_str()))
+    node.section.accept(self)
+    self.write('{}}}'.format(self.get_indent_str()))
 
   def JumpStatement(self, node):
     raise ValueError
 
   def Return(self, node):
     if not self.should_write(node):
-      return ''
+      return
     if node.expr.is_empty():
-      return 'return'
-    return 'return {}'.format(node.expr.accept(self))
+      self.write('return')
+      return
+    self.write('return ')
+    node.expr.accept(self)
 
   def Break(self, node):
     if not self.should_write(node):
-      return ''
-    return 'break'
+      return
+    self.write('break')
 
   def Continue(self, node):
     if not self.should_write(node):
-      return ''
-    return 'continue'
+      return
+    self.write('continue')
 
   def ArgumentList(self, node):
     if not self.should_write(node):
-      return ''
-    argument_list = map(lambda n: n.accept(self), node.childs)
-    return ', '.join(argument_list)
+      return
+    for i, child in enumerate(node.childs):
+      if i:
+        self.write(', ')
+      child.accept(self)
 
   def BinaryOp(self, node):
     if not self.should_write(node):
-      return ''
-    if node.op == '++':
-      return '{}++'.format(node.left.accept(self))
-    elif node.op == '--':
-      return '{}--'.format(node.left.accept(self))
+      return
+    if node.op == '++' or node.op == '--':
+      node.left.accept(self)
+      self.write(node.op)
+      return
+    if node.use_paren:
+      self.write('(')
+    node.left.accept(self)
+    self.write(' {} '.format(node.op))
+    node.right.accept(self)
     if node.use_paren:
-      return '({} {} {})'.format(node.left.accept(self), node.op, node.right.accept(self))
-    return '{} {} {}'.format(node.left.accept(self), node.op, node.right.accept(self))
+      self.write(')')
 
   # def AssignOp(self, node):
 
   def UnaryOp(self, node):
     if not self.should_write(node):
-      return ''
-    return '{}{}'.format(node.op, node.expr.accept(self))
+      return
+    self.write(node.op)
+    node.expr.accept(self)
 
   def FnExpression(self, node):
     if not self.should_write(node):
-      return ''
-    return '{}({})'.format(node.expr.accept(self), node.arguments.accept(self))
+      return
+    node.expr.accept(self)
+    self.write('(')
+    node.arguments.accept(self)
+    self.write(')')
 
   def VaExpression(self, node):
     if not self.should_write(node):
-      return ''
+      return
     if node.pointer is not None:
-      return '*{}'.format(node.name)
-    return node.name
+      self.write('*{}'.format(node.name))
+    else:
+      self.write(node.name)
 
   def ArrayExpression(self, node):
     if not self.should_write(node):
-      return ''
-    return '{}[{}]'.format(node.expr.accept(self), node.index.accept(self))
+      return
+    node.expr.accept(self)
+    self.write('[')
+    node.index.accept(self)
+    self.write(']')